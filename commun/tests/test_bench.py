@@ -0,0 +1,45 @@
+import json
+
+import numpy as np
+import pytest
+
+from voronoi_core import engines
+from voronoi_core.bench import BASELINE, DATASETS, compare, generate, run_case
+
+
+@pytest.mark.parametrize("dataset", DATASETS)
+def test_jeux_reproductibles(dataset):
+    points = generate(dataset, 500, seed=3)
+    assert points.shape == (500, 2) and points.dtype == np.float64
+    assert np.array_equal(points, generate(dataset, 500, seed=3))
+    assert len(np.unique(points, axis=0)) == 500
+
+
+def test_comparaison_a_la_reference():
+    def doc(*records):
+        return {"results": [dict(engine="fortune", dataset="uniform", seed=0, status="ok", **r) for r in records]}
+
+    baseline = doc(dict(n=100, seconds=0.002, peak_rss_mib=50.0),
+                   dict(n=1000, seconds=1.0, peak_rss_mib=50.0),
+                   dict(n=10000, seconds=2.0, peak_rss_mib=50.0))
+    current = doc(dict(n=100, seconds=0.005, peak_rss_mib=50.0),      # trop court pour être significatif
+                  dict(n=1000, seconds=1.2, peak_rss_mib=80.0),
+                  dict(n=10000, seconds=2.1, peak_rss_mib=50.0))
+    current["results"][2]["status"] = "timeout"
+    found = {(key[2], metric) for key, metric, _, _ in compare(current, baseline, threshold=0.25)}
+    assert found == {(1000, "peak_rss_mib"), (10000, "status")}
+
+
+def test_cas_dans_un_sous_processus():
+    record = run_case("grid", "clustered", 100, allocations=False, timeout=120)
+    assert record["status"] == "ok" and record["engine"] == "grid"
+    assert record["seconds"] > 0 and record["peak_rss_mib"] >= record["base_rss_mib"] > 0
+    assert "alloc_peak_mib" not in record
+
+
+def test_reference_enregistree():
+    with open(BASELINE, encoding="utf-8") as f:
+        baseline = json.load(f)
+    cases = {(r["engine"], r["dataset"], r["n"]) for r in baseline["results"] if r["status"] == "ok"}
+    assert cases == {(e, d, n) for e in engines.engines() for d in DATASETS for n in (100, 1000)}
+    assert compare(baseline, baseline) == []
@@ -0,0 +1,62 @@
+import os
+
+import numpy as np
+
+from voronoi_core import diagram_cache
+from voronoi_core.diagram_cache import DiagramCache, cache_key
+
+
+def test_cle_depend_des_points_et_des_parametres():
+    points = np.random.default_rng(0).random((100, 2))
+    key = cache_key(points, "delaunay")
+    assert key == cache_key(points.tolist(), "delaunay")
+    moved = points.copy()
+    moved[50, 1] += 1e-12
+    assert cache_key(moved, "delaunay") != key
+    assert cache_key(points, "fortune") != key
+    assert cache_key(points, "delaunay", box=(0, 1)) != cache_key(points, "delaunay", box=(0, 2))
+
+
+
+def test_cle_depend_de_la_version(monkeypatch):
+    points = np.random.default_rng(0).random((10, 2))
+    key = cache_key(points, "fortune")
+    monkeypatch.setattr(diagram_cache, "CACHE_VERSION", diagram_cache.CACHE_VERSION - 1)
+    assert cache_key(points, "fortune") != key
+
+
+def test_aller_retour_et_calcul_unique(tmp_path):
+    cache = DiagramCache(tmp_path)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"centers": np.arange(6.0).reshape(3, 2), "pairs": np.array([[0, 1], [1, 2]], dtype=np.int32)}
+
+    first = cache.get_or_compute("k", compute)
+    second = cache.get_or_compute("k", compute)
+    assert len(calls) == 1
+    for name in ("centers", "pairs"):
+        assert np.array_equal(first[name], second[name]) and first[name].dtype == second[name].dtype
+    assert cache.get("absente") is None
+
+
+def test_entree_illisible_recalculee(tmp_path):
+    cache = DiagramCache(tmp_path)
+    (tmp_path / "k.npz").write_bytes(b"pas un npz")
+    assert cache.get("k") is None
+    assert cache.get_or_compute("k", lambda: {"a": np.ones(2)})["a"].tolist() == [1, 1]
+
+
+def test_eviction_lru(tmp_path):
+    entry = {"a": np.zeros(1000)}
+    cache = DiagramCache(tmp_path, max_bytes=10**9)
+    for time, key in enumerate(["vieille", "lue", "recente"]):
+        cache.put(key, entry)
+        os.utime(tmp_path / f"{key}.npz", (time, time))
+    cache.get("lue")                       # devient la plus récente
+    entry_bytes = os.path.getsize(tmp_path / "vieille.npz")
+
+    cache.max_bytes = 3 * entry_bytes
+    cache.put("nouvelle", entry)
+    assert sorted(os.listdir(tmp_path)) == ["lue.npz", "nouvelle.npz", "recente.npz"]
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+
+from voronoi_core import engines
+from voronoi_core.engines import choose, compute_voronoi
+
+POINTS = np.random.default_rng(1).uniform(0, 100, (200, 2))
+
+
+def _sorted_edges(edges):
+    edges = np.round(edges, 6)
+    flip = (edges[:, 0] > edges[:, 2]) | ((edges[:, 0] == edges[:, 2]) & (edges[:, 1] > edges[:, 3]))
+    edges[flip] = edges[flip][:, [2, 3, 0, 1]]
+    return edges[np.lexsort(edges.T[::-1])]
+
+
+def test_moteurs_vectoriels_identiques():
+    fortune = compute_voronoi(POINTS, engine="fortune")
+    dual = compute_voronoi(POINTS, engine="bowyer_watson")
+    assert fortune.engine == "fortune" and fortune.labels is None
+    assert np.allclose(_sorted_edges(fortune.edges), _sorted_edges(dual.edges))
+    xmin, ymin, xmax, ymax = fortune.bbox
+    assert (fortune.edges[:, [0, 2]] >= xmin - 1e-9).all() and (fortune.edges[:, [1, 3]] <= ymax + 1e-9).all()
+
+
+def test_cellules_et_raster_du_site_le_plus_proche():
+    cells = compute_voronoi(POINTS, kind="cells", bbox=(0, 0, 100, 100))
+    assert cells.engine == "clipping" and len(cells.cell_offsets) == len(POINTS) + 1
+    for i in (0, 57, 199):
+        polygon = cells.cell_vertices[cells.cell_offsets[i]:cells.cell_offsets[i + 1]]
+        distances = np.hypot(*(polygon[:, None, :] - POINTS[None]).transpose(2, 0, 1))
+        assert np.allclose(distances[:, i], distances.min(axis=1))     # sommets équidistants de leurs sites
+
+    raster = compute_voronoi(POINTS, kind="raster", bbox=(0, 0, 100, 100), resolution=40)
+    assert raster.engine == "grid" and raster.labels.shape == (40, 40)
+    px, py = np.meshgrid(raster.xi, raster.yi)
+    nearest = np.argmin((px[..., None] - POINTS[:, 0]) ** 2 + (py[..., None] - POINTS[:, 1]) ** 2, axis=-1)
+    assert (raster.labels == nearest).mean() > 0.999
+
+
+def _total_length(edges):
+    return np.hypot(edges[:, 2] - edges[:, 0], edges[:, 3] - edges[:, 1]).sum()
+
+
+@pytest.mark.parametrize("points", [
+    [(t, 0.5 * t + 3.0) for t in np.linspace(0, 100, 60)],            # alignés, non triés
+    [(10.0, 10.0), (60.0, 40.0)],
+    [(5.0, 5.0), (5.0, 5.0), (5.0, 9.0)],                             # deux points distincts
+])
+def test_moteurs_vectoriels_points_alignes(points):
+    points = np.array(points)[::-1]
+    bbox = (-20.0, -20.0, 120.0, 120.0)
+    fortune = compute_voronoi(points, engine="fortune", bbox=bbox)
+    dual = compute_voronoi(points, engine="bowyer_watson", bbox=bbox)
+    assert len(dual.edges) > 0
+    assert np.isclose(_total_length(dual.edges), _total_length(fortune.edges))
+    # Milieu de chaque arête : à égale distance de ses deux sites les plus proches
+    middles = (dual.edges[:, :2] + dual.edges[:, 2:]) / 2
+    distances = np.sort(np.hypot(*(middles[:, None, :] - np.unique(points, axis=0)[None]).transpose(2, 0, 1)), axis=1)
+    assert np.allclose(distances[:, 0], distances[:, 1])
+
+
+def test_choix_automatique(monkeypatch):
+    assert choose(10, "raster") == "grid" and choose(10, "cells") == "clipping"
+    assert choose(100_000) in ("fortune", "bowyer_watson")
+    monkeypatch.setattr(engines, "_engines", dict(engines._engines))
+    monkeypatch.setattr(engines, "_loaded", {})
+
+    def missing():
+        raise ImportError("dépendance absente")
+
+    engines.register("rapide", ["vector"], missing, lambda n: 0.0)
+    assert not engines.available("rapide") and choose(10) != "rapide"
+    with pytest.raises(ValueError):
+        compute_voronoi(POINTS, kind="raster", engine="fortune")
+    with pytest.raises(ValueError):
+        choose(10, "surface")
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from voronoi_core.kdtree import KDTree
+
+
+def _brute_d2(points, queries):
+    return ((queries[:, None, :] - points[None, :, :]) ** 2).sum(axis=2)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_query_k1_identique_force_brute(seed):
+    rng = np.random.default_rng(seed)
+    points = rng.random((500, 2)) * 100
+    queries = rng.random((300, 2)) * 120 - 10
+    dist, idx = KDTree(points, leaf_size=8).query(queries)
+    d2 = _brute_d2(points, queries)
+    assert (idx == d2.argmin(axis=1)).all()
+    assert np.allclose(dist, np.sqrt(d2.min(axis=1)))
+
+
+def test_query_egalites_plus_petit_indice():
+    # Grille entière avec doublons : beaucoup de requêtes équidistantes
+    points = np.array([(x, y) for x in range(10) for y in range(10)] * 2, dtype=float)
+    queries = np.array([(x + 0.5, y + 0.5) for x in range(9) for y in range(9)])
+    _, idx = KDTree(points, leaf_size=3).query(queries)
+    assert (idx == _brute_d2(points, queries).argmin(axis=1)).all()
+
+
+def test_query_k_voisins_tries():
+    rng = np.random.default_rng(1)
+    points = rng.random((200, 2))
+    queries = rng.random((50, 2))
+    dist, idx = KDTree(points).query(queries, k=5)
+    d2 = _brute_d2(points, queries)
+    expected = np.argsort(d2, axis=1, kind="stable")[:, :5]
+    assert idx.shape == (50, 5)
+    assert (idx == expected).all()
+    assert (np.diff(dist, axis=1) >= 0).all()
+
+
+def test_query_point_unique():
+    tree = KDTree([(0, 0), (3, 4), (10, 10)])
+    dist, idx = tree.query((3, 3))
+    assert idx == 1
+    assert dist == pytest.approx(1.0)
+
+
+def test_query_k_invalide():
+    tree = KDTree([(0, 0), (1, 1)])
+    with pytest.raises(ValueError):
+        tree.query((0, 0), k=3)
+    with pytest.raises(ValueError):
+        tree.query((0, 0), k=0)
+
+
+def test_query_radius():
+    rng = np.random.default_rng(2)
+    points = rng.random((400, 2))
+    queries = rng.random((40, 2))
+    result = KDTree(points, leaf_size=5).query_radius(queries, 0.1)
+    d2 = _brute_d2(points, queries)
+    for i, found in enumerate(result):
+        assert found.tolist() == np.nonzero(d2[i] <= 0.01)[0].tolist()
+
+
+@pytest.mark.parametrize("tile", [1, 7, 32])
+def test_nearest_grid_identique_calcul_dense(tile):
+    rng = np.random.default_rng(tile)
+    points = np.round(rng.random((150, 2)) * 20) * 5   # beaucoup d'égalités
+    xi, yi = np.linspace(-10, 110, 90), np.linspace(-5, 105, 70)
+    ids, d2 = KDTree(points).nearest_grid(xi, yi, tile=tile, return_distance=True)
+    gx, gy = np.meshgrid(xi, yi)
+    dense = (gx[:, :, None] - points[:, 0]) ** 2 + (gy[:, :, None] - points[:, 1]) ** 2
+    assert (ids == dense.argmin(axis=2)).all()
+    assert (d2 == dense.min(axis=2)).all()
+
+
+def test_nearest_grid_tuiles_denses():
+    # Plus de candidats que GRID_DENSE_FACTOR * tile : requêtes par pixel
+    rng = np.random.default_rng(3)
+    points = rng.random((3000, 2))
+    xi = np.linspace(0, 1, 40)
+    ids = KDTree(points).nearest_grid(xi, xi, tile=2)
+    gx, gy = np.meshgrid(xi, xi)
+    dense = (gx[:, :, None] - points[:, 0]) ** 2 + (gy[:, :, None] - points[:, 1]) ** 2
+    assert (ids == dense.argmin(axis=2)).all()
+
+
+def test_arbre_vide():
+    tree = KDTree(np.zeros((0, 2)))
+    assert len(tree) == 0
+    assert (tree.nearest_grid(np.arange(3), np.arange(2)) == 0).all()
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from voronoi_core.points_bin import (HEADER_BYTES, convert_text_to_binary, is_points_binary, main,
+                                     open_points_binary, write_points_binary)
+from voronoi_core.points_io import iter_point_blocks, load_points
+
+
+def test_aller_retour_avec_ids_et_poids(tmp_path):
+    path = tmp_path / "points.vpts"
+    points = np.random.default_rng(0).random((101, 2))
+    ids = np.arange(101) * 7
+    weights = np.linspace(0, 1, 101)
+    write_points_binary(path, points, ids=ids, weights=weights)
+
+    opened = open_points_binary(path)
+    assert isinstance(opened.points, np.memmap) and opened.points.dtype == np.float64
+    assert np.array_equal(opened.points, points)
+    assert np.array_equal(opened.ids, ids)
+    assert np.array_equal(opened.weights, weights)
+    assert opened.ids.offset % 8 == 0 and opened.weights.offset % 8 == 0
+
+
+def test_float32_sans_ids(tmp_path):
+    path = tmp_path / "points.vpts"
+    points = [(1.5, -2.0), (3.25, 4.0)]
+    write_points_binary(path, points, dtype=np.float32)
+    opened = open_points_binary(path)
+    assert opened.points.dtype == np.float32 and opened.ids is None and opened.weights is None
+    assert opened.points.tolist() == [[1.5, -2.0], [3.25, 4.0]]
+    assert path.stat().st_size == HEADER_BYTES + 2 * 2 * 4
+    blocks = list(iter_point_blocks(path, block_size=1))
+    assert all(block.dtype == np.float64 for block in blocks)
+    assert np.concatenate(blocks).tolist() == [[1.5, -2.0], [3.25, 4.0]]
+
+
+def test_conversion_depuis_le_texte(tmp_path, capsys):
+    text_path = tmp_path / "points.txt"
+    text_path.write_text("# points\n1,2\n3 4\n\n5;6\n")
+    binary_path = tmp_path / "points.vpts"
+    assert convert_text_to_binary(text_path, binary_path, block_size=2) == 3
+    assert is_points_binary(binary_path) and not is_points_binary(text_path)
+    assert np.array_equal(open_points_binary(binary_path).points, load_points(text_path))
+
+    main([str(text_path), str(tmp_path / "points32.vpts"), "--float32"])
+    assert "3 points" in capsys.readouterr().out
+    assert open_points_binary(tmp_path / "points32.vpts").points.dtype == np.float32
+
+
+def test_lecteurs_texte_reconnaissent_le_binaire(tmp_path):
+    path = tmp_path / "points.vpts"
+    points = np.arange(50, dtype=np.float64).reshape(25, 2)
+    write_points_binary(path, points)
+    loaded = load_points(path)
+    assert isinstance(loaded, np.memmap) and np.array_equal(loaded, points)
+    blocks = list(iter_point_blocks(path, block_size=10))
+    assert [len(b) for b in blocks] == [10, 10, 5]
+    assert np.array_equal(np.concatenate(blocks), points)
+
+
+def test_fichier_vide_et_fichier_invalide(tmp_path):
+    path = tmp_path / "vide.vpts"
+    write_points_binary(path, np.zeros((0, 2)))
+    assert open_points_binary(path).points.shape == (0, 2)
+    other = tmp_path / "autre.bin"
+    other.write_bytes(b"\0" * 100)
+    with pytest.raises(ValueError):
+        open_points_binary(other)
@@ -0,0 +1,104 @@
+import time
+
+import numpy as np
+import pytest
+
+from voronoi_core.points_io import iter_point_blocks, load_points, parse_points
+
+
+def _write(tmp_path, text):
+    path = tmp_path / "points.txt"
+    path.write_bytes(text.encode("utf-8"))
+    return path
+
+
+def _reference(text, strict):
+    """Lecture ligne par ligne avec float(), la règle que le lecteur doit suivre."""
+    points = []
+    for line in text.split("\n"):
+        fields = line.split("#", 1)[0].replace(",", " ").replace(";", " ").split()
+        if not fields:
+            continue
+        if strict and len(fields) != 2:
+            raise ValueError(line)
+        try:
+            points.append((float(fields[0]), float(fields[1])))
+        except (ValueError, IndexError):
+            if strict:
+                raise ValueError(line)
+    return np.array(points, dtype=np.float64).reshape(-1, 2)
+
+
+def test_formats_acceptes():
+    text = "# en-tête\n1,2\n3 4\n5;6\n\n  7 , 8  # commentaire\r\n-.5;+9.\n"
+    points = parse_points(text)
+    assert points.tolist() == [[1, 2], [3, 4], [5, 6], [7, 8], [-0.5, 9]]
+    assert points.dtype == np.float64 and points.flags["C_CONTIGUOUS"]
+
+
+@pytest.mark.parametrize("token", ["0.1", "0.30000000000000004", "123456789012345",
+                                   "1234567890123456", "-0", "1e5", "-1.5E-3", "nan", "-inf",
+                                   "007", "99999.9999999999", ".5", "5."])
+def test_meme_valeur_que_float(token):
+    value = parse_points(f"{token},{token}\n")[0, 0]
+    expected = float(token)
+    assert value == expected or (np.isnan(value) and np.isnan(expected))
+    assert np.signbit(value) == np.signbit(expected)
+
+
+def test_strict_refuse_ligne_invalide_avec_numero():
+    with pytest.raises(ValueError, match="Ligne 3"):
+        parse_points("1,2\n3,4\n5,x\n")
+    with pytest.raises(ValueError):
+        parse_points("1,2,3\n")
+
+
+def test_non_strict_saute_lignes_invalides():
+    points = parse_points("10\n20, 30\nabc, def\n1,2,3\n50; 60", strict=False)
+    assert points.tolist() == [[20, 30], [1, 2], [50, 60]]
+
+
+def test_fichier_par_paquets_identique(tmp_path):
+    rng = np.random.default_rng(0)
+    lines = []
+    for x, y in (rng.random((500, 2)) * 2000 - 1000).tolist():
+        sep = [",", " ", ";", " , "][rng.integers(4)]
+        lines.append(f"{x:.{rng.integers(0, 18)}g}{sep}{y!r}")
+        if rng.random() < 0.1:
+            lines.append("# commentaire" if rng.random() < 0.5 else "")
+    text = "\n".join(lines)
+    path = _write(tmp_path, text)
+    expected = _reference(text, strict=True)
+    for chunk_bytes in (1, 13, 4096, 2**20):
+        assert np.array_equal(load_points(path, chunk_bytes=chunk_bytes), expected)
+
+
+def test_blocs_de_taille_fixe(tmp_path):
+    path = _write(tmp_path, "".join(f"{i},{-i}\n" for i in range(25)))
+    blocks = list(iter_point_blocks(path, block_size=10, chunk_bytes=16))
+    assert [len(b) for b in blocks] == [10, 10, 5]
+    assert np.array_equal(np.concatenate(blocks), load_points(path))
+
+
+def test_fichier_vide(tmp_path):
+    path = _write(tmp_path, "# rien\n\n")
+    assert load_points(path).shape == (0, 2)
+    assert list(iter_point_blocks(path)) == []
+
+
+def test_debit_proche_de_numpy(tmp_path):
+    """Garde-fou grossier (machines bruitées) : pas beaucoup plus lent que np.loadtxt seul."""
+    points = np.random.default_rng(0).random((200_000, 2)) * 1000
+    path = tmp_path / "points.txt"
+    np.savetxt(path, points, fmt="%.6f", delimiter=",")
+
+    def best(read):
+        times = []
+        for _ in range(5):
+            start = time.perf_counter()
+            read()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    reference = best(lambda: np.loadtxt(path, delimiter=","))
+    assert best(lambda: load_points(path)) < 3 * reference
@@ -0,0 +1,65 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from voronoi_core import predicates
+from voronoi_core.predicates import closer, incircle, orient2d
+
+
+def _sign(value):
+    return int(value > 0) - int(value < 0)
+
+
+def test_cas_degeneres_exacts():
+    assert orient2d(0, 0, 1, 1, 2, 2) == 0
+    assert orient2d(0.1, 0.1, 0.2, 0.2, 0.3, 0.3) == orient2d(*(Fraction(v) for v in (0.1, 0.1, 0.2, 0.2, 0.3, 0.3)))
+    assert incircle(0, 0, 1, 0, 1, 1, 0, 1) == 0                       # carré : cocirculaires
+    assert incircle(0, 0, 1, 0, 1, 1, 0.5, 0.5) > 0
+    assert incircle(0, 0, 1, 0, 1, 1, 2, 2) < 0
+    assert closer(0.5, 7, 0, 0, 1, 0) == 0
+    assert closer(0.4, 7, 0, 0, 1, 0) > 0
+
+
+def test_presque_alignes_signe_exact():
+    # c varie d'un ulp autour de la droite a-b : le filtre ne décide pas, le calcul exact si
+    rng = np.random.default_rng(0)
+    before = predicates.exact_calls
+    for t in rng.uniform(0, 1, 200):
+        ax, ay, bx, by = 12.0, 12.0, 24.0, 24.0
+        cx = 0.5 + t
+        for cy in (np.nextafter(cx, -1), cx, np.nextafter(cx, 2)):
+            expected = (Fraction(ax) - Fraction(cx)) * (Fraction(by) - Fraction(cy)) - \
+                       (Fraction(ay) - Fraction(cy)) * (Fraction(bx) - Fraction(cx))
+            assert _sign(orient2d(ax, ay, bx, by, cx, float(cy))) == _sign(expected)
+    assert predicates.exact_calls > before
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_incircle_sur_une_grille(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(200):
+        a, b, c, d = rng.integers(0, 4, (4, 2)) * 0.1              # 0.1 : non représentable exactement
+        exact = predicates._incircle_exact(*(Fraction(v) for v in (*a, *b, *c, *d)))
+        assert _sign(incircle(*a, *b, *c, *d)) == _sign(exact)
+        assert _sign(closer(*d, *a, *b)) == _sign(predicates._closer_exact(*(Fraction(v) for v in (*d, *a, *b))))
+
+
+def test_depassements_signe_conserve():
+    assert orient2d(0, 0, 1e200, 0, 0, 1e200) == np.inf              # résultat exact hors des flottants
+    assert orient2d(0, 0, 0, 1e200, 1e200, 0) == -np.inf
+    assert orient2d(0, 0, 1e-200, 0, 0, 1e-200) == 5e-324            # sous le plus petit flottant
+    assert orient2d(0, 0, 0, 1e-200, 1e-200, 0) == -5e-324
+    args = (5.15908805880605e-161, -9.190312436384449e-161, -2.81446068743747e+158, 0.9355999898403429,
+            0.1667640789100624, 93737116.34780513, -0.7205084300666422, 2.3673799335066325e-301)
+    assert _sign(incircle(*args)) == _sign(predicates._incircle_exact(*map(Fraction, args)))
+
+
+def test_ordres_de_grandeur_melanges():
+    rng = np.random.default_rng(1)
+    for _ in range(300):
+        v = (rng.choice([-1.0, 1.0], 8) * 10.0 ** rng.uniform(-300, 160, 8)).tolist()
+        exact = [Fraction(x) for x in v]
+        assert _sign(orient2d(*v[:6])) == _sign(predicates._orient_exact(*exact[:6]))
+        assert _sign(incircle(*v)) == _sign(predicates._incircle_exact(*exact))
+        assert _sign(closer(*v[:6])) == _sign(predicates._closer_exact(*exact[:6]))
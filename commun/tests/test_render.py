@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from voronoi_core.render import polygon_edges, segment_collection
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+
+def test_cotes_des_polygones_fermes():
+    carre = [(0, 0), (1, 0), (1, 1), (0, 1)]
+    edges = polygon_edges([carre, [], [(5, 5), (6, 5), (5, 6)]])
+    assert edges.shape == (7, 4)
+    assert edges[3].tolist() == [0, 1, 0, 0]          # fermeture du carré
+    assert edges[6].tolist() == [5, 6, 5, 5]
+    assert polygon_edges([]).shape == (0, 4)
+
+
+def test_une_seule_collection_et_decimation():
+    fig, ax = plt.subplots(figsize=(4, 4), dpi=100)
+    ax.set_xlim(0, 1000); ax.set_ylim(0, 1000)
+    segments = np.array([[0, 0, 500, 500], [10, 10, 10.5, 10], [100, 100, 100, 101]])
+    collection = segment_collection(segments, ax, min_pixels=1.0, colors="black")
+    assert list(ax.collections) == [collection] and len(ax.lines) == 0
+    assert len(collection.get_segments()) == 1        # 0,5 et 1 unité : moins d'un pixel, écartées
+    assert len(segment_collection(segments).get_segments()) == 3
+    plt.close(fig)
@@ -0,0 +1,56 @@
+import json
+
+import numpy as np
+
+from voronoi_core.engines import compute_voronoi
+from voronoi_core.points_bin import write_points_binary
+from voronoi_core.tiles import MANIFEST, iter_tile_cells, tiled_voronoi
+
+BBOX = (0.0, 0.0, 100.0, 100.0)
+
+
+def _points():
+    rng = np.random.default_rng(2)
+    # Un amas dense et quelques points isolés : leurs grandes cellules demandent un halo plus large
+    return np.vstack([rng.normal(30, 4, (1500, 2)), rng.uniform(0, 100, (40, 2))])
+
+
+def _area(polygon):
+    x, y = polygon[:, 0], polygon[:, 1]
+    return 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))) if len(polygon) else 0.0
+
+
+def _cells_by_site(directory):
+    cells = {}
+    for sites, vertices, offsets in iter_tile_cells(directory):
+        for k, site in enumerate(sites.tolist()):
+            cells[site] = vertices[offsets[k]:offsets[k + 1]]
+    return cells
+
+
+def test_tuiles_identiques_au_calcul_complet(tmp_path):
+    points = _points()
+    grid = tiled_voronoi(points, tmp_path, bbox=BBOX, tiles=(4, 4), block_size=500)
+    assert (grid.nx, grid.ny, grid.count) == (4, 4, len(points))
+    cells = _cells_by_site(tmp_path)
+    assert sorted(cells) == list(range(len(points)))
+
+    reference = compute_voronoi(points, kind="cells", engine="clipping", bbox=BBOX)
+    for site, polygon in cells.items():
+        expected = reference.cell_vertices[reference.cell_offsets[site]:reference.cell_offsets[site + 1]]
+        assert np.isclose(_area(polygon), _area(expected), rtol=1e-9, atol=1e-9)
+    with open(tmp_path / MANIFEST) as f:
+        rounds = {tile["rounds"] for tile in json.load(f)["tiles"] if tile["points"]}
+    assert max(rounds) > 1
+
+
+def test_fichier_binaire_et_processus(tmp_path):
+    points = _points()
+    write_points_binary(tmp_path / "points.vpts", points)
+    serial = tiled_voronoi(tmp_path / "points.vpts", tmp_path / "serie", tile_points=400)
+    parallel = tiled_voronoi(tmp_path / "points.vpts", tmp_path / "parallele", tile_points=400, max_workers=2)
+    assert serial == parallel and serial.nx * serial.ny >= 4
+    first, second = _cells_by_site(tmp_path / "serie"), _cells_by_site(tmp_path / "parallele")
+    assert first.keys() == second.keys()
+    assert all(np.array_equal(first[site], second[site]) for site in first)
+    assert not any(path.name.startswith("buckets-") for path in (tmp_path / "serie").iterdir())
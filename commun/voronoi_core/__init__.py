@@ -0,0 +1 @@
+# voronoi_core package
\ No newline at end of file
@@ -0,0 +1,249 @@
+"""
+Banc de mesure des moteurs de Voronoï (voronoi_core.engines).
+
+Chaque cas (moteur, jeu de points, taille) tourne dans un sous-processus
+neuf : le pic de mémoire (RSS) mesuré est celui du seul calcul et un moteur
+qui plante ou dépasse le délai n'arrête pas la série. Les jeux de points sont
+générés à partir d'une graine, donc identiques d'une exécution à l'autre :
+
+  uniform    tirage uniforme dans [0, 1000]² ;
+  clustered  amas gaussiens (un pour 1000 points) ;
+  grid       grille entière (points cocirculaires, cas dégénéré) ;
+  collinear  points sur une droite.
+
+Mesures par cas : durée (meilleure de repeat exécutions), pic RSS du
+processus et pic des allocations suivies par tracemalloc (numpy compris),
+mesuré lors d'une exécution supplémentaire puisque tracemalloc ralentit le
+calcul. Un cas dont le coût estimé (Engine.cost) dépasse budget secondes est
+noté "skipped" sans être lancé.
+
+Les résultats sont écrits en JSON ; avec un fichier de référence, les cas
+plus lents (ou plus gourmands en mémoire) de plus de threshold sont signalés
+et le code de sortie vaut 1 :
+
+  python -m voronoi_core.bench --output bench.json
+  python -m voronoi_core.bench --sizes 100,10000 --baseline bench.json
+
+La référence bench_baseline.json (dossier commun/, tailles 10² et 10³, tous
+les moteurs et jeux de points) est celle de --baseline sans valeur :
+
+  python -m voronoi_core.bench --sizes 100,1000 --repeat 3 --baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+DATASETS = ("uniform", "clustered", "grid", "collinear")
+SIZES = (10**2, 10**3, 10**4, 10**5, 10**6)
+EXTENT = 1000.0
+BUDGET = 120.0                      # secondes estimées au-delà desquelles un cas est sauté
+THRESHOLD = 0.25                    # +25 % : régression
+# Écarts absolus en dessous desquels une hausse n'est pas significative (bruit de mesure)
+_NOISE = {"seconds": 0.05, "peak_rss_mib": 2.0, "alloc_peak_mib": 1.0}
+_COMMUN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+BASELINE = os.path.normpath(os.path.join(_COMMUN, "bench_baseline.json"))   # référence 10², 10³ points
+
+
+def generate(dataset, n, seed=0):
+    """Jeu de points (n, 2) float64, toujours le même pour (dataset, n, seed)."""
+    rng = np.random.default_rng([seed, n, DATASETS.index(dataset)])
+    if dataset == "uniform":
+        return rng.uniform(0, EXTENT, (n, 2))
+    if dataset == "clustered":
+        centers = rng.uniform(0.1 * EXTENT, 0.9 * EXTENT, (max(1, n // 1000), 2))
+        points = centers[rng.integers(len(centers), size=n)] + rng.normal(0, EXTENT / 100, (n, 2))
+        return np.clip(points, 0, EXTENT)
+    if dataset == "grid":
+        side = int(np.ceil(np.sqrt(n)))
+        step = EXTENT / side
+        return np.column_stack([np.arange(n) % side, np.arange(n) // side]).astype(np.float64) * step
+    if dataset == "collinear":
+        t = np.sort(rng.uniform(0, EXTENT, n))
+        return np.column_stack([t, 0.5 * t + 100.0])
+    raise ValueError(f"jeu de points inconnu : {dataset!r}")
+
+
+def run_case(engine, dataset, n, seed=0, repeat=1, allocations=True, timeout=None):
+    """Mesure un cas dans un sous-processus ; retourne son enregistrement (dict)."""
+    command = [sys.executable, "-m", "voronoi_core.bench", "--worker", engine, dataset, str(n),
+               "--seed", str(seed), "--repeat", str(repeat)]
+    if not allocations:
+        command.append("--no-allocations")
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([os.path.abspath(_COMMUN)] + [p for p in [env.get("PYTHONPATH")] if p])
+    record = {"engine": engine, "dataset": dataset, "n": n, "seed": seed}
+    try:
+        done = subprocess.run(command, capture_output=True, text=True, timeout=timeout, env=env)
+    except subprocess.TimeoutExpired:
+        return {**record, "status": "timeout"}
+    if done.returncode != 0:
+        lines = done.stderr.strip().splitlines() or [f"code de sortie {done.returncode}"]
+        return {**record, "status": "error", "error": lines[-1]}
+    return {**record, **json.loads(done.stdout.strip().splitlines()[-1])}
+
+
+def run_suite(engines=None, datasets=DATASETS, sizes=SIZES, seed=0, repeat=1, allocations=True,
+              budget=BUDGET, timeout=None, log=None):
+    """Tous les cas moteurs × jeux × tailles ; retourne le document JSON (dict)."""
+    from voronoi_core import engines as registry
+
+    names = list(engines) if engines else registry.engines()
+    results = []
+    for name in names:
+        kind = registry._engines[name].kinds[0]
+        for dataset in datasets:
+            for n in sizes:
+                if not registry.available(name):
+                    record = {"engine": name, "dataset": dataset, "n": n, "seed": seed, "status": "unavailable"}
+                elif registry._engines[name].cost(n) > budget:
+                    record = {"engine": name, "dataset": dataset, "n": n, "seed": seed, "status": "skipped"}
+                else:
+                    record = run_case(name, dataset, n, seed, repeat, allocations, timeout)
+                record["kind"] = kind
+                results.append(record)
+                if log is not None:
+                    log(_describe(record))
+    return {"environment": _environment(), "results": results}
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """
+    Régressions de results par rapport à baseline (documents JSON) : liste
+    de (clé du cas, mesure, valeur de référence, valeur actuelle) pour chaque
+    durée ou pic mémoire dépassant la référence de plus de threshold (et d'un
+    écart absolu au-delà du bruit de mesure, _NOISE), et pour chaque cas
+    réussi dans la référence qui ne l'est plus.
+    """
+    reference = {_key(r): r for r in baseline["results"]}
+    regressions = []
+    for record in results["results"]:
+        before = reference.get(_key(record))
+        if before is None or before.get("status") != "ok":
+            continue
+        if record.get("status") != "ok":
+            regressions.append((_key(record), "status", "ok", record.get("status")))
+            continue
+        for metric, noise in _NOISE.items():
+            old, new = before.get(metric), record.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + threshold) and new - old > noise:
+                regressions.append((_key(record), metric, old, new))
+    return regressions
+
+
+def _key(record):
+    return record["engine"], record["dataset"], record["n"], record["seed"]
+
+
+def _describe(record):
+    case = f"{record['engine']:>14} {record['dataset']:>10} {record['n']:>8}"
+    if record["status"] != "ok":
+        return f"{case}  {record['status']}"
+    alloc = record.get("alloc_peak_mib")
+    alloc = "" if alloc is None else f"  alloc {alloc:8.1f} Mio"
+    return f"{case}  {record['seconds']:9.3f} s  RSS {record['peak_rss_mib']:8.1f} Mio{alloc}"
+
+
+def _environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def _peak_rss_mib():
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10      # octets / Kio
+
+
+def _worker(engine, dataset, n, seed, repeat, allocations):
+    """Mesure un cas dans le processus courant ; le résultat est écrit en JSON sur stdout."""
+    from voronoi_core import engines as registry
+
+    kind = registry._engines[engine].kinds[0]
+    points = generate(dataset, n, seed)
+    bbox = registry.default_bbox(points)
+    registry.available(engine)                       # import du projet hors mesure
+    rss_before = _peak_rss_mib()
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = registry.compute_voronoi(points, kind=kind, engine=engine, bbox=bbox)
+        best = min(best, time.perf_counter() - start)
+    record = {
+        "status": "ok",
+        "seconds": best,
+        "peak_rss_mib": _peak_rss_mib(),
+        "base_rss_mib": rss_before,
+        "edges": None if result.edges is None else len(result.edges),
+    }
+    del result
+    if allocations:
+        import tracemalloc
+
+        tracemalloc.start()
+        registry.compute_voronoi(points, kind=kind, engine=engine, bbox=bbox)
+        record["alloc_peak_mib"] = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    print(json.dumps(record))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mesure les moteurs de Voronoï sur des jeux de points générés.")
+    parser.add_argument("--engines", help="moteurs, séparés par des virgules (défaut : tous)")
+    parser.add_argument("--datasets", default=",".join(DATASETS), help="jeux de points, séparés par des virgules")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="nombres de points, séparés par des virgules")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="exécutions par cas (meilleure durée retenue)")
+    parser.add_argument("--no-allocations", action="store_true", help="sans mesure tracemalloc")
+    parser.add_argument("--budget", type=float, default=BUDGET, help="coût estimé maximal d'un cas, en secondes")
+    parser.add_argument("--timeout", type=float, help="durée maximale d'un cas, en secondes")
+    parser.add_argument("--output", help="fichier JSON des résultats")
+    parser.add_argument("--baseline", nargs="?", const=BASELINE,
+                        help="fichier JSON de référence à comparer (sans valeur : bench_baseline.json)")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="écart relatif signalé (0.25 = +25 %%)")
+    parser.add_argument("--worker", nargs=3, metavar=("ENGINE", "DATASET", "N"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        engine, dataset, n = args.worker
+        _worker(engine, dataset, int(n), args.seed, args.repeat, not args.no_allocations)
+        return 0
+
+    results = run_suite(
+        engines=args.engines.split(",") if args.engines else None,
+        datasets=args.datasets.split(","),
+        sizes=[int(float(s)) for s in args.sizes.split(",")],
+        seed=args.seed, repeat=args.repeat, allocations=not args.no_allocations,
+        budget=args.budget, timeout=args.timeout, log=print,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    for (engine, dataset, n, _), metric, old, new in regressions:
+        print(f"RÉGRESSION {engine} {dataset} {n} : {metric} {old} → {new}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Cache disque des diagrammes calculés, adressé par le contenu.
+
+La clé (cache_key) est l'empreinte SHA-256 des coordonnées des points, de
+l'algorithme et de ses paramètres : un fichier de points inchangé retrouve son
+résultat quel que soit son nom, et toute modification des points ou des
+paramètres donne une autre clé.
+
+Chaque entrée est un fichier .npz non compressé (un tableau numpy par nom),
+relu en quelques millisecondes. La taille totale du dossier est bornée par
+max_bytes : au-delà, les entrées les moins récemment utilisées (date de
+modification, mise à jour à chaque lecture) sont supprimées.
+
+Dossier par défaut : $VORONOI_CACHE_DIR, sinon ~/.cache/voronoi.
+"""
+
+import hashlib
+import os
+
+import numpy as np
+
+CACHE_VERSION = 2                  # à incrémenter si le contenu des entrées change (2 : prédicats exacts)
+MAX_BYTES = 2**30
+_SUFFIX = ".npz"
+
+
+def default_cache_dir():
+    return os.environ.get("VORONOI_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "voronoi")
+
+
+def cache_key(points, algorithm, **params):
+    """Empreinte hexadécimale des points (n, 2), de l'algorithme et des paramètres."""
+    points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_VERSION}|{algorithm}|{sorted(params.items())!r}|{len(points)}|".encode("utf-8"))
+    digest.update(memoryview(points).cast("B"))
+    return digest.hexdigest()
+
+
+class DiagramCache:
+    def __init__(self, directory=None, max_bytes=MAX_BYTES):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def get(self, key):
+        """Tableaux de l'entrée (dict nom → ndarray), ou None si absente."""
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (OSError, ValueError):
+            return None              # absente, ou illisible (écriture interrompue...)
+        try:
+            os.utime(path)           # utilisée récemment
+        except OSError:
+            pass
+        return arrays
+
+    def put(self, key, arrays):
+        """Enregistre les tableaux sous key puis limite la taille du cache."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as f:
+            np.savez(f, **arrays)
+        # Renommage atomique : un lecteur ne voit jamais une entrée à moitié écrite
+        os.replace(temporary, path)
+        self._evict()
+
+    def get_or_compute(self, key, compute):
+        """Entrée de key ; si absente, compute() (dict de tableaux) est calculé et enregistré."""
+        arrays = self.get(key)
+        if arrays is None:
+            arrays = compute()
+            self.put(key, arrays)
+        return arrays
+
+    def clear(self):
+        for path, _, _ in self._entries():
+            _remove(path)
+
+    def _entries(self):
+        """(chemin, taille, date) de chaque entrée."""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self):
+        """Supprime les entrées les plus anciennes tant que le total dépasse max_bytes."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            _remove(path)
+            total -= size
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
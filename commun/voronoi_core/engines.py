@@ -0,0 +1,286 @@
+"""
+Registre des moteurs de calcul du diagramme de Voronoï.
+
+Chaque version du projet calcule le diagramme à sa façon (grille de la
+phase 1, balayage de Fortune, dual de Bowyer-Watson, découpage des cellules
+par demi-plans). Ici elles sont enregistrées sous un nom, derrière la même
+interface : un tableau de points (n, 2) et une boîte (xmin, ymin, xmax, ymax)
+en entrée, un VoronoiResult en sortie :
+
+  edges          (m, 4) float64, arêtes x1 y1 x2 y2 découpées à la boîte ;
+  cell_vertices  (k, 2) float64 et cell_offsets (n + 1,) int64 : la cellule
+                 du site i est cell_vertices[cell_offsets[i]:cell_offsets[i + 1]] ;
+  labels         (len(yi), len(xi)) intp, indice du site le plus proche de
+                 chaque pixel (xi, yi : coordonnées des colonnes et des lignes).
+
+Les champs qu'un moteur ne produit pas valent None. Un moteur fournit un ou
+plusieurs types de résultat :
+  "raster"  labels ;
+  "vector"  edges ;
+  "cells"   cell_vertices / cell_offsets (et edges : côtés des cellules, les
+            arêtes intérieures y figurent deux fois).
+
+Moteurs fournis :
+  "grid"           raster          phase1/voronoi/raster.py
+  "fortune"        vector          phase2/voronoi_claude (voronoi_gui.py)
+  "bowyer_watson"  vector          phase2/voronoi_copilot (voronoi_app.cli)
+  "clipping"       cells, vector   phase2/voronoi_gemini (geometry.VoronoiClipper)
+
+Le module d'un projet n'est importé qu'au premier calcul ; un moteur dont le
+projet ne peut pas être importé (dépendance manquante) est écarté du choix
+automatique. choose(n, kind) retient le moteur disponible de coût estimé le
+plus faible pour n points (cost : secondes, mesurées sur les versions
+actuelles).
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+from voronoi_core.segments import clip_segments
+
+KINDS = ("raster", "vector", "cells")
+DEFAULT_RESOLUTION = 500
+FAR = 1e5                          # longueur des demi-droites avant découpage
+COPILOT_PACKAGE = "_voronoi_copilot"   # nom d'import du paquet voronoi_app de la variante copilot
+
+_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+
+VoronoiResult = namedtuple("VoronoiResult", ["engine", "points", "bbox", "edges", "cell_vertices",
+                                             "cell_offsets", "labels", "xi", "yi"])
+Engine = namedtuple("Engine", ["name", "kinds", "load", "cost"])
+
+_engines = {}
+_loaded = {}                       # nom → fonction de calcul, ou None si indisponible
+
+
+def register(name, kinds, load, cost):
+    """
+    Enregistre un moteur. load() importe ce qu'il faut et retourne la fonction
+    de calcul compute(points, bbox, resolution) -> VoronoiResult ; elle lève
+    ImportError si le moteur ne peut pas servir. cost(n) : durée estimée.
+    """
+    kinds = tuple(kinds)
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        raise ValueError(f"type de résultat inconnu : {sorted(unknown)}")
+    _engines[name] = Engine(name, kinds, load, cost)
+    _loaded.pop(name, None)
+
+
+def engines(kind=None):
+    """Noms des moteurs enregistrés (fournissant kind si donné)."""
+    return [name for name, engine in _engines.items() if kind is None or kind in engine.kinds]
+
+
+def available(name):
+    """True si le moteur peut être chargé."""
+    return _load(name) is not None
+
+
+def choose(n, kind="vector"):
+    """Moteur disponible fournissant kind, de coût estimé le plus faible pour n points."""
+    if kind not in KINDS:
+        raise ValueError(f"type de résultat inconnu : {kind!r}")
+    candidates = [name for name in engines(kind) if available(name)]
+    if not candidates:
+        raise LookupError(f"aucun moteur disponible pour un résultat {kind!r}")
+    return min(candidates, key=lambda name: _engines[name].cost(n))
+
+
+def compute_voronoi(points, kind="vector", engine=None, bbox=None, resolution=DEFAULT_RESOLUTION):
+    """
+    Diagramme de Voronoï des points (n, 2) dans la boîte bbox (par défaut,
+    celle des points élargie de 10 %), calculé par engine ou, sans engine,
+    par le moteur choisi par choose(n, kind). resolution : nombre de pixels
+    par côté des résultats raster.
+    """
+    points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+    if engine is None:
+        engine = choose(len(points), kind)
+    elif engine not in _engines:
+        raise KeyError(f"moteur inconnu : {engine!r}")
+    elif kind not in _engines[engine].kinds:
+        raise ValueError(f"le moteur {engine!r} ne fournit pas de résultat {kind!r}")
+    compute = _load(engine)
+    if compute is None:
+        raise ImportError(f"moteur {engine!r} indisponible")
+    if bbox is None:
+        bbox = default_bbox(points)
+    return compute(points, tuple(float(v) for v in bbox), resolution)
+
+
+def default_bbox(points, margin=0.1):
+    """Boîte des points élargie de margin (au moins 1 unité de chaque côté)."""
+    if len(points) == 0:
+        return 0.0, 0.0, 1.0, 1.0
+    low, high = points.min(axis=0), points.max(axis=0)
+    pad = np.maximum((high - low) * margin, 1.0)
+    return (*(low - pad).tolist(), *(high + pad).tolist())
+
+
+def pack_cells(cells):
+    """Liste de polygones → (cell_vertices (k, 2), cell_offsets (n + 1,))."""
+    sizes = np.array([len(cell) for cell in cells], dtype=np.int64)
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    if offsets[-1] == 0:
+        return np.zeros((0, 2)), offsets
+    vertices = np.concatenate([np.asarray(cell, dtype=np.float64).reshape(-1, 2) for cell in cells if len(cell)])
+    return vertices, offsets
+
+
+def _load(name):
+    if name not in _loaded:
+        try:
+            _loaded[name] = _engines[name].load()
+        except ImportError:
+            _loaded[name] = None
+    return _loaded[name]
+
+
+def load_module(module_name, relative_path):
+    """
+    Importe un fichier d'un des projets (chemin relatif à la racine du dépôt)
+    sous le nom module_name, propre à l'appelant : les projets ont des modules
+    de même nom (voronoi_app) qui ne doivent pas se masquer. Un dossier est
+    importé comme paquet ; ses sous-modules sont alors module_name.sous_module.
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    path = os.path.normpath(os.path.join(_ROOT, relative_path))
+    if os.path.isdir(path):
+        spec = importlib.util.spec_from_file_location(module_name, os.path.join(path, "__init__.py"),
+                                                      submodule_search_locations=[path])
+    elif os.path.isfile(path):
+        spec = importlib.util.spec_from_file_location(module_name, path)
+    else:
+        raise ImportError(f"{path} introuvable")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def _clipped_edges(segments, bbox):
+    xmin, ymin, xmax, ymax = bbox
+    clipped, keep = clip_segments(segments, xmin, xmax, ymin, ymax)
+    clipped = clipped[keep]
+    return clipped[np.hypot(clipped[:, 2] - clipped[:, 0], clipped[:, 3] - clipped[:, 1]) > 1e-9]
+
+
+def _result(engine, points, bbox, edges=None, cells=None, labels=None, xi=None, yi=None):
+    vertices, offsets = cells if cells is not None else (None, None)
+    return VoronoiResult(engine, points, bbox, edges, vertices, offsets, labels, xi, yi)
+
+
+# ── Moteurs des projets ─────────────────────────────────────────────────────
+
+def _load_grid():
+    raster = load_module("_voronoi_engine_grid", "phase1/voronoi/raster.py")
+
+    def compute(points, bbox, resolution):
+        xmin, ymin, xmax, ymax = bbox
+        labels = raster.compute_grid(points[:, 0] - xmin, points[:, 1] - ymin,
+                                     xmax - xmin, ymax - ymin, resolution)
+        xi = xmin + np.arange(resolution) / resolution * (xmax - xmin)
+        yi = ymin + np.arange(resolution) / resolution * (ymax - ymin)
+        return _result("grid", points, bbox, labels=labels, xi=xi, yi=yi)
+
+    return compute
+
+
+def _load_fortune():
+    gui = load_module("_voronoi_engine_fortune", "phase2/voronoi_claude/voronoi/voronoi_gui.py")
+
+    def compute(points, bbox, resolution):
+        if len(points) == 0:
+            return _result("fortune", points, bbox, edges=np.zeros((0, 4)))
+        xmin, ymin, xmax, ymax = bbox
+        diagram = gui.compute_voronoi(points)
+        edges = gui.collect_segments(diagram, xmin, xmax, ymin, ymax, far=FAR, as_array=True)
+        return _result("fortune", points, bbox, edges=edges)
+
+    return compute
+
+
+def _load_bowyer_watson():
+    package = load_module(COPILOT_PACKAGE, "phase2/voronoi_copilot/voronoi/voronoi_app")
+    cli = importlib.import_module(package.__name__ + ".cli")
+
+    def compute(points, bbox, resolution):
+        diagram = cli.compute_diagram(points) if len(points) >= 3 else None
+        if diagram is None or len(diagram["triangles"]) == 0:
+            # Moins de trois points distincts ou points alignés : aucun triangle
+            return _result("bowyer_watson", points, bbox, edges=_clipped_edges(_collinear_bisectors(points), bbox))
+        centers, pairs = diagram["centers"], diagram["pairs"]
+        finite = np.hstack([centers[pairs[:, 0]], centers[pairs[:, 1]]])
+        segments = np.vstack([finite, _hull_rays(points, diagram["triangles"], centers)])
+        return _result("bowyer_watson", points, bbox, edges=_clipped_edges(segments, bbox))
+
+    return compute
+
+
+def _collinear_bisectors(points):
+    """
+    Diagramme de points alignés (ou de moins de trois points) : les
+    médiatrices de points consécutifs le long de leur droite, droites
+    parallèles représentées par des segments de longueur 2 FAR.
+    """
+    points = np.unique(points, axis=0)
+    if len(points) < 2:
+        return np.zeros((0, 4))
+    direction = points[np.argmax(np.hypot(*(points - points[0]).T))] - points[0]
+    points = points[np.argsort((points - points[0]) @ direction, kind="stable")]
+    normal = np.array([-direction[1], direction[0]]) / np.hypot(*direction)
+    middles = (points[1:] + points[:-1]) / 2
+    return np.hstack([middles - FAR * normal, middles + FAR * normal])
+
+
+def _hull_rays(points, triangles, centers):
+    """
+    Demi-droites du diagramme (segments de longueur FAR) : une par côté de
+    l'enveloppe convexe, partant du centre circonscrit de son triangle,
+    perpendiculaire au côté et vers l'extérieur.
+    """
+    if len(triangles) == 0:
+        return np.zeros((0, 4))
+    a = triangles.reshape(-1)
+    b = np.roll(triangles, -1, axis=1).reshape(-1)
+    c = np.roll(triangles, -2, axis=1).reshape(-1)        # sommet opposé au côté a-b
+    keys = np.minimum(a, b).astype(np.int64) * len(points) + np.maximum(a, b)
+    _, first, counts = np.unique(keys, return_index=True, return_counts=True)
+    hull = first[counts == 1]                              # côtés d'un seul triangle
+    a, b, c = a[hull], b[hull], c[hull]
+    side = points[b] - points[a]
+    normal = np.column_stack([-side[:, 1], side[:, 0]])
+    inward = np.einsum("ij,ij->i", normal, points[c] - points[a]) > 0
+    normal[inward] *= -1
+    normal /= np.hypot(normal[:, 0], normal[:, 1])[:, None]
+    start = centers[hull // 3]
+    return np.hstack([start, start + FAR * normal])
+
+
+def _load_clipping():
+    geometry = load_module("_voronoi_engine_clipping", "phase2/voronoi_gemini/voronoi/voronoi_app/geometry.py")
+    render = importlib.import_module("voronoi_core.render")
+
+    def compute(points, bbox, resolution):
+        cells = geometry.VoronoiClipper(bounding_box=bbox).compute_cells(points) if len(points) else []
+        return _result("clipping", points, bbox, edges=render.polygon_edges(cells), cells=pack_cells(cells))
+
+    return compute
+
+
+register("grid", ["raster"], _load_grid, lambda n: 0.03 + 1.8e-5 * n)
+register("fortune", ["vector"], _load_fortune, lambda n: 0.002 + 9e-5 * n)
+register("bowyer_watson", ["vector"], _load_bowyer_watson, lambda n: 1e-4 * n * (1 + n / 2e5))
+register("clipping", ["cells", "vector"], _load_clipping, lambda n: 2.8e-4 * n)
@@ -0,0 +1,411 @@
+"""
+Kd-tree statique 2D, interrogé par lots avec numpy.
+
+Les requêtes ne descendent pas l'arbre une par une : toutes les paires
+(requête, nœud) encore utiles avancent ensemble, un niveau de l'arbre à la
+fois, ce qui garde la boucle Python en O(profondeur) = O(log n).
+
+En cas d'égalité de distance, le site de plus petit indice est retenu, comme
+np.argmin sur la matrice des distances complète. Les distances sont calculées
+par (qx - px)**2 + (qy - py)**2, dans le même ordre que les calculs « à la
+main » du dépôt : les résultats sont identiques bit à bit.
+"""
+
+import numpy as np
+
+LEAF_SIZE = 16
+GRID_TILE = 32
+GRID_DENSE_FACTOR = 32    # au-delà de 32·tile candidats, requête par pixel
+QUERY_MAX_BYTES = 64 * 2**20
+
+
+class KDTree:
+    """
+    Kd-tree statique sur un tableau (n, 2) de points.
+
+    query(queries, k)        → distances et indices des k plus proches sites,
+    query_radius(queries, r) → indices des sites à distance ≤ r,
+    nearest_grid(xi, yi)     → raster du site le plus proche sur une grille.
+    """
+
+    def __init__(self, points, leaf_size=LEAF_SIZE):
+        pts = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+        self.points = pts
+        self.n = len(pts)
+        self.leaf_size = max(1, int(leaf_size))
+        self._build()
+
+    def __len__(self):
+        return self.n
+
+    # ── Construction ─────────────────────────────────────────────────────────
+
+    def _build(self):
+        """
+        Découpe médiane sur l'axe le plus étendu, jusqu'à des feuilles d'au
+        plus leaf_size points. Chaque nœud couvre perm[start:end] et garde la
+        boîte englobante exacte de ses points.
+        """
+        n = self.n
+        xs, ys = self.points[:, 0], self.points[:, 1]
+        perm = np.arange(n)
+        start, end = [0], [n]
+        left, right = [-1], [-1]
+        dim, split = [0], [0.0]
+        bbox = [(0.0, 0.0, 0.0, 0.0)]
+
+        stack = [0] if n else []
+        while stack:
+            node = stack.pop()
+            s, e = start[node], end[node]
+            idx = perm[s:e]
+            x, y = xs[idx], ys[idx]
+            x0, x1, y0, y1 = x.min(), x.max(), y.min(), y.max()
+            bbox[node] = (x0, x1, y0, y1)
+            if e - s <= self.leaf_size:
+                continue
+
+            d = 0 if x1 - x0 >= y1 - y0 else 1
+            coord = x if d == 0 else y
+            mid = (e - s) // 2
+            order = np.argpartition(coord, mid)
+            perm[s:e] = idx[order]
+            dim[node] = d
+            split[node] = coord[order[mid]]
+
+            for cs, ce in ((s, s + mid), (s + mid, e)):
+                start.append(cs); end.append(ce)
+                left.append(-1); right.append(-1)
+                dim.append(0); split.append(0.0)
+                bbox.append((0.0, 0.0, 0.0, 0.0))
+                stack.append(len(start) - 1)
+            left[node], right[node] = len(start) - 2, len(start) - 1
+
+        self._perm = perm
+        self._xs = xs[perm]
+        self._ys = ys[perm]
+        self._start = np.array(start, dtype=np.intp)
+        self._end = np.array(end, dtype=np.intp)
+        self._left = np.array(left, dtype=np.intp)
+        self._right = np.array(right, dtype=np.intp)
+        self._dim = np.array(dim, dtype=np.intp)
+        self._split = np.array(split, dtype=np.float64)
+        self._bbox = np.array(bbox, dtype=np.float64).reshape(-1, 4)
+
+    # ── Briques vectorisées ──────────────────────────────────────────────────
+
+    def _gather(self, q, nodes, width):
+        """
+        Distances² entre q[i] et les points du nœud nodes[i] (au plus width
+        points par nœud). Retourne (d2, indices d'origine), inf au-delà du nœud.
+        """
+        pos = self._start[nodes][:, None] + np.arange(width)[None, :]
+        valid = pos < self._end[nodes][:, None]
+        pos = np.minimum(pos, self.n - 1)
+        d2 = (q[:, 0:1] - self._xs[pos]) ** 2 + (q[:, 1:2] - self._ys[pos]) ** 2
+        d2[~valid] = np.inf
+        return d2, self._perm[pos]
+
+    def _descend(self, q, k):
+        """
+        Nœud le plus profond contenant chaque requête (selon les coupes) et
+        comptant au moins k points : donne une première borne de distance.
+        """
+        m = len(q)
+        cur = np.zeros(m, dtype=np.intp)
+        rows = np.arange(m)
+        size = self._end - self._start
+        while True:
+            lft = self._left[cur]
+            go_right = q[rows, self._dim[cur]] >= self._split[cur]
+            child = np.where(go_right, self._right[cur], lft)
+            ok = (lft >= 0) & (size[np.maximum(child, 0)] >= k)
+            if not ok.any():
+                return cur
+            cur = np.where(ok, child, cur)
+
+    def _pairs_within(self, rects, r2):
+        """
+        Toutes les paires (requête, site) telles que distance² ≤ r2[requête].
+        Une requête est un rectangle [x0, x1, y0, y1] (un point : x0 = x1,
+        y0 = y1). Les nœuds dont la boîte est plus loin que la borne sont
+        élagués.
+        """
+        qi = np.arange(len(rects))
+        nodes = np.zeros(len(rects), dtype=np.intp)
+        out_q, out_p, out_d = [], [], []
+        while len(qi):
+            b = self._bbox[nodes]
+            r = rects[qi]
+            dx = np.maximum(np.maximum(b[:, 0] - r[:, 1], r[:, 0] - b[:, 1]), 0.0)
+            dy = np.maximum(np.maximum(b[:, 2] - r[:, 3], r[:, 2] - b[:, 3]), 0.0)
+            keep = dx * dx + dy * dy <= r2[qi]
+            qi, nodes = qi[keep], nodes[keep]
+
+            leaf = self._left[nodes] < 0
+            lq = qi[leaf]
+            if len(lq):
+                d2, idx = self._gather_rect(rects[lq], nodes[leaf], self.leaf_size)
+                hit = d2 <= r2[lq][:, None]
+                out_q.append(np.broadcast_to(lq[:, None], hit.shape)[hit])
+                out_p.append(idx[hit])
+                out_d.append(d2[hit])
+
+            iq, inodes = qi[~leaf], nodes[~leaf]
+            qi = np.concatenate([iq, iq])
+            nodes = np.concatenate([self._left[inodes], self._right[inodes]])
+
+        if not out_q:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty, np.zeros(0)
+        return np.concatenate(out_q), np.concatenate(out_p), np.concatenate(out_d)
+
+    def _gather_rect(self, rects, nodes, width):
+        """
+        Comme _gather, mais distance² de chaque site au rectangle rects[i].
+        Pour un rectangle réduit à un point, c'est exactement (qx - px)**2 + ...
+        """
+        pos = self._start[nodes][:, None] + np.arange(width)[None, :]
+        valid = pos < self._end[nodes][:, None]
+        pos = np.minimum(pos, self.n - 1)
+        px, py = self._xs[pos], self._ys[pos]
+        dx = np.maximum(np.maximum(rects[:, 0:1] - px, px - rects[:, 1:2]), 0.0)
+        dy = np.maximum(np.maximum(rects[:, 2:3] - py, py - rects[:, 3:4]), 0.0)
+        d2 = dx * dx + dy * dy
+        d2[~valid] = np.inf
+        return d2, self._perm[pos]
+
+    def _chunks(self, m, max_bytes):
+        # ~ quelques paires (requête, nœud) et quelques feuilles par requête
+        step = max(256, int(max_bytes) // (16 * self.leaf_size * 8))
+        for s in range(0, m, step):
+            yield s, min(s + step, m)
+
+    # ── API ──────────────────────────────────────────────────────────────────
+
+    def query(self, queries, k=1, max_bytes=QUERY_MAX_BYTES):
+        """
+        k plus proches sites de chaque requête.
+        queries : (m, 2) ou un seul point (2,).
+        Retourne (distances, indices) de forme (m,) si k == 1, (m, k) sinon,
+        triés par distance croissante puis par indice. Pour un seul point,
+        des scalaires (k == 1) ou des tableaux (k,).
+        Les requêtes sont traitées par paquets pour rester sous max_bytes.
+        """
+        if not 1 <= k <= self.n:
+            raise ValueError(f"k doit être entre 1 et {self.n} (reçu {k})")
+        q = np.asarray(queries, dtype=np.float64)
+        single = q.ndim == 1
+        q = q.reshape(-1, 2)
+        m = len(q)
+
+        dist = np.empty((m, k))
+        idx = np.empty((m, k), dtype=np.intp)
+        for s, e in self._chunks(m, max_bytes):
+            d2, ix = self._query_chunk(q[s:e], k)
+            dist[s:e], idx[s:e] = np.sqrt(d2), ix
+
+        if k == 1:
+            dist, idx = dist[:, 0], idx[:, 0]
+        if single:
+            return (float(dist[0]), int(idx[0])) if k == 1 else (dist[0], idx[0])
+        return dist, idx
+
+    def _query_d2(self, q, max_bytes):
+        """Plus proche site (distance², indice) de chaque ligne de q (m, 2)."""
+        d2 = np.empty(len(q))
+        idx = np.empty(len(q), dtype=np.intp)
+        for s, e in self._chunks(len(q), max_bytes):
+            dd, ii = self._query_chunk(q[s:e], 1)
+            d2[s:e], idx[s:e] = dd[:, 0], ii[:, 0]
+        return d2, idx
+
+    def _query_chunk(self, q, k):
+        m = len(q)
+        cur = self._descend(q, k)
+        width = int((self._end[cur] - self._start[cur]).max())
+        d2, idx = self._gather(q, cur, width)
+        if k == 1:
+            return self._nearest_chunk(q, d2, idx)
+        r2 = np.partition(d2, k - 1, axis=1)[:, k - 1]
+
+        qi, pi, dd = self._pairs_within(_point_rects(q), r2)
+        order = np.lexsort((pi, dd, qi))
+        qi, pi, dd = qi[order], pi[order], dd[order]
+        first = np.searchsorted(qi, np.arange(m))
+        rank = np.arange(len(qi)) - first[qi]
+        sel = rank < k
+        out_d = np.empty((m, k))
+        out_i = np.empty((m, k), dtype=np.intp)
+        out_d[qi[sel], rank[sel]] = dd[sel]
+        out_i[qi[sel], rank[sel]] = pi[sel]
+        return out_d, out_i
+
+    def _nearest_chunk(self, q, d2, idx):
+        """
+        Cas k == 1 : chaque feuille visitée ne fournit que son meilleur site,
+        et la borne de chaque requête se resserre au fil des niveaux.
+        """
+        m = len(q)
+        best_d, best_i = _row_best(d2, idx)
+        qi = np.arange(m)
+        nodes = np.zeros(m, dtype=np.intp)
+        while len(qi):
+            b = self._bbox[nodes]
+            qx, qy = q[qi, 0], q[qi, 1]
+            dx = np.maximum(np.maximum(b[:, 0] - qx, qx - b[:, 1]), 0.0)
+            dy = np.maximum(np.maximum(b[:, 2] - qy, qy - b[:, 3]), 0.0)
+            keep = dx * dx + dy * dy <= best_d[qi]
+            qi, nodes = qi[keep], nodes[keep]
+
+            leaf = self._left[nodes] < 0
+            lq = qi[leaf]
+            if len(lq):
+                ld, li = _row_best(*self._gather(q[lq], nodes[leaf], self.leaf_size))
+                new_d = best_d.copy()
+                np.minimum.at(new_d, lq, ld)
+                best_i[new_d < best_d] = self.n
+                tie = ld == new_d[lq]
+                np.minimum.at(best_i, lq[tie], li[tie])
+                best_d = new_d
+
+            iq, inodes = qi[~leaf], nodes[~leaf]
+            qi = np.concatenate([iq, iq])
+            nodes = np.concatenate([self._left[inodes], self._right[inodes]])
+        return best_d[:, None], best_i[:, None]
+
+    def nearest_grid(self, xi, yi, tile=GRID_TILE, max_bytes=QUERY_MAX_BYTES,
+                     return_distance=False):
+        """
+        Raster du site le plus proche : ids[r, c] = site le plus proche de
+        (xi[c], yi[r]), identique à np.argmin((gx-px)**2 + (gy-py)**2, axis=2)
+        sur la grille complète. xi et yi doivent être monotones.
+
+        Tout se fait en une requête groupée sur des tuiles tile × tile :
+          1. le plus proche site s du centre de chaque tuile donne une borne
+             B = distance² de s au coin le plus éloigné de la tuile (chaque
+             pixel de la tuile a un site à distance² ≤ B) ;
+          2. seuls les sites à distance² ≤ B du rectangle de la tuile peuvent
+             gagner : ils sont trouvés dans l'arbre (requête rectangle) ;
+          3. argmin dense sur ces candidats, dans l'ordre des indices.
+        Bornes et distances utilisent les mêmes opérations flottantes :
+        l'élagage est exact, égalités comprises.
+        Avec return_distance, retourne aussi les distances² (même forme).
+        """
+        xi = np.asarray(xi, dtype=np.float64)
+        yi = np.asarray(yi, dtype=np.float64)
+        ids = np.zeros((len(yi), len(xi)), dtype=np.intp)
+        dist = np.full((len(yi), len(xi)), np.inf)
+        if self.n == 0 or len(xi) == 0 or len(yi) == 0:
+            return (ids, dist) if return_distance else ids
+
+        r0s = np.arange(0, len(yi), tile)
+        c0s = np.arange(0, len(xi), tile)
+        r1s = np.minimum(r0s + tile, len(yi)) - 1
+        c1s = np.minimum(c0s + tile, len(xi)) - 1
+        R0, C0 = np.meshgrid(r0s, c0s, indexing="ij")
+        R1, C1 = np.meshgrid(r1s, c1s, indexing="ij")
+        xa, xb = xi[C0.ravel()], xi[C1.ravel()]
+        ya, yb = yi[R0.ravel()], yi[R1.ravel()]
+        rects = np.column_stack([np.minimum(xa, xb), np.maximum(xa, xb),
+                                 np.minimum(ya, yb), np.maximum(ya, yb)])
+
+        centers = np.column_stack([(rects[:, 0] + rects[:, 1]) / 2,
+                                   (rects[:, 2] + rects[:, 3]) / 2])
+        _, s = self._query_d2(centers, max_bytes)
+        sx, sy = self.points[s, 0], self.points[s, 1]
+        ex = np.maximum(np.abs(rects[:, 0] - sx), np.abs(rects[:, 1] - sx))
+        ey = np.maximum(np.abs(rects[:, 2] - sy), np.abs(rects[:, 3] - sy))
+        bound = ex * ex + ey * ey
+
+        ti, pi, _ = self._pairs_within(rects, bound)
+        order = np.lexsort((pi, ti))
+        ti, pi = ti[order], pi[order]
+        cuts = np.searchsorted(ti, np.arange(len(rects) + 1))
+
+        px, py = self.points[:, 0], self.points[:, 1]
+        dense = []
+        for t, (r0, c0) in enumerate(zip(R0.ravel(), C0.ravel())):
+            cand = pi[cuts[t]:cuts[t + 1]]
+            if len(cand) > GRID_DENSE_FACTOR * tile:
+                dense.append((r0, c0))
+                continue
+            tx, ty = xi[c0:c0 + tile], yi[r0:r0 + tile]
+            d, i = _labels_block(px, py, cand, tx, ty, max_bytes)
+            ids[r0:r0 + tile, c0:c0 + tile] = i
+            dist[r0:r0 + tile, c0:c0 + tile] = d
+
+        # Tuiles couvrant beaucoup de cellules : requête par pixel groupée
+        if dense:
+            rows, cols = [], []
+            for r0, c0 in dense:
+                rr, cc = np.meshgrid(np.arange(r0, min(r0 + tile, len(yi))),
+                                     np.arange(c0, min(c0 + tile, len(xi))),
+                                     indexing="ij")
+                rows.append(rr.ravel())
+                cols.append(cc.ravel())
+            rows, cols = np.concatenate(rows), np.concatenate(cols)
+            d, i = self._query_d2(np.column_stack([xi[cols], yi[rows]]), max_bytes)
+            ids[rows, cols] = i
+            dist[rows, cols] = d
+        return (ids, dist) if return_distance else ids
+
+    def query_radius(self, queries, r, max_bytes=QUERY_MAX_BYTES):
+        """
+        Sites à distance ≤ r de chaque requête (r scalaire ou un r par requête).
+        Retourne une liste de tableaux d'indices triés par indice croissant
+        (un seul tableau pour un seul point).
+        """
+        q = np.asarray(queries, dtype=np.float64)
+        single = q.ndim == 1
+        q = q.reshape(-1, 2)
+        m = len(q)
+        r = np.broadcast_to(np.asarray(r, dtype=np.float64), (m,))
+
+        result = []
+        for s, e in self._chunks(m, max_bytes):
+            if self.n == 0:
+                result.extend(np.zeros(0, dtype=np.intp) for _ in range(e - s))
+                continue
+            qi, pi, _ = self._pairs_within(_point_rects(q[s:e]), r[s:e] * r[s:e])
+            order = np.lexsort((pi, qi))
+            qi, pi = qi[order], pi[order]
+            bounds = np.searchsorted(qi, np.arange(e - s + 1))
+            result.extend(pi[bounds[j]:bounds[j + 1]] for j in range(e - s))
+        return result[0] if single else result
+
+
+def _labels_block(sx, sy, cand, tx, ty, max_bytes):
+    """
+    argmin sur les candidats cand (indices croissants) pour le bloc de pixels
+    tx × ty ; les candidats sont pris par paquets pour rester sous max_bytes.
+    """
+    step = max(1, int(max_bytes) // (len(tx) * len(ty) * 8))
+    best_d = best_i = None
+    for k in range(0, len(cand), step):
+        c = cand[k:k + step]
+        d = (tx[None, :, None] - sx[c]) ** 2 + (ty[:, None, None] - sy[c]) ** 2
+        j = np.argmin(d, axis=2)
+        dj = np.take_along_axis(d, j[:, :, None], axis=2)[:, :, 0]
+        if best_d is None:
+            best_d, best_i = dj, c[j]
+        else:
+            better = dj < best_d          # strict : l'indice le plus petit gagne
+            best_d = np.where(better, dj, best_d)
+            best_i = np.where(better, c[j], best_i)
+    return best_d, best_i
+
+
+def _point_rects(q):
+    return np.column_stack([q[:, 0], q[:, 0], q[:, 1], q[:, 1]])
+
+
+def _row_best(d2, idx):
+    """
+    Minimum de chaque ligne de d2 et, parmi les ex æquo, le plus petit indice
+    d'origine (les points d'une feuille ne sont pas rangés par indice).
+    """
+    best = d2.min(axis=1)
+    cand = np.where(d2 == best[:, None], idx, np.iinfo(np.intp).max)
+    return best, cand.min(axis=1)
+
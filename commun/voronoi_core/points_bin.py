@@ -0,0 +1,152 @@
+"""
+Format binaire de points, ouvert sans copie avec numpy.memmap.
+
+Disposition (petit-boutiste) :
+  en-tête de 64 octets :
+    magie b"VPTS", version (uint16), taille d'un flottant (uint8 : 8 ou 4),
+    drapeaux (uint8 : 1 = identifiants, 2 = poids), nombre de points (uint64),
+    puis des zéros ;
+  bloc xy : n × 2 flottants (float64 ou float32) ;
+  identifiants (si présents) : n × int64, aligné sur 8 octets ;
+  poids (si présents) : n flottants du même type que xy, aligné sur 8 octets.
+
+Conversion depuis le format texte :
+    python -m voronoi_core.points_bin points.txt points.vpts [--float32]
+"""
+
+import argparse
+import struct
+from collections import namedtuple
+
+import numpy as np
+
+MAGIC = b"VPTS"
+VERSION = 1
+HEADER_BYTES = 64
+HAS_IDS, HAS_WEIGHTS = 1, 2
+
+_HEADER = struct.Struct("<4sHBBQ")
+_FLOAT_TYPES = {8: np.dtype("<f8"), 4: np.dtype("<f4")}
+_ID_TYPE = np.dtype("<i8")
+
+PointFile = namedtuple("PointFile", ["points", "ids", "weights"])
+
+
+def is_points_binary(path):
+    """Vrai si le fichier commence par l'en-tête du format binaire."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except (OSError, TypeError):
+        return False
+
+
+def open_points_binary(path, mode="r"):
+    """
+    Ouvre un fichier binaire de points. Retourne PointFile(points, ids,
+    weights) : des numpy.memmap (n, 2), (n,), (n,) sur le fichier, sans
+    copie (ids et weights valent None s'ils sont absents).
+    mode : "r" (lecture seule) ou "r+" (modifiable sur place).
+    """
+    with open(path, "rb") as f:
+        header = f.read(HEADER_BYTES)
+    if len(header) < HEADER_BYTES or header[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} : pas un fichier de points binaire")
+    _, version, float_size, flags, count = _HEADER.unpack_from(header)
+    if version != VERSION or float_size not in _FLOAT_TYPES:
+        raise ValueError(f"{path} : version {version} / flottants de {float_size} octets non gérés")
+    float_type = _FLOAT_TYPES[float_size]
+
+    offsets = _layout(count, float_type, flags)
+    points = _map(path, mode, float_type, offsets["points"], (count, 2))
+    ids = _map(path, mode, _ID_TYPE, offsets["ids"], (count,)) if flags & HAS_IDS else None
+    weights = _map(path, mode, float_type, offsets["weights"], (count,)) if flags & HAS_WEIGHTS else None
+    return PointFile(points, ids, weights)
+
+
+def write_points_binary(path, points, ids=None, weights=None, dtype=np.float64):
+    """Écrit des points (n, 2), et éventuellement ids / poids, au format binaire."""
+    float_type = _FLOAT_TYPES[np.dtype(dtype).itemsize]
+    points = np.asarray(points, dtype=float_type).reshape(-1, 2)
+    count = len(points)
+    flags = (HAS_IDS if ids is not None else 0) | (HAS_WEIGHTS if weights is not None else 0)
+    offsets = _layout(count, float_type, flags)
+
+    with open(path, "wb") as f:
+        f.write(_header(float_type, flags, count))
+        points.tofile(f)
+        if ids is not None:
+            _pad_to(f, offsets["ids"])
+            np.asarray(ids, dtype=_ID_TYPE).reshape(count).tofile(f)
+        if weights is not None:
+            _pad_to(f, offsets["weights"])
+            np.asarray(weights, dtype=float_type).reshape(count).tofile(f)
+
+
+def convert_text_to_binary(text_path, binary_path, dtype=np.float64, strict=True,
+                           block_size=1_000_000):
+    """
+    Convertit un fichier de points texte au format binaire, par blocs : la
+    mémoire utilisée ne dépend pas de la taille du fichier. Retourne le
+    nombre de points écrits.
+    """
+    from voronoi_core.points_io import iter_point_blocks
+
+    float_type = _FLOAT_TYPES[np.dtype(dtype).itemsize]
+    count = 0
+    with open(binary_path, "wb") as f:
+        f.write(_header(float_type, 0, 0))
+        for block in iter_point_blocks(text_path, block_size=block_size, strict=strict):
+            block.astype(float_type).tofile(f)
+            count += len(block)
+        # Le nombre de points n'est connu qu'à la fin
+        f.seek(0)
+        f.write(_header(float_type, 0, count))
+    return count
+
+
+# ── Détails ──────────────────────────────────────────────────────────────────
+
+def _header(float_type, flags, count):
+    return _HEADER.pack(MAGIC, VERSION, float_type.itemsize, flags, count).ljust(HEADER_BYTES, b"\0")
+
+
+def _layout(count, float_type, flags):
+    """Position de chaque bloc dans le fichier."""
+    offsets = {"points": HEADER_BYTES}
+    end = HEADER_BYTES + count * 2 * float_type.itemsize
+    if flags & HAS_IDS:
+        offsets["ids"] = end = _align8(end)
+        end += count * _ID_TYPE.itemsize
+    if flags & HAS_WEIGHTS:
+        offsets["weights"] = end = _align8(end)
+    return offsets
+
+
+def _align8(offset):
+    return (offset + 7) // 8 * 8
+
+
+def _pad_to(f, offset):
+    f.write(b"\0" * (offset - f.tell()))
+
+
+def _map(path, mode, dtype, offset, shape):
+    if shape[0] == 0:
+        return np.zeros(shape, dtype=dtype)      # mmap refuse une longueur nulle
+    return np.memmap(path, dtype=dtype, mode=mode, offset=offset, shape=shape)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convertit un fichier de points texte au format binaire.")
+    parser.add_argument("source", help="fichier texte (x,y / x y / x;y par ligne)")
+    parser.add_argument("destination", help="fichier binaire à écrire")
+    parser.add_argument("--float32", action="store_true", help="coordonnées en float32 (moitié moins de place)")
+    args = parser.parse_args(argv)
+    count = convert_text_to_binary(args.source, args.destination,
+                                   dtype=np.float32 if args.float32 else np.float64)
+    print(f"{count} points écrits dans {args.destination}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Lecture de fichiers de points texte, par gros blocs, vers des tableaux numpy.
+
+Format : un point par ligne, « x,y », « x y » ou « x;y » (espaces autour des
+séparateurs permis) ; lignes vides ignorées ; tout ce qui suit un # est un
+commentaire.
+
+Le fichier est lu par paquets d'octets (chunk_bytes) coupés en fin de ligne.
+Chaque paquet est confié au parseur C de numpy.loadtxt (commentaires
+compris), qui vérifie aussi que chaque ligne a deux champs : d'abord avec la
+virgule pour délimiteur (« ; » compris), le cas le plus rapide, puis avec
+tous les séparateurs remplacés par des espaces. Un paquet refusé les deux
+fois (champ non numérique, ligne à 1 ou 3 champs...) est relu ligne par
+ligne pour appliquer exactement les règles ci-dessous.
+
+  strict=True  : chaque ligne non vide doit avoir exactement deux nombres,
+                 sinon ValueError (avec le numéro de ligne).
+  strict=False : une ligne est gardée si ses deux premiers champs sont des
+                 nombres (les champs suivants sont ignorés), sinon sautée.
+
+Les fichiers au format binaire (voir points_bin) sont reconnus à leur
+en-tête : load_points rend alors une vue numpy.memmap sur le fichier, sans
+copie ni conversion (float64 ou float32 selon le fichier) ; iter_point_blocks
+en rend des tranches, converties en float64 bloc par bloc pour un fichier
+float32.
+"""
+
+import io
+import warnings
+
+import numpy as np
+
+from voronoi_core.points_bin import is_points_binary, open_points_binary
+
+CHUNK_BYTES = 4 * 2**20
+BLOCK_POINTS = 1_000_000
+
+_COMMAS = bytes.maketrans(b";\t\r\v\f", b",    ")
+_SEPARATORS = bytes.maketrans(b",;\t\r\v\f", b"      ")
+_BOM = b"\xef\xbb\xbf"
+
+
+def load_points(path, strict=True, chunk_bytes=CHUNK_BYTES):
+    """Tous les points du fichier, en un tableau (n, 2) float64 contigu."""
+    if is_points_binary(path):
+        return open_points_binary(path).points
+    chunks = list(_iter_chunks(path, strict, chunk_bytes))
+    if not chunks:
+        return np.zeros((0, 2))
+    return np.ascontiguousarray(np.concatenate(chunks))
+
+
+def iter_point_blocks(path, block_size=BLOCK_POINTS, strict=True, chunk_bytes=CHUNK_BYTES):
+    """
+    Les points du fichier par blocs (block_size, 2) float64, le dernier
+    éventuellement plus court : la mémoire utilisée ne dépend pas de la
+    taille du fichier.
+    """
+    if block_size < 1:
+        raise ValueError(f"block_size doit être ≥ 1 (reçu {block_size})")
+    if is_points_binary(path):
+        points = open_points_binary(path).points
+        for start in range(0, len(points), block_size):
+            yield np.asarray(points[start:start + block_size], dtype=np.float64)
+        return
+    pending, pending_count = [], 0
+    for chunk in _iter_chunks(path, strict, chunk_bytes):
+        pending.append(chunk)
+        pending_count += len(chunk)
+        if pending_count < block_size:
+            continue
+        buffered = np.concatenate(pending)
+        full = len(buffered) - len(buffered) % block_size
+        for start in range(0, full, block_size):
+            yield np.ascontiguousarray(buffered[start:start + block_size])
+        pending = [buffered[full:]]
+        pending_count = len(buffered) - full
+    if pending_count:
+        yield np.ascontiguousarray(np.concatenate(pending))
+
+
+def parse_points(data, strict=True, first_line=1):
+    """
+    Points d'un texte (str ou bytes) contenant des lignes complètes.
+    first_line sert aux messages d'erreur.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if data.startswith(_BOM):
+        data = data[len(_BOM):]
+
+    values = _parse_fields(data.translate(_COMMAS), ",")
+    if values is None:
+        values = _parse_fields(data.translate(_SEPARATORS), None)
+    if values is not None:
+        return values
+    return _parse_lines(data, strict, first_line)
+
+
+# ── Détails ──────────────────────────────────────────────────────────────────
+
+def _iter_chunks(path, strict, chunk_bytes):
+    """Tableaux (m, 2) successifs, un par paquet de lignes complètes."""
+    chunk_bytes = max(1, int(chunk_bytes))
+    line_number = 1
+    carry = b""
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(chunk_bytes)
+            if not block:
+                break
+            block = carry + block
+            cut = block.rfind(b"\n") + 1
+            if cut == 0:
+                carry = block
+                continue
+            data, carry = block[:cut], block[cut:]
+            points = parse_points(data, strict, line_number)
+            line_number += data.count(b"\n")
+            if len(points):
+                yield points
+    if carry:
+        points = parse_points(carry, strict, line_number)
+        if len(points):
+            yield points
+
+
+def _parse_fields(data, delimiter):
+    """
+    Tableau (m, 2) si chaque ligne non vide a exactement deux champs
+    numériques séparés par delimiter (None : des espaces), sinon None.
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)          # paquet sans données
+            values = np.loadtxt(io.BytesIO(data), delimiter=delimiter, comments="#", ndmin=2)
+    except ValueError:
+        return None
+    if values.size == 0:
+        return np.zeros((0, 2))
+    return values if values.shape[1] == 2 else None
+
+
+def _parse_lines(data, strict, first_line):
+    """Règles exactes, ligne par ligne (paquets atypiques seulement)."""
+    points = []
+    text = data.decode("utf-8", errors="replace")
+    for offset, line in enumerate(text.split("\n")):
+        fields = line.split("#", 1)[0].replace(",", " ").replace(";", " ").split()
+        if not fields:
+            continue
+        try:
+            if strict and len(fields) != 2:
+                raise ValueError
+            x, y = float(fields[0]), float(fields[1])
+        except (ValueError, IndexError):
+            if strict:
+                raise ValueError(f"Ligne {first_line + offset} invalide : '{line.strip()}' "
+                                 f"(format attendu : x,y ou x y)") from None
+            continue
+        points.append((x, y))
+    return np.array(points, dtype=np.float64).reshape(-1, 2)
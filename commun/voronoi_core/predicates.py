@@ -0,0 +1,117 @@
+"""
+Prédicats géométriques exacts avec filtre flottant.
+
+Chaque prédicat calcule d'abord son déterminant en flottants, avec une borne
+de l'erreur d'arrondi (bornes de Shewchuk, « Adaptive Precision
+Floating-Point Arithmetic and Fast Robust Geometric Predicates », 1997) :
+si la valeur calculée dépasse la borne, son signe est sûr et elle est
+retournée telle quelle. Sinon (points alignés, cocirculaires ou presque), le
+déterminant est recalculé exactement en entiers Python : les coordonnées sont
+des flottants, donc des entiers multipliés par une puissance de deux, et les
+déterminants sont homogènes : les ramener toutes au même exposant ne change
+pas leur signe.
+
+Le signe du résultat est toujours exact ; aucune tolérance EPS à régler. Le
+cas exact est rare sur des points quelconques et ne coûte que quelques
+microsecondes sur des grilles.
+
+  orient2d(ax, ay, bx, by, cx, cy)  > 0 si a, b, c tournent dans le sens
+                                    trigonométrique, < 0 sens horaire, 0 alignés ;
+  incircle(ax, ay, ..., dx, dy)     > 0 si d est dans le cercle de a, b, c
+                                    (sens trigonométrique), < 0 dehors, 0 dessus ;
+  closer(px, py, ax, ay, bx, by)    > 0 si p est plus proche de a que de b,
+                                    < 0 plus proche de b, 0 sur la médiatrice.
+"""
+
+import math
+
+_EPS = 2.0 ** -53
+_ORIENT_BOUND = (3.0 + 16.0 * _EPS) * _EPS
+_INCIRCLE_BOUND = (10.0 + 96.0 * _EPS) * _EPS
+_CLOSER_BOUND = (8.0 + 64.0 * _EPS) * _EPS
+
+exact_calls = 0                    # nombre de recours au calcul exact (diagnostic)
+
+
+def orient2d(ax, ay, bx, by, cx, cy):
+    """Deux fois l'aire signée du triangle abc (signe exact)."""
+    left = (ax - cx) * (by - cy)
+    right = (ay - cy) * (bx - cx)
+    det = left - right
+    if (left > 0.0 and right <= 0.0) or (left < 0.0 and right >= 0.0):
+        return det                                   # termes de signes opposés : pas d'annulation
+    bound = _ORIENT_BOUND * abs(left + right)
+    if det > bound or -det > bound:
+        return det
+    return _exact(_orient_exact, 2, ax, ay, bx, by, cx, cy)
+
+
+def incircle(ax, ay, bx, by, cx, cy, dx, dy):
+    """Déterminant du test du cercle : signe de la position de d (abc direct)."""
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+    bc1, bc2 = bdx * cdy, cdx * bdy
+    ca1, ca2 = cdx * ady, adx * cdy
+    ab1, ab2 = adx * bdy, bdx * ady
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+    det = alift * (bc1 - bc2) + blift * (ca1 - ca2) + clift * (ab1 - ab2)
+    permanent = ((abs(bc1) + abs(bc2)) * alift + (abs(ca1) + abs(ca2)) * blift
+                 + (abs(ab1) + abs(ab2)) * clift)
+    bound = _INCIRCLE_BOUND * permanent
+    if det > bound or -det > bound:
+        return det
+    return _exact(_incircle_exact, 4, ax, ay, bx, by, cx, cy, dx, dy)
+
+
+def closer(px, py, ax, ay, bx, by):
+    """|p - b|² - |p - a|² (signe exact)."""
+    pax, pay = px - ax, py - ay
+    pbx, pby = px - bx, py - by
+    da = pax * pax + pay * pay
+    db = pbx * pbx + pby * pby
+    det = db - da
+    bound = _CLOSER_BOUND * (da + db)
+    if det > bound or -det > bound:
+        return det
+    return _exact(_closer_exact, 2, px, py, ax, ay, bx, by)
+
+
+def _exact(function, degree, *coordinates):
+    """function (polynôme homogène de degré degree) calculée exactement, arrondie en flottant."""
+    global exact_calls
+    exact_calls += 1
+    coordinates = list(map(float, coordinates))
+    if all(map(float.is_integer, coordinates)):      # grilles entières : pas de mise à l'échelle
+        scale = 1
+        value = function(*map(int, coordinates))
+    else:
+        ratios = list(map(float.as_integer_ratio, coordinates))
+        scale = max([d for _, d in ratios])           # dénominateurs : puissances de 2
+        value = function(*[n * (scale // d) for n, d in ratios])
+    try:
+        result = value / scale ** degree              # division entière correctement arrondie
+    except OverflowError:
+        return math.inf if value > 0 else -math.inf   # value : entier trop grand pour un flottant
+    if result == 0.0 and value != 0:
+        result = 5e-324 if value > 0 else -5e-324    # signe conservé malgré le dépassement inférieur
+    return result
+
+
+def _orient_exact(ax, ay, bx, by, cx, cy):
+    return (ax - cx) * (by - cy) - (ay - cy) * (bx - cx)
+
+
+def _incircle_exact(ax, ay, bx, by, cx, cy, dx, dy):
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+    return ((adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+            + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+            + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady))
+
+
+def _closer_exact(px, py, ax, ay, bx, by):
+    return (px - bx) ** 2 + (py - by) ** 2 - (px - ax) ** 2 - (py - ay) ** 2
@@ -0,0 +1,60 @@
+"""
+Tracé groupé des arêtes avec matplotlib.
+
+Un appel à plot par arête crée un artiste Line2D chacun : au-delà de quelques
+milliers d'arêtes, le tracé prend plus de temps que le calcul. Ici toutes les
+arêtes d'un diagramme forment une seule LineCollection, construite à partir
+d'un tableau (m, 4) x1 y1 x2 y2.
+
+Les arêtes plus courtes que min_pixels à l'écran (cadrage de l'axe déjà
+fixé) peuvent être écartées : elles ne changent pas l'image.
+
+matplotlib n'est importé qu'à la création de la collection.
+"""
+
+import numpy as np
+
+
+def polygon_edges(polygons):
+    """Côtés des polygones (liste de listes de sommets, fermeture implicite) en tableau (m, 4)."""
+    polygons = [p for p in polygons if len(p)]
+    if not polygons:
+        return np.zeros((0, 4))
+    sizes = np.array([len(p) for p in polygons])
+    vertices = np.concatenate([np.asarray(p, dtype=np.float64).reshape(-1, 2) for p in polygons])
+    following = np.arange(1, len(vertices) + 1)
+    ends = np.cumsum(sizes)
+    following[ends - 1] = ends - sizes          # dernier sommet → premier de son polygone
+    return np.hstack([vertices, vertices[following]])
+
+
+def visible_segments(segments, ax, min_pixels):
+    """Segments (m, 4) d'au moins min_pixels de long une fois tracés dans ax."""
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    if min_pixels <= 0 or len(segments) == 0:
+        return segments
+    pixels = ax.transData.transform(segments.reshape(-1, 2)).reshape(-1, 4)
+    length = np.hypot(pixels[:, 2] - pixels[:, 0], pixels[:, 3] - pixels[:, 1])
+    return segments[length >= min_pixels]
+
+
+def segment_collection(segments, ax=None, min_pixels=0.0, **style):
+    """
+    LineCollection des segments (m, 4), avec le style donné (colors,
+    linewidths, zorder...). Avec ax, la collection y est ajoutée et, si
+    min_pixels > 0, les segments de moins de min_pixels à l'écran sont
+    écartés.
+
+    La longueur à l'écran dépend de l'échelle de ax : ses limites (xlim,
+    ylim) et son rapport d'aspect doivent être fixés avant l'appel, sinon
+    la décimation se fait avec le cadrage par défaut.
+    """
+    from matplotlib.collections import LineCollection
+
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    if ax is not None:
+        segments = visible_segments(segments, ax, min_pixels)
+    collection = LineCollection(segments.reshape(-1, 2, 2), **style)
+    if ax is not None:
+        ax.add_collection(collection, autolim=False)
+    return collection
@@ -0,0 +1,30 @@
+"""
+Découpage de segments à une boîte, en tableaux numpy.
+
+Les arêtes d'un diagramme (tableau (m, 4) x1 y1 x2 y2, demi-droites
+remplacées par des segments très longs) sont ramenées au cadre affiché en
+une seule passe (Liang–Barsky), sans boucle Python par arête.
+"""
+
+import numpy as np
+
+
+def clip_segments(segs, xmn, xmx, ymn, ymx):
+    """
+    Découpe un tableau de segments (m, 4) x1 y1 x2 y2 à la boîte : retourne
+    (segments découpés (m, 4), keep), keep[i] étant False si le segment i est
+    hors de la boîte (sa ligne n'a alors pas de sens).
+    """
+    segs = np.asarray(segs, dtype=np.float64).reshape(-1, 4)
+    x1, y1, x2, y2 = segs.T
+    dx, dy = x2 - x1, y2 - y1
+    # Le segment x1 + t·dx (t dans [0, 1]) est dans la boîte si p·t <= q pour les 4 bords
+    p = np.stack([-dx, dx, -dy, dy])
+    q = np.stack([x1 - xmn, xmx - x1, y1 - ymn, ymx - y1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = q / p
+    t0 = np.maximum(0.0, np.where(p < 0, t, 0.0).max(axis=0))   # entrée dans la boîte
+    t1 = np.minimum(1.0, np.where(p > 0, t, 1.0).min(axis=0))   # sortie
+    keep = (t0 <= t1) & ~((p == 0) & (q < 0)).any(axis=0)      # parallèle à un bord, dehors
+    clipped = np.column_stack([x1 + t0 * dx, y1 + t0 * dy, x1 + t1 * dx, y1 + t1 * dy])
+    return clipped, keep
@@ -0,0 +1,287 @@
+"""
+Diagramme de Voronoï par tuiles, pour des jeux de points plus gros que la
+mémoire.
+
+La boîte est découpée en nx × ny tuiles égales. Une première passe lit les
+points par blocs (fichier texte ou binaire, voir points_io) et les range dans
+un fichier par tuile (indice global, x, y). Chaque tuile est ensuite traitée
+seule : ses points et ceux des tuiles voisines à moins d'une largeur de halo
+sont chargés, les cellules des points de la tuile sont calculées par
+découpage (moteur "clipping", geometry.VoronoiClipper de la variante gemini)
+et écrites dans un fichier .npz par tuile. La mémoire utilisée dépend de la
+taille des tuiles, pas du nombre total de points, et les tuiles peuvent être
+traitées en parallèle (un processus par tuile).
+
+Exactitude : la cellule calculée avec les seuls points chargés contient la
+vraie cellule. Elle lui est égale si aucun point non chargé n'est plus proche
+d'un de ses sommets v que son site p : il suffit que le disque de centre v
+passant par p tienne dans la zone chargée (les tuiles du bord s'étendent
+jusqu'à l'infini, puisque les points hors de la boîte y sont rangés). Les
+cellules qui ne passent pas ce test sont recalculées avec un halo deux fois
+plus large, jusqu'à ce que toutes le passent (au pire, le halo finit par
+couvrir toute la grille).
+
+Résultat (dossier output_dir) :
+  tiles.json          boîte, nx, ny, nombre de points, et pour chaque tuile
+                      son fichier, son nombre de points, le nombre de passes
+                      et la largeur du dernier halo ;
+  tile_I_J.npz        sites (indices globaux des points de la tuile),
+                      cell_vertices, cell_offsets (même disposition que
+                      engines.VoronoiResult).
+
+  python -m voronoi_core.tiles points.vpts cellules/ --tile-points 100000 --workers 8
+"""
+
+import argparse
+import json
+import math
+import os
+import shutil
+import tempfile
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from voronoi_core.engines import default_bbox, load_module, pack_cells
+from voronoi_core.points_io import BLOCK_POINTS, iter_point_blocks
+
+TILE_POINTS = 100_000              # nombre moyen de points visé par tuile
+MANIFEST = "tiles.json"
+
+_RECORD = np.dtype([("index", "<i8"), ("xy", "<f8", (2,))])
+HALO_SPACINGS = 6                  # largeur du halo de départ, en distances moyennes entre points
+_MARGIN = 1e-9                     # marge relative du test d'exactitude
+
+TileGrid = namedtuple("TileGrid", ["bbox", "nx", "ny", "count"])
+
+
+def tiled_voronoi(source, output_dir, bbox=None, tile_points=TILE_POINTS, tiles=None,
+                  max_workers=1, block_size=BLOCK_POINTS):
+    """
+    Cellules de Voronoï de tous les points de source (chemin d'un fichier de
+    points ou tableau (n, 2), par exemple un numpy.memmap), découpées à bbox
+    (par défaut, celle des points élargie comme engines.default_bbox), écrites
+    tuile par tuile dans output_dir. tiles : (nx, ny) ; par défaut, choisi pour
+    environ tile_points points par tuile. max_workers : processus traitant les
+    tuiles. Retourne un TileGrid.
+    """
+    if bbox is None:
+        bbox = _stream_bbox(source, block_size)
+    bbox = tuple(float(v) for v in bbox)
+    os.makedirs(output_dir, exist_ok=True)
+    bucket_dir = tempfile.mkdtemp(prefix="buckets-", dir=output_dir)
+    try:
+        count = _count_points(source, block_size) if tiles is None else None
+        nx, ny = tiles if tiles is not None else _tile_shape(bbox, count, tile_points)
+        grid = TileGrid(bbox, int(nx), int(ny), 0)
+        grid = grid._replace(count=_bucket_points(source, grid, bucket_dir, block_size))
+
+        tasks = [(bucket_dir, output_dir, grid, i, j) for j in range(grid.ny) for i in range(grid.nx)]
+        if max_workers == 1:
+            summaries = list(map(_process_tile, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                summaries = list(executor.map(_process_tile, tasks))
+    finally:
+        shutil.rmtree(bucket_dir, ignore_errors=True)
+
+    manifest = {"bbox": list(grid.bbox), "nx": grid.nx, "ny": grid.ny, "count": grid.count, "tiles": summaries}
+    with open(os.path.join(output_dir, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=1)
+    return grid
+
+
+def iter_tile_cells(output_dir):
+    """
+    Relit le résultat de tiled_voronoi, une tuile à la fois : des triplets
+    (sites, cell_vertices, cell_offsets).
+    """
+    with open(os.path.join(output_dir, MANIFEST)) as f:
+        manifest = json.load(f)
+    for tile in manifest["tiles"]:
+        with np.load(os.path.join(output_dir, tile["file"])) as data:
+            yield data["sites"], data["cell_vertices"], data["cell_offsets"]
+
+
+def halo_bounds(grid, i, j, width):
+    """
+    Zone de la tuile (i, j) élargie de width de chaque côté : (xlow, ylow,
+    xhigh, yhigh). Un côté qui atteint le bord de la grille devient infini :
+    les points hors de la boîte sont rangés dans les tuiles du bord.
+    """
+    xmin, ymin, xmax, ymax = grid.bbox
+    tile_width, tile_height = (xmax - xmin) / grid.nx, (ymax - ymin) / grid.ny
+    xlow, xhigh = xmin + i * tile_width - width, xmin + (i + 1) * tile_width + width
+    ylow, yhigh = ymin + j * tile_height - width, ymin + (j + 1) * tile_height + width
+    return (xlow if xlow > xmin else -math.inf, ylow if ylow > ymin else -math.inf,
+            xhigh if xhigh < xmax else math.inf, yhigh if yhigh < ymax else math.inf)
+
+
+def exact_cells(cells, sites, bounds, scale):
+    """
+    Masque des cellules prouvées exactes : pour chaque sommet v de la cellule
+    du site p, le disque de centre v passant par p tient dans bounds (zone où
+    tous les points ont été pris en compte). scale : taille de la boîte, pour
+    la marge d'arrondi.
+    """
+    xlow, ylow, xhigh, yhigh = bounds
+    exact = np.ones(len(cells), dtype=bool)
+    for position, (cell, site) in enumerate(zip(cells, sites)):
+        if not len(cell):
+            continue
+        vertices = np.asarray(cell, dtype=np.float64)
+        radius = np.hypot(vertices[:, 0] - site[0], vertices[:, 1] - site[1])
+        room = np.minimum(np.minimum(vertices[:, 0] - xlow, xhigh - vertices[:, 0]),
+                          np.minimum(vertices[:, 1] - ylow, yhigh - vertices[:, 1]))
+        exact[position] = np.all(room > radius * (1 + _MARGIN) + _MARGIN * scale)
+    return exact
+
+
+# ── Passes sur les points ────────────────────────────────────────────────────
+
+def _blocks(source, block_size):
+    if isinstance(source, (str, os.PathLike)):
+        yield from iter_point_blocks(source, block_size=block_size)
+        return
+    points = np.asarray(source).reshape(-1, 2)
+    for start in range(0, len(points), block_size):
+        yield points[start:start + block_size]
+
+
+def _stream_bbox(source, block_size):
+    low, high = np.full(2, math.inf), np.full(2, -math.inf)
+    for block in _blocks(source, block_size):
+        if len(block):
+            low = np.minimum(low, block.min(axis=0))
+            high = np.maximum(high, block.max(axis=0))
+    if not np.all(np.isfinite(low)):
+        return default_bbox(np.zeros((0, 2)))
+    return default_bbox(np.vstack([low, high]))
+
+
+def _count_points(source, block_size):
+    if not isinstance(source, (str, os.PathLike)):
+        return len(np.asarray(source).reshape(-1, 2))
+    return sum(len(block) for block in _blocks(source, block_size))
+
+
+def _tile_shape(bbox, count, tile_points):
+    """(nx, ny) pour des tuiles à peu près carrées d'environ tile_points points."""
+    xmin, ymin, xmax, ymax = bbox
+    tile_count = max(1, math.ceil(count / tile_points))
+    nx = max(1, round(math.sqrt(tile_count * (xmax - xmin) / (ymax - ymin))))
+    return nx, max(1, math.ceil(tile_count / nx))
+
+
+def _tile_index(grid, xy):
+    xmin, ymin, xmax, ymax = grid.bbox
+    i = np.floor((xy[:, 0] - xmin) / ((xmax - xmin) / grid.nx))
+    j = np.floor((xy[:, 1] - ymin) / ((ymax - ymin) / grid.ny))
+    # Points hors de la boîte : dans les tuiles du bord
+    return (np.clip(i, 0, grid.nx - 1).astype(np.int64),
+            np.clip(j, 0, grid.ny - 1).astype(np.int64))
+
+
+def _bucket_path(bucket_dir, i, j):
+    return os.path.join(bucket_dir, f"{i}_{j}.bin")
+
+
+def _bucket_points(source, grid, bucket_dir, block_size):
+    """Range les points dans un fichier par tuile ; retourne leur nombre."""
+    count = 0
+    for block in _blocks(source, block_size):
+        records = np.empty(len(block), dtype=_RECORD)
+        records["index"] = np.arange(count, count + len(block))
+        records["xy"] = block
+        count += len(block)
+        i, j = _tile_index(grid, records["xy"])
+        tile = j * grid.nx + i
+        order = np.argsort(tile, kind="stable")
+        tile, records = tile[order], records[order]
+        starts = np.flatnonzero(np.diff(tile, prepend=-1))
+        for start, end in zip(starts, np.append(starts[1:], len(tile))):
+            with open(_bucket_path(bucket_dir, tile[start] % grid.nx, tile[start] // grid.nx), "ab") as f:
+                records[start:end].tofile(f)
+    return count
+
+
+def _read_bucket(bucket_dir, i, j):
+    path = _bucket_path(bucket_dir, i, j)
+    if not os.path.exists(path):
+        return np.zeros(0, dtype=_RECORD)
+    return np.fromfile(path, dtype=_RECORD)
+
+
+# ── Traitement d'une tuile ───────────────────────────────────────────────────
+
+def _process_tile(task):
+    """Calcule et écrit les cellules d'une tuile ; retourne son résumé pour le manifeste."""
+    bucket_dir, output_dir, grid, i, j = task
+    started = time.perf_counter()
+    own = _read_bucket(bucket_dir, i, j)
+    cells = [None] * len(own)
+    pending = np.arange(len(own))
+    xmin, ymin, xmax, ymax = grid.bbox
+    scale = max(xmax - xmin, ymax - ymin)
+    clipper = _load_clipper()(bounding_box=grid.bbox)
+    # Largeur du halo de départ : quelques distances moyennes entre points de la tuile
+    width = HALO_SPACINGS * math.sqrt((xmax - xmin) * (ymax - ymin) / (grid.nx * grid.ny) / max(len(own), 1))
+
+    rounds = 0
+    while len(pending):
+        rounds += 1
+        bounds = halo_bounds(grid, i, j, width)
+        # Points de la tuile d'abord : leurs positions sont les mêmes dans local
+        local = np.concatenate([own["xy"]] + list(_halo_points(bucket_dir, grid, i, j, bounds)))
+        computed = clipper.compute_cells(local, site_indices=pending.tolist())
+        exact = exact_cells(computed, own["xy"][pending], bounds, scale)
+        for position, cell in zip(pending[exact], (c for c, e in zip(computed, exact) if e)):
+            cells[position] = cell
+        pending = pending[~exact]
+        width *= 2
+        del local, computed
+
+    name = f"tile_{i}_{j}.npz"
+    vertices, offsets = pack_cells(cells)
+    np.savez(os.path.join(output_dir, name), sites=own["index"], cell_vertices=vertices, cell_offsets=offsets)
+    return {"i": i, "j": j, "file": name, "points": len(own), "rounds": rounds,
+            "halo": width / 2 if rounds else 0.0, "seconds": round(time.perf_counter() - started, 3)}
+
+
+def _halo_points(bucket_dir, grid, i, j, bounds):
+    """Points des tuiles voisines situés dans bounds, une tuile lue à la fois."""
+    xlow, ylow, xhigh, yhigh = bounds
+    corners = np.array([[max(xlow, grid.bbox[0]), max(ylow, grid.bbox[1])],
+                        [min(xhigh, grid.bbox[2]), min(yhigh, grid.bbox[3])]])
+    (i0, i1), (j0, j1) = _tile_index(grid, corners)
+    for b in range(j0, j1 + 1):
+        for a in range(i0, i1 + 1):
+            if (a, b) == (i, j):
+                continue
+            xy = _read_bucket(bucket_dir, a, b)["xy"]
+            inside = (xy[:, 0] >= xlow) & (xy[:, 0] <= xhigh) & (xy[:, 1] >= ylow) & (xy[:, 1] <= yhigh)
+            yield xy[inside]
+
+
+def _load_clipper():
+    return load_module("_voronoi_engine_clipping", "phase2/voronoi_gemini/voronoi/voronoi_app/geometry.py").VoronoiClipper
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cellules de Voronoï d'un gros fichier de points, tuile par tuile.")
+    parser.add_argument("source", help="fichier de points (texte ou binaire)")
+    parser.add_argument("output", help="dossier des résultats")
+    parser.add_argument("--tile-points", type=int, default=TILE_POINTS, help="nombre moyen de points par tuile")
+    parser.add_argument("--workers", type=int, default=1, help="processus traitant les tuiles")
+    parser.add_argument("--bbox", help="xmin,ymin,xmax,ymax (défaut : boîte des points élargie)")
+    args = parser.parse_args(argv)
+    bbox = [float(v) for v in args.bbox.split(",")] if args.bbox else None
+    grid = tiled_voronoi(args.source, args.output, bbox=bbox, tile_points=args.tile_points,
+                         max_workers=args.workers)
+    print(f"{grid.count} points, {grid.nx} × {grid.ny} tuiles écrites dans {args.output}")
+
+
+if __name__ == "__main__":
+    main()
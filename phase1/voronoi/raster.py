@@ -0,0 +1,33 @@
+import numpy as np
+
+from voronoi_core.kdtree import KDTree
+
+
+def compute_grid(xs, ys, max_x, max_y, resolution=500, max_bytes=64 * 1024 * 1024):
+    """
+    Calcule la grille de Voronoi (méthode de la grille) de façon vectorisée.
+
+    grille[ligne][colonne] = indice du point le plus proche du pixel, le pixel
+    (ligne, colonne) ayant pour coordonnées ((colonne / resolution) * max_x,
+    (ligne / resolution) * max_y), comme dans la boucle d'origine.
+
+    Toute la grille est une seule requête groupée sur un kd-tree des points
+    (voir KDTree.nearest_grid) : seuls les points proches de chaque tuile de
+    pixels sont comparés, et aucun tableau ne dépasse max_bytes octets.
+    """
+    points = np.column_stack([np.asarray(xs, dtype=np.float64),
+                              np.asarray(ys, dtype=np.float64)])
+
+    grille = np.zeros((resolution, resolution), dtype=np.intp)
+    if len(points) == 0:
+        return grille
+
+    x_pixels = (np.arange(resolution) / resolution) * max_x  # produit en croix
+    y_pixels = (np.arange(resolution) / resolution) * max_y
+
+    grille, distances = KDTree(points).nearest_grid(x_pixels, y_pixels, max_bytes=max_bytes,
+                                                    return_distance=True)
+    # La boucle d'origine partait de distance_min = 100000 : si aucun point
+    # n'est plus proche que ça, le pixel gardait l'indice 0.
+    grille[distances >= 100000.0 ** 2] = 0
+    return grille
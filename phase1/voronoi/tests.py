@@ -1,4 +1,7 @@
+from math import sqrt
+
 from voronoi import Point
+from raster import compute_grid
 
 def test_point_init():
     # Arrange
@@ -52,4 +55,52 @@ def test_point_truediv():
 
     # Assert
     assert p_res.x == 1.0
-    assert p_res.y == 2.0
\ No newline at end of file
+    assert p_res.y == 2.0
+
+
+def grille_boucle(points, max_x, max_y, resolution):
+    """Ancienne boucle Python de generate_voronoi, sert de référence."""
+    grille = [[0 for k in range(resolution)] for k in range(resolution)]
+    for ligne in range(resolution):
+        for colonne in range(resolution):
+            x_pixel = (colonne / resolution)*max_x
+            y_pixel = (ligne / resolution)*max_y
+            distance_min = 100000
+            for i in range(len(points)):
+                distance_x = x_pixel - points[i][0]
+                distance_y = y_pixel - points[i][1]
+                distance_final = sqrt(distance_x*distance_x + distance_y*distance_y)
+                if distance_final < distance_min:
+                    distance_min = distance_final
+                    grille[ligne][colonne] = i
+    return grille
+
+def test_compute_grid_identique_boucle():
+    # Arrange
+    points = [(2, 4), (5.3, 4.5), (18, 29), (12.5, 23.7), (2, 17), (5.3, 4.5)]
+
+    # Act
+    grille = compute_grid([p[0] for p in points], [p[1] for p in points], 19, 30, 60,
+                          max_bytes=10000)
+
+    # Assert
+    assert grille.tolist() == grille_boucle(points, 19, 30, 60)
+
+def test_compute_grid_grille_reguliere():
+    # Arrange : points à égale distance de nombreux pixels (égalités)
+    points = [(x, y) for x in range(0, 20, 4) for y in range(0, 20, 4)]
+
+    # Act
+    grille = compute_grid([p[0] for p in points], [p[1] for p in points], 17, 17, 50)
+
+    # Assert
+    assert grille.tolist() == grille_boucle(points, 17, 17, 50)
+
+def test_compute_grid_sans_point():
+    # Act
+    grille = compute_grid([], [], 1, 1, 10)
+
+    # Assert
+    assert grille.shape == (10, 10)
+    assert (grille == 0).all()
+
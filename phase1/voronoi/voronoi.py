@@ -1,10 +1,15 @@
+import os
+import sys
 import tkinter
 from tkinter import filedialog
 from pathlib import Path
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.backends._backend_tk import NavigationToolbar2Tk
-from math import sqrt
+
+# Code partagé entre les versions du projet (dossier commun/ à la racine du dépôt)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "commun"))
+from raster import compute_grid
 
 
 class Point:
@@ -81,32 +86,12 @@ def generate_voronoi(file = None):
     max_points_x += 1
     max_points_y += 1
     resolution = 500
-    grille = [[0 for k in range(resolution)] for k in range(resolution)] #[[0,0,...,0],[0,..,0],...]
-
-    for ligne in range(resolution):
-        for colonne in range(resolution):
-            """
-            calcule de Voronoi, methode de la grille
-            """
-            x_pixel = (colonne / resolution)*max_points_x #produit en croix pour pixel en coordonnées
-            y_pixel = (ligne / resolution)*max_points_y
-            distance_min = 100000 
-            index_point_proche = 0
-            
-            for i in range(len(tab_points)):
-                """
-                on teste tout les points les plus proche de chaque pixel dans le tab_points
-                """
-                point = tab_points[i]  
-                distance_x = x_pixel - point.x
-                distance_y = y_pixel - point.y
-                distance_final = sqrt(distance_x*distance_x + distance_y*distance_y) #formule distance entre 2 points
-                
-                if distance_final < distance_min:
-                    distance_min = distance_final
-                    index_point_proche = i
-            
-            grille[ligne][colonne] = index_point_proche
+    """
+    calcule de Voronoi, methode de la grille : pour chaque pixel, indice du
+    point le plus proche (calcul vectorisé avec numpy, voir raster.py)
+    """
+    grille = compute_grid([point.x for point in tab_points], [point.y for point in tab_points],
+                          max_points_x, max_points_y, resolution)
 
     #plt.figure(figsize=(5,8))
     plot1.imshow(grille, extent=(0, max_points_x, 0, max_points_y), origin='lower') #affiche frontière voronoie en coloriant à chaque fois que le x,y de chaque pixel de la grille change
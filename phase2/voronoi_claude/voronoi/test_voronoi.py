@@ -2,16 +2,16 @@
 Tests unitaires — Diagramme de Voronoï (Fortune's Sweep Line)
 Couverture :
   • Point
-  • Event (ordre de priorité)
+  • EventQueue (ordre de priorité, annulation, compteurs)
   • circumcenter
   • _par_inter (intersection de paraboles)
   • FortuneAlgorithm  (cas limites + propriétés mathématiques)
-  • clip_seg (Cohen-Sutherland)
+  • clip_seg (Liang–Barsky), clip_segments (Liang–Barsky vectorisé)
   • collect_segments
   • Lecture de fichier points
 """
 
-import sys, types, math, os, tempfile, importlib
+import sys, types, math, os, random, tempfile, importlib
 import pytest
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -66,6 +66,7 @@ except ImportError:
 # Ajouter le répertoire courant au path
 sys.path.insert(0, os.path.dirname(__file__))
 import voronoi_gui as vg
+from voronoi_core.points_io import parse_points   # chemin ajouté par voronoi_gui
 
 # ═════════════════════════════════════════════════════════════════════════════
 # Helpers
@@ -122,29 +123,46 @@ class TestPoint:
 # 2. Event (ordre de priorité dans le heap)
 # ═════════════════════════════════════════════════════════════════════════════
 
-class TestEvent:
+class TestEventQueue:
     def test_ordre_par_x(self):
-        e1 = vg.Event(1.0, P(1, 5))
-        e2 = vg.Event(2.0, P(2, 3))
-        assert e1 < e2
+        q = vg.EventQueue()
+        q.push(2.0, 3.0, P(2, 3)); q.push(1.0, 5.0, P(1, 5))
+        assert q.pop()[0] == 1.0 and q.pop()[0] == 2.0 and q.pop() is None
 
     def test_egalite_x_tri_par_y(self):
-        e1 = vg.Event(5.0, P(5, 1))
-        e2 = vg.Event(5.0, P(5, 3))
-        assert e1 < e2
+        q = vg.EventQueue([vg.Site(5, 3, 0), vg.Site(5, 1, 1)])
+        assert q.pop()[3].index == 1
 
-    def test_valid_par_defaut(self):
-        e = vg.Event(0.0, P(0, 0))
-        assert e.valid is True
+    def test_x_a_moins_de_eps_tri_par_y(self):
+        """Sites d'abscisses distantes de moins de EPS : même clé x, ordre par y."""
+        q = vg.EventQueue([vg.Site(1e-12, 0, 0), vg.Site(0, 10, 1), vg.Site(5, 5, 2)])
+        assert [q.pop()[3].index for _ in range(3)] == [0, 1, 2]
 
     def test_arc_none_pour_site_event(self):
-        e = vg.Event(10.0, P(10, 10))
-        assert e.arc is None
+        q = vg.EventQueue([vg.Site(10, 10, 0)])
+        assert q.pop()[4] is None
 
     def test_arc_non_none_pour_circle_event(self):
         arc = vg.Arc(P(0, 0))
-        e   = vg.Event(5.0, P(5, 5), arc=arc)
-        assert e.arc is arc
+        q   = vg.EventQueue()
+        q.push(5.0, 5.0, P(5, 5), arc)
+        assert q.pop()[4] is arc
+
+    def test_annulation_retire_l_evenement(self):
+        q = vg.EventQueue()
+        entries = [q.push(float(i), 0.0, P(i, 0), vg.Arc(P(0, 0))) for i in range(10)]
+        for e in entries[:6]:
+            q.cancel(e)
+        assert len(q) == 4 and len(q.heap) == 4          # compacté dès la moitié annulée
+        assert [q.pop()[0] for _ in range(4)] == [6.0, 7.0, 8.0, 9.0]
+        assert q.stats() == {"pushes": 10, "pops": 4, "cancellations": 6, "compactions": 1, "max_size": 10}
+
+    def test_compteurs_du_calcul(self):
+        fa = vg.FortuneAlgorithm([P(x, y) for x, y in _random_coords(500, 4)])
+        fa.compute()
+        q = fa.queue
+        assert len(q) == 0 and q.pushes == q.pops + q.cancellations
+        assert q.max_size <= 2 * 500
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -225,9 +243,18 @@ class TestParInter:
         y = vg._par_inter(p1, p2, 0.0)
         assert isinstance(y, float)
 
+    def test_ordre_des_points_de_rupture(self):
+        """
+        Arc de p1 puis arc de p2 (vers les y croissants) : le point de rupture
+        (p1, p2) est sous le foyer le plus proche de la sweep line, (p2, p1)
+        au-dessus → la beach line reste ordonnée.
+        """
+        p1, p2 = P(0, 0), P(5, 10)
+        assert vg._par_inter(p1, p2, 6.0) < p2.y < vg._par_inter(p2, p1, 6.0)
+
 
 # ═════════════════════════════════════════════════════════════════════════════
-# 5. clip_seg (Cohen-Sutherland)
+# 5. clip_seg (Liang–Barsky)
 # ═════════════════════════════════════════════════════════════════════════════
 
 class TestClipSeg:
@@ -285,6 +312,28 @@ class TestClipSeg:
         assert r is None
 
 
+class TestClipSegments:
+    """Version vectorisée : mêmes résultats que clip_seg, segment par segment."""
+    BB = (0, 100, 0, 100)
+
+    def test_identique_a_clip_seg(self):
+        rng = np.random.default_rng(0)
+        segs = rng.uniform(-50, 150, (2000, 4))
+        segs[:100, 2] = segs[:100, 0]                 # verticaux
+        segs[100:200, 3] = segs[100:200, 1]           # horizontaux
+        clipped, keep = vg.clip_segments(segs, *self.BB)
+        for s, c, k in zip(segs, clipped, keep):
+            r = vg.clip_seg(s[:2], s[2:], *self.BB)
+            if r is None:
+                assert not k or math.hypot(c[2] - c[0], c[3] - c[1]) < 1e-9
+            else:
+                assert k and np.allclose(np.ravel(r), c, atol=1e-6)
+
+    def test_tableau_vide(self):
+        clipped, keep = vg.clip_segments(np.empty((0, 4)), *self.BB)
+        assert clipped.shape == (0, 4) and keep.shape == (0,)
+
+
 # ═════════════════════════════════════════════════════════════════════════════
 # 6. FortuneAlgorithm — Structure du diagramme
 # ═════════════════════════════════════════════════════════════════════════════
@@ -331,6 +380,26 @@ class TestFortuneStructure:
         diag, pts = voronoi(coords)
         assert len(diag.faces) == 16
 
+    def test_premiere_colonne_presque_verticale(self):
+        """Premiers sites à x presque égal mais pas dans l'ordre des y : un sommet, trois arêtes."""
+        diag, _ = voronoi([(1e-12, 0), (0, 10), (5, 5)])
+        assert len(diag.edges) == 3 and len(diag.vertices) == 1
+        v = diag.vertices[0]
+        assert (v.x, v.y) == (pytest.approx(0, abs=EPS), pytest.approx(5))
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_grille_5x5_bruitee(self, seed):
+        """Grille 5×5 à ±1e-11 près : deux voisins de la grille partagent une arête."""
+        rng = random.Random(seed)
+        coords = [(x * 10 + rng.uniform(-1e-11, 1e-11), y * 10 + rng.uniform(-1e-11, 1e-11))
+                  for x in range(5) for y in range(5)]
+        diag, _ = voronoi(coords)
+        paires = {frozenset((he.face.site.index, het.face.site.index)) for he, het in diag.edges}
+        voisins = ({frozenset((5 * x + y, 5 * x + y + 1)) for x in range(5) for y in range(4)}
+                   | {frozenset((5 * x + y, 5 * x + y + 5)) for x in range(4) for y in range(5)})
+        assert voisins <= paires
+        assert len(diag.faces) == 25
+
     def test_grand_nombre_de_points(self):
         """50 points aléatoires → autant de faces que de sites."""
         import random
@@ -347,12 +416,67 @@ class TestFortuneStructure:
         assert len(diag.faces) == 8
 
     def test_point_unique(self):
-        """Un seul point → beach line initialisée, pas d'arêtes."""
+        """Un seul point → beach line initialisée, pas d'arêtes, une face (tout le plan)."""
         pts = [P(5, 5)]
         fa  = vg.FortuneAlgorithm(pts)
         fa.compute()
         assert len(fa.diagram.edges) == 0
-        assert len(fa.diagram.faces) == 0
+        assert len(fa.diagram.faces) == 1
+        assert fa.diagram.faces[0].halfedges == []
+
+    def test_faces_dans_l_ordre_des_sites(self):
+        """faces[i] est la cellule du i-ème point d'entrée."""
+        coords = [(50, 10), (0, 0), (10, 40), (30, 25), (45, 45)]
+        diag, _ = voronoi(coords)
+        assert [(f.site.x, f.site.y) for f in diag.faces] == coords
+        assert [f.site.index for f in diag.faces] == list(range(len(coords)))
+
+    def test_face_pointe_vers_ses_demi_aretes(self):
+        """Chaque demi-arête est rangée dans la face qu'elle borde, et une seule fois."""
+        diag, _ = voronoi([(0, 0), (10, 0), (5, 9), (20, 5), (3, 15)])
+        vues = 0
+        for f in diag.faces:
+            assert f.halfedges
+            for he in f.halfedges:
+                assert he.face is f
+            vues += len(f.halfedges)
+        assert vues == 2 * len(diag.edges)
+
+
+class TestDCELTableaux:
+    def test_tableaux_et_jumelles(self):
+        d = _run(_random_coords(60, 1), "tree").diagram
+        for arr in (d.origin, d.twin, d.face, d.next):
+            assert arr.dtype == np.int32 and len(arr) == d.half_count
+        assert d.half_count == 2 * len(d.edges)
+        assert (d.twin[d.twin] == np.arange(d.half_count)).all()
+        assert d.vertex_xy.dtype == np.float64 and len(d.vertex_xy) == d.point_count
+        he, het = d.edges[3]
+        assert he.twin == het and het.twin == he
+        assert he.face is d.faces[int(d.face[he.index])]
+
+    def test_next_fait_le_tour_des_cellules_bornees(self):
+        """Les cellules fermées : next boucle sur toutes leurs demi-arêtes, dans le sens trigo."""
+        coords = _random_coords(200, 2)
+        d = _run(coords, "tree").diagram
+        fermees = 0
+        for f in d.faces:
+            hs = [he.index for he in f.halfedges]
+            if any(d.next[h] < 0 for h in hs):
+                continue                          # cellule ouverte (bord du diagramme)
+            cycle, h = [], hs[0]
+            while True:
+                cycle.append(h); h = int(d.next[h])
+                if h == hs[0]: break
+                assert len(cycle) <= len(hs)
+            assert sorted(cycle) == sorted(hs)
+            for h in cycle:                       # arrivée de h = départ de next[h]
+                assert d.origin[d.twin[h]] == d.origin[d.next[h]]
+            poly = d.vertex_xy[d.origin[cycle]].tolist()
+            aire = sum(a[0]*b[1] - b[0]*a[1] for a, b in zip(poly, poly[1:] + poly[:1]))
+            assert aire > 0
+            fermees += 1
+        assert fermees > 100
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -495,6 +619,13 @@ class TestCollectSegments:
             length = math.hypot(x2 - x1, y2 - y1)
             assert length > 1e-9, f"Segment dégénéré trouvé : ({x1:.4f},{y1:.4f})→({x2:.4f},{y2:.4f})"
 
+    def test_tableau_identique_a_la_liste(self):
+        diag, _ = voronoi(_random_coords(300, 4))
+        segs = vg.collect_segments(diag, 100, 400, 0, 500)
+        arr = vg.collect_segments(diag, 100, 400, 0, 500, as_array=True)
+        assert arr.shape == (len(segs), 4)
+        assert np.array_equal(arr, np.array(segs).reshape(-1, 4))
+
     def test_boite_plus_petite_reduit_les_segments(self):
         """Une bbox plus petite ne doit jamais produire plus de segments."""
         coords = [(10, 10), (90, 10), (50, 90), (50, 50)]
@@ -503,6 +634,23 @@ class TestCollectSegments:
         segs_petit  = vg.collect_segments(diag,   20,  80,   20,  80)
         assert len(segs_petit) <= len(segs_grand)
 
+    @pytest.mark.parametrize("coords, attendus", [
+        ([(i * 10, j * 10) for i in range(6) for j in range(6)], 60),  # x égaux, sommets cocycliques
+        ([(0, 0), (0, 10), (0, 20)], 4),        # 2 droites entières, chacune en 2 demi-droites
+        ([(3 * i % 17 * 29.0, 7 * i % 23 * 21.0) for i in range(40)], None),
+    ])
+    def test_segments_sur_les_mediatrices(self, coords, attendus):
+        """Tout point d'un segment est à égale distance de ses deux sites les plus proches."""
+        diag, _ = voronoi(coords)
+        segs = vg.collect_segments(diag, -1000, 1500, -1000, 1500)
+        if attendus is not None:
+            assert len(segs) == attendus
+        for (x1, y1), (x2, y2) in segs:
+            for t in (0.25, 0.5, 0.75):
+                qx, qy = x1 + (x2 - x1) * t, y1 + (y2 - y1) * t
+                d = sorted(math.hypot(qx - x, qy - y) for x, y in coords)
+                assert d[1] - d[0] < 1e-6 * max(1.0, d[0])
+
 
 # ═════════════════════════════════════════════════════════════════════════════
 # 9. Lecture de fichier points
@@ -510,18 +658,10 @@ class TestCollectSegments:
 
 def _parse_points(text):
     """
-    Réimplémente la logique de parsing de voronoi_gui._load_file_path
-    sans GUI, pour les tests de parsing pur.
+    Lit le texte comme voronoi_gui.read_points_file lit un fichier (même
+    lecteur partagé voronoi_core.points_io, lignes invalides ignorées).
     """
-    pts = []
-    for line in text.splitlines():
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
-        parts = line.replace(';', ',').split(',')
-        if len(parts) >= 2:
-            pts.append(P(float(parts[0].strip()), float(parts[1].strip())))
-    return pts
+    return [P(x, y) for x, y in parse_points(text, strict=False).tolist()]
 
 
 class TestParsing:
@@ -559,15 +699,7 @@ class TestParsing:
             f.write(content)
             fname = f.name
         try:
-            pts = []
-            with open(fname) as fp:
-                for line in fp:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    parts = line.replace(';', ',').split(',')
-                    if len(parts) >= 2:
-                        pts.append(P(float(parts[0]), float(parts[1])))
+            pts = vg.read_points_file(fname)
             assert len(pts) == 3
             assert pts[2].x == pytest.approx(50.5)
         finally:
@@ -576,23 +708,9 @@ class TestParsing:
     def test_lignes_malformees_ignorees(self):
         """
         Une ligne avec un seul champ ou des valeurs non-numériques doit être
-        ignorée sans crash — le parsing doit wrapper les erreurs.
+        ignorée sans crash.
         """
-        def safe_parse(text):
-            pts = []
-            for line in text.splitlines():
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                parts = line.replace(";", ",").split(",")
-                if len(parts) >= 2:
-                    try:
-                        pts.append(P(float(parts[0].strip()), float(parts[1].strip())))
-                    except ValueError:
-                        pass  # ligne malformée ignorée
-            return pts
-
-        pts = safe_parse("10\n20, 30\nabc, def\n50, 60")
+        pts = _parse_points("10\n20, 30\nabc, def\n50, 60")
         # "10" → 1 seul champ, ignoré
         # "abc, def" → ValueError, ignoré
         # "20, 30" et "50, 60" → valides
@@ -600,6 +718,27 @@ class TestParsing:
         assert pts[0].x == pytest.approx(20)
         assert pts[1].x == pytest.approx(50)
 
+    def test_format_espace_et_commentaire_en_fin_de_ligne(self):
+        pts = _parse_points("10 20  # premier\n30;40")
+        assert [(p.x, p.y) for p in pts] == [(10, 20), (30, 40)]
+
+    def test_fichier_binaire_memmap(self):
+        """Un fichier binaire se lit comme un fichier texte ; Fortune accepte la vue memmap."""
+        from voronoi_core.points_bin import open_points_binary, write_points_binary
+        coords = [(10, 20), (50, 30), (80, 10), (40, 70), (60, 60)]
+        with tempfile.NamedTemporaryFile(suffix=".vpts", delete=False) as f:
+            fname = f.name
+        try:
+            write_points_binary(fname, coords)
+            assert [(p.x, p.y) for p in vg.read_points_file(fname)] == coords
+            fa = vg.FortuneAlgorithm(open_points_binary(fname).points)
+            fa.compute()
+            diag, _ = voronoi(coords)
+            assert [(v.x, v.y) for v in fa.diagram.vertices] == \
+                   [(v.x, v.y) for v in diag.vertices]
+        finally:
+            os.unlink(fname)
+
 
 # ═════════════════════════════════════════════════════════════════════════════
 # 10. Cas limites & robustesse
@@ -660,3 +799,250 @@ class TestCasLimites:
         diag2, _ = voronoi(coords)
         assert len(diag1.edges)    == len(diag2.edges)
         assert len(diag1.vertices) == len(diag2.vertices)
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+# 11. Beach line équilibrée (BeachLine) vs liste chaînée
+# ═════════════════════════════════════════════════════════════════════════════
+
+def _random_coords(n, seed):
+    import random
+    rng = random.Random(seed)
+    return [(rng.uniform(0, 500), rng.uniform(0, 500)) for _ in range(n)]
+
+
+def _run(coords, beachline):
+    fa = vg.FortuneAlgorithm([P(x, y) for x, y in coords], beachline=beachline)
+    fa.compute()
+    return fa
+
+
+class TestBeachLine:
+    def test_beachline_inconnue(self):
+        with pytest.raises(ValueError):
+            vg.FortuneAlgorithm([P(0, 0)], beachline="heap")
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_arbre_identique_a_la_liste(self, seed):
+        """Le treap doit trouver exactement les mêmes arcs que le parcours linéaire."""
+        coords = _random_coords(150, seed)
+        tree, lst = _run(coords, "tree"), _run(coords, "list")
+        assert [(v.x, v.y) for v in tree.diagram.vertices] == \
+               [(v.x, v.y) for v in lst.diagram.vertices]
+        assert len(tree.diagram.edges) == len(lst.diagram.edges)
+
+    def test_ordre_infixe_egal_liste_chainee(self):
+        """Après le balayage, l'ordre infixe du treap = la liste prev/next."""
+        fa = _run(_random_coords(80, 7), "tree")
+        infixe, pile, node = [], [], fa.beach.root
+        while pile or node:
+            while node:
+                pile.append(node); node = node.left
+            node = pile.pop(); infixe.append(node); node = node.right
+        chaine, arc = [], fa.arcs
+        while arc:
+            chaine.append(arc); arc = arc.next
+        assert infixe == chaine
+
+    def test_sommets_equidistants_et_cercle_vide(self):
+        """Chaque sommet : ses 3 sites les plus proches sont à égale distance."""
+        coords = _random_coords(120, 3)
+        fa = _run(coords, "tree")
+        assert fa.diagram.vertices
+        for v in fa.diagram.vertices:
+            d = sorted(math.hypot(v.x - x, v.y - y) for x, y in coords)
+            assert d[0] == pytest.approx(d[2], rel=1e-6)
+
+    def test_hauteur_logarithmique(self):
+        """Insertions toujours en queue (pire cas d'un ABR naïf) : hauteur en O(log n)."""
+        bl, last = vg.BeachLine(), None
+        arcs = []
+        for i in range(2000):
+            arc = vg.Arc(P(0, i))
+            bl.insert_after(last, arc)
+            arcs.append(arc); last = arc
+        def hauteur(n):
+            return 0 if n is None else 1 + max(hauteur(n.left), hauteur(n.right))
+        assert hauteur(bl.root) < 4 * math.log2(2000)
+        for arc in arcs[::2]:
+            bl.remove(arc)
+        assert hauteur(bl.root) < 4 * math.log2(1000)
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+# 12. Raster des cellules (nearest_labels)
+# ═════════════════════════════════════════════════════════════════════════════
+
+def _labels_dense(xs, ys, xi, yi):
+    """Calcul d'origine de VoronoiApp._draw : tenseur res×res×n complet."""
+    gx, gy = np.meshgrid(xi, yi)
+    px = np.array(xs); py = np.array(ys)
+    dist = (gx[:,:,None]-px)**2 + (gy[:,:,None]-py)**2
+    return np.argmin(dist, axis=2)
+
+
+class TestNearestLabels:
+    @pytest.mark.parametrize("seed", range(3))
+    def test_identique_au_calcul_dense(self, seed):
+        coords = _random_coords(120, seed)
+        xs, ys = [c[0] for c in coords], [c[1] for c in coords]
+        xi, yi = np.linspace(-30, 530, 150), np.linspace(-10, 510, 130)
+        ids = vg.nearest_labels(xs, ys, xi, yi)
+        assert (ids == _labels_dense(xs, ys, xi, yi)).all()
+
+    def test_egalites_premier_indice(self):
+        """Grille régulière : beaucoup de pixels équidistants de plusieurs sites."""
+        coords = [(x*50, y*50) for x in range(6) for y in range(6)] + [(100, 100)]
+        xs, ys = [c[0] for c in coords], [c[1] for c in coords]
+        xi = yi = np.linspace(0, 250, 101)
+        ids = vg.nearest_labels(xs, ys, xi, yi, tile=7)
+        assert (ids == _labels_dense(xs, ys, xi, yi)).all()
+
+    def test_plafond_memoire_minuscule(self):
+        """Un plafond très bas force le traitement par paquets de candidats."""
+        coords = _random_coords(60, 9)
+        xs, ys = [c[0] for c in coords], [c[1] for c in coords]
+        xi, yi = np.linspace(0, 500, 80), np.linspace(0, 500, 90)
+        ids = vg.nearest_labels(xs, ys, xi, yi, max_bytes=64)
+        assert (ids == _labels_dense(xs, ys, xi, yi)).all()
+
+    def test_index_reutilise(self):
+        """Le kd-tree construit par _draw peut être passé tel quel."""
+        coords = _random_coords(40, 4)
+        xs, ys = [c[0] for c in coords], [c[1] for c in coords]
+        xi, yi = np.linspace(0, 500, 60), np.linspace(0, 500, 70)
+        index = vg.KDTree(np.column_stack([xs, ys]))
+        ids = vg.nearest_labels(xs, ys, xi, yi, index=index)
+        assert (ids == _labels_dense(xs, ys, xi, yi)).all()
+
+    def test_raster_en_cache(self, tmp_path, monkeypatch):
+        """Le deuxième appel relit le raster sur le disque sans rien recalculer."""
+        from voronoi_core.diagram_cache import DiagramCache
+        monkeypatch.setattr(vg, "RASTER_CACHE_MIN_POINTS", 10)
+        coords = _random_coords(40, 5)
+        xs, ys = [c[0] for c in coords], [c[1] for c in coords]
+        xi, yi = np.linspace(0, 500, 50), np.linspace(0, 500, 40)
+        cache = DiagramCache(str(tmp_path))
+        first = vg.cached_nearest_labels(xs, ys, xi, yi, cache)
+        again = vg.cached_nearest_labels(xs, ys, xi, yi, cache,
+                                         index_factory=lambda: pytest.fail("recalcul"))
+        assert (first == _labels_dense(xs, ys, xi, yi)).all() and (again == first).all()
+        assert len(os.listdir(tmp_path)) == 1
+
+    def test_aretes_en_cache(self, tmp_path, monkeypatch):
+        """Arêtes de Fortune : relues sur le disque, et un seul balayage par jeu de points dans l'appli."""
+        from types import SimpleNamespace
+        from voronoi_core.diagram_cache import DiagramCache
+        monkeypatch.setattr(vg, "RASTER_CACHE_MIN_POINTS", 10)
+        coords = _random_coords(40, 6)
+        xs, ys = [c[0] for c in coords], [c[1] for c in coords]
+        cache = DiagramCache(str(tmp_path))
+        first = vg.cached_segments(xs, ys, -10, 510, -10, 510, cache)
+        expected = vg.collect_segments(vg.compute_voronoi([vg.Point(x, y) for x, y in coords]),
+                                       -10, 510, -10, 510, as_array=True)
+        assert np.array_equal(first, expected)
+
+        sweep = vg.compute_voronoi
+        monkeypatch.setattr(vg, "compute_voronoi", lambda pts: pytest.fail("recalcul"))
+        assert np.array_equal(vg.cached_segments(xs, ys, -10, 510, -10, 510, cache), first)
+
+        sweeps = []
+        monkeypatch.setattr(vg, "compute_voronoi", lambda pts: sweeps.append(1) or sweep(pts))
+        app = SimpleNamespace(_segments=None, cache=None)
+        for _ in range(3):
+            assert np.array_equal(vg.VoronoiApp._fortune_segments(app, xs, ys, -10, 510, -10, 510), first)
+        assert len(sweeps) == 1
+
+    def test_opacite_sans_recalcul(self):
+        from types import SimpleNamespace
+        calls = []
+        image = SimpleNamespace(set_alpha=calls.append)
+        app = SimpleNamespace(_image=image, opacity=SimpleNamespace(get=lambda: 0.3),
+                              canvas=SimpleNamespace(draw_idle=lambda: calls.append("draw")),
+                              _draw=lambda: pytest.fail("redessin complet"))
+        vg.VoronoiApp._set_opacity(app)
+        assert calls == [0.3, "draw"]
+
+    def test_sans_site(self):
+        ids = vg.nearest_labels([], [], np.linspace(0, 1, 5), np.linspace(0, 1, 4))
+        assert ids.shape == (4, 5)
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+# 13. Raster incrémental (NearestSiteRaster)
+# ═════════════════════════════════════════════════════════════════════════════
+
+class TestRasterIncremental:
+    def _raster(self, coords):
+        xs, ys = [c[0] for c in coords], [c[1] for c in coords]
+        xi, yi = np.linspace(-50, 550, 120), np.linspace(-40, 540, 110)
+        return vg.NearestSiteRaster(xs, ys, xi, yi, vg.nearest_labels(xs, ys, xi, yi))
+
+    def _check(self, raster, coords):
+        xs, ys = [c[0] for c in coords], [c[1] for c in coords]
+        assert (raster.ids == _labels_dense(xs, ys, raster.xi, raster.yi)).all()
+
+    def test_copilot_charge_au_premier_raster(self):
+        """L'import du module ne charge pas la variante copilot ; le premier raster incrémental, si."""
+        import subprocess
+        code = ("import sys, voronoi_gui as vg; assert vg.COPILOT_PACKAGE not in sys.modules; "
+                "vg.NearestSiteRaster([1, 2], [1, 3], [0, 4], [0, 4], None); "
+                "assert vg.COPILOT_PACKAGE + '.delaunay' in sys.modules")
+        subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+
+    def test_ajouts_et_retraits_identiques_au_calcul_complet(self):
+        import random
+        rng = random.Random(111)
+        coords = _random_coords(60, 11)
+        raster = self._raster(coords)
+        for step in range(40):
+            if step % 3 == 2:
+                i = rng.randrange(len(coords))
+                raster.remove(i)
+                coords.pop(i)
+            else:
+                p = (rng.uniform(0, 500), rng.uniform(0, 500))
+                raster.insert(*p)
+                coords.append(p)
+            self._check(raster, coords)
+
+    def test_zone_modifiee_limitee_a_la_cellule(self):
+        """Un point ajouté au milieu ne fait revoir qu'une petite partie de la grille."""
+        coords = [(x * 50 + 25, y * 50 + 25) for x in range(10) for y in range(10)]
+        raster = self._raster(coords)
+        rows, cols = raster.insert(260, 240)
+        assert (rows.stop - rows.start) * (cols.stop - cols.start) < raster.ids.size / 20
+        self._check(raster, coords + [(260, 240)])
+        rows, cols = raster.remove(len(coords))
+        assert (rows.stop - rows.start) * (cols.stop - cols.start) < raster.ids.size / 20
+        self._check(raster, coords)
+
+    def test_point_du_bord(self):
+        coords = _random_coords(30, 12)
+        raster = self._raster(coords)
+        hull = min(range(30), key=lambda i: coords[i][0])
+        raster.remove(hull)
+        coords.pop(hull)
+        self._check(raster, coords)
+
+    def test_aretes_duales_identiques_a_fortune(self):
+        """Les arêtes tirées de la triangulation (clics) sont celles de Fortune (_draw)."""
+        coords = _random_coords(120, 13)
+        raster = self._raster(coords)
+        raster.insert(250.0, 260.0); coords.append((250.0, 260.0))
+        raster.remove(5); coords.pop(5)
+        box = (-50, 550, -40, 540)
+
+        def clipped(segs):
+            segs, keep = vg.clip_segments(segs, *box)
+            segs = segs[keep]
+            return segs[np.hypot(segs[:, 2] - segs[:, 0], segs[:, 3] - segs[:, 1]) > 1e-6]
+
+        dual = clipped(raster.voronoi_segments())
+        fortune = vg.collect_segments(voronoi(coords)[0], *box, as_array=True)
+        assert len(dual) == len(fortune)
+        # Chaque arête duale retrouve une arête de Fortune (extrémités dans un ordre ou l'autre)
+        for seg in dual:
+            gap = np.minimum(np.abs(fortune - seg).max(axis=1),
+                             np.abs(fortune[:, [2, 3, 0, 1]] - seg).max(axis=1))
+            assert gap.min() < 1e-6
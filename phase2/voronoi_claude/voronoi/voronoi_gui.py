@@ -12,16 +12,24 @@ Contrôles :
   • Slider "Opacité cellules"  → ajuster la transparence des couleurs
 """
 
-import sys, math, heapq, os, random, tkinter as tk
+import sys, math, heapq, importlib, os, random, tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
 import numpy as np
 import matplotlib
-matplotlib.use("TkAgg")
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.collections import LineCollection
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "commun"))
+from voronoi_core.diagram_cache import DiagramCache, cache_key
+from voronoi_core.engines import COPILOT_PACKAGE, load_module
+from voronoi_core.kdtree import KDTree
+from voronoi_core.points_io import load_points
+from voronoi_core.predicates import orient2d
+from voronoi_core.render import visible_segments
+from voronoi_core.segments import clip_segments
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #   ALGORITHME DE FORTUNE
@@ -35,37 +43,365 @@ class Point:
     def __init__(self, x, y): self.x = float(x); self.y = float(y)
 
 
+class Site(Point):
+    """Site d'entrée numéroté dans l'ordre de lecture (index dans diagram.faces)."""
+    __slots__ = ['index']
+    def __init__(self, x, y, index): Point.__init__(self, x, y); self.index = index
+
+
+class VoronoiDiagram:
+    """
+    DCEL en tableaux numpy (une case par demi-arête ou par sommet) :
+      origin[h]  int32   sommet de départ de la demi-arête h, son site à
+                         gauche (-1 : inconnu) ;
+      twin[h]    int32   demi-arête jumelle (les deux moitiés d'une arête
+                         sont créées ensemble : h pair, twin = h + 1) ;
+      face[h]    int32   indice du site dont h borde la cellule ;
+      next[h]    int32   demi-arête suivante autour de la cellule, dans le
+                         sens trigonométrique (-1 : bord ouvert vers l'infini
+                         ou arête dégénérée) ; rempli par link_faces ;
+      vertex_xy  float64 (nv, 2) coordonnées des sommets ;
+      site_xy    float64 (n, 2)  coordonnées des sites.
+    Les vertex_count premiers sommets sont les sommets de Voronoï ; les
+    suivants, ajoutés à la fin du balayage, servent d'origine aux demi-droites
+    (demi-arêtes infinies, is_ray), dont la direction est la médiatrice des
+    deux sites (ray_direction) ; l'origine de la jumelle d'une demi-droite est
+    alors le sommet fini de l'arête, ou la même origine pour une droite entière.
+    Les tableaux sont dimensionnés d'après le nombre de sites (au plus 3n
+    arêtes et 2n sommets) et grandissent par doublement si besoin ; seules
+    les half_count (resp. point_count) premières cases sont valides.
+
+    edges, vertices et faces sont des vues objet (HalfEdge, Face, Point)
+    créées à la demande, pour le code qui parcourt le diagramme.
+    """
+    def __init__(self, sites=()):
+        self.sites   = list(sites)
+        capacity     = max(16, 6 * len(self.sites))
+        self.site_xy = np.array([(s.x, s.y) for s in self.sites], dtype=np.float64).reshape(-1, 2)
+        self.half_count   = 0
+        self.vertex_count = 0       # sommets de Voronoï
+        self.point_count  = 0       # sommets + origines des demi-droites
+        self.origin    = np.full(capacity, -1, dtype=np.int32)
+        self.twin      = np.full(capacity, -1, dtype=np.int32)
+        self.face      = np.full(capacity, -1, dtype=np.int32)
+        self.next      = np.full(capacity, -1, dtype=np.int32)
+        self.vertex_xy = np.zeros((capacity // 3, 2), dtype=np.float64)
+        self._face_views = {}
+        self._face_halfedges = None
+
+    # ── Écriture (FortuneAlgorithm) ──────────────────────────────────────────
+
+    def add_edge(self, left, right):
+        """Nouvelle arête entre les cellules des sites left et right ; retourne h (twin = h + 1)."""
+        h = self.half_count
+        if h + 2 > len(self.origin):
+            for name in ("origin", "twin", "face", "next"):
+                old = getattr(self, name)
+                grown = np.full(2 * len(old), -1, dtype=np.int32)
+                grown[:h] = old[:h]
+                setattr(self, name, grown)
+        self.twin[h] = h + 1; self.twin[h + 1] = h
+        self.face[h] = left;  self.face[h + 1] = right
+        self.half_count = h + 2
+        self._face_halfedges = None
+        return h
+
+    def add_vertex(self, x, y):
+        """Nouveau sommet de Voronoï ; retourne son indice."""
+        if self.point_count != self.vertex_count:
+            raise ValueError("les sommets doivent précéder les origines des demi-droites")
+        i = self._add_point(x, y)
+        self.vertex_count += 1
+        return i
+
+    def add_ray_origin(self, x, y):
+        """Origine d'une demi-droite (ajoutée après tous les sommets) ; retourne son indice."""
+        return self._add_point(x, y)
+
+    def _add_point(self, x, y):
+        i = self.point_count
+        if i == len(self.vertex_xy):
+            grown = np.zeros((2 * i, 2), dtype=np.float64)
+            grown[:i] = self.vertex_xy[:i]
+            self.vertex_xy = grown
+        self.vertex_xy[i] = (x, y)
+        self.point_count = i + 1
+        return i
+
+    def link_faces(self):
+        """
+        Oriente les demi-arêtes finies (origin[h] devient le sommet de départ,
+        le site de h à gauche) et remplit next : la demi-arête de la même
+        cellule qui part du sommet d'arrivée de h (tri + recherche
+        dichotomique, sans boucle Python).
+        """
+        n, nv = self.half_count, self.vertex_count
+        self.next[:n] = -1
+        a = self.origin[:n]; b = a[self.twin[:n]]
+        h = np.flatnonzero((a >= 0) & (a < nv) & (b >= 0) & (b < nv) & (a != b))
+        if len(h) == 0:
+            return
+        a, b, f = a[h].astype(np.int64), b[h].astype(np.int64), self.face[h].astype(np.int64)
+        pa, pb, ps = self.vertex_xy[a], self.vertex_xy[b], self.site_xy[f]
+        left = ((pb[:, 0] - pa[:, 0]) * (ps[:, 1] - pa[:, 1])
+                - (pb[:, 1] - pa[:, 1]) * (ps[:, 0] - pa[:, 0])) > 0
+        start, end = np.where(left, a, b), np.where(left, b, a)
+        self.origin[h] = start
+        start_key = f * nv + start
+        order = np.argsort(start_key, kind="stable")
+        sorted_key = start_key[order]
+        end_key = f * nv + end
+        pos = np.minimum(np.searchsorted(sorted_key, end_key), len(h) - 1)
+        found = sorted_key[pos] == end_key
+        self.next[h[found]] = h[order[pos[found]]]
+
+    def compact(self):
+        """Ramène les tableaux à leur taille utile (fin du calcul)."""
+        n, nv = self.half_count, self.point_count
+        self.origin, self.twin = self.origin[:n].copy(), self.twin[:n].copy()
+        self.face, self.next = self.face[:n].copy(), self.next[:n].copy()
+        self.vertex_xy = self.vertex_xy[:nv].copy()
+
+    # ── Lecture ──────────────────────────────────────────────────────────────
+
+    def is_ray(self, h):
+        return self.origin[h] >= self.vertex_count
+
+    def ray_direction(self, h):
+        """Direction de la demi-droite h : médiatrice, le site de h à gauche."""
+        (fx, fy), (tx, ty) = self.site_xy[self.face[h]], self.site_xy[self.face[self.twin[h]]]
+        return -(ty - fy), tx - fx
+
+    def segments(self, far=1e5):
+        """
+        Arêtes sous forme de tableau (m, 4) x1 y1 x2 y2, dans l'ordre des
+        arêtes : segments finis non dégénérés, et demi-droites prolongées de
+        far dans leur direction (une droite entière donne ses deux moitiés).
+        """
+        n, nv = self.half_count, self.vertex_count
+        origin, twin, face = self.origin[:n], self.twin[:n], self.face[:n]
+        # Arêtes finies (demi-arête paire de chaque paire)
+        h = np.arange(0, n, 2)
+        a, b = origin[h], origin[h + 1]
+        h = h[(a >= 0) & (a < nv) & (b >= 0) & (b < nv)]
+        pa, pb = self.vertex_xy[origin[h]], self.vertex_xy[origin[h + 1]]
+        keep = (np.abs(pa - pb) >= 1e-12).any(axis=1)
+        finite = np.hstack([pa[keep], pb[keep]])
+        finite_key = h[keep]
+        # Demi-droites
+        r = np.flatnonzero(origin >= nv)
+        start = self.vertex_xy[origin[r]]
+        fs, ts = self.site_xy[face[r]], self.site_xy[face[twin[r]]]
+        d = np.column_stack([-(ts[:, 1] - fs[:, 1]), ts[:, 0] - fs[:, 0]])
+        norm = np.hypot(d[:, 0], d[:, 1])
+        keep = norm >= EPS
+        rays = np.hstack([start[keep], start[keep] + d[keep] / norm[keep, None] * far])
+        order = np.argsort(np.concatenate([finite_key, r[keep]]), kind="stable")
+        return np.vstack([finite, rays])[order]
+
+    @property
+    def edges(self):
+        return _EdgeList(self)
+
+    @property
+    def vertices(self):
+        return _VertexList(self)
+
+    @property
+    def faces(self):
+        return _FaceList(self)
+
+    def _halfedges_of(self, f):
+        if self._face_halfedges is None:
+            faces = self.face[:self.half_count]
+            order = np.argsort(faces, kind="stable")     # ordre de création dans chaque cellule
+            bounds = np.searchsorted(faces[order], np.arange(len(self.sites) + 1))
+            self._face_halfedges = (order, bounds)
+        order, bounds = self._face_halfedges
+        return order[bounds[f]:bounds[f + 1]].tolist()
+
+
 class HalfEdge:
-    __slots__ = ['origin','twin','face','direction']
-    def __init__(self):
-        self.origin = self.twin = self.face = self.direction = None
+    """Vue sur la demi-arête h d'un VoronoiDiagram."""
+    __slots__ = ['diagram', 'index']
+    def __init__(self, diagram, index):
+        self.diagram = diagram; self.index = index
 
+    def __eq__(self, o):
+        return isinstance(o, HalfEdge) and o.diagram is self.diagram and o.index == self.index
 
-class Face:
-    __slots__ = ['site']
-    def __init__(self, site): self.site = site
+    def __hash__(self):
+        return hash(self.index)
 
+    @property
+    def origin(self):
+        i = self.diagram.origin[self.index]
+        if i < 0: return None
+        x, y = self.diagram.vertex_xy[i]
+        return Point(x, y)
 
-class VoronoiDiagram:
-    def __init__(self):
-        self.vertices = []
-        self.edges    = []   # liste de (he, het)
-        self.faces    = []
+    @property
+    def twin(self):
+        return HalfEdge(self.diagram, int(self.diagram.twin[self.index]))
+
+    @property
+    def face(self):
+        return self.diagram.faces[int(self.diagram.face[self.index])]
+
+    @property
+    def next(self):
+        h = self.diagram.next[self.index]
+        return HalfEdge(self.diagram, int(h)) if h >= 0 else None
+
+    @property
+    def direction(self):
+        if not self.diagram.is_ray(self.index): return None
+        return Point(*self.diagram.ray_direction(self.index))
+
+
+class Face:
+    """Vue sur la cellule du site d'indice index (une seule vue par cellule)."""
+    __slots__ = ['diagram', 'index']
+    def __init__(self, diagram, index):
+        self.diagram = diagram; self.index = index
+
+    @property
+    def site(self):
+        return self.diagram.sites[self.index]
+
+    @property
+    def halfedges(self):
+        """Demi-arêtes bordant la cellule (he.face is self), dans l'ordre de création."""
+        return [HalfEdge(self.diagram, h) for h in self.diagram._halfedges_of(self.index)]
+
+
+class _EdgeList:
+    """diagram.edges : séquence de paires (he, het)."""
+    __slots__ = ['diagram']
+    def __init__(self, diagram): self.diagram = diagram
+    def __len__(self): return self.diagram.half_count // 2
+    def __getitem__(self, i):
+        if i < 0: i += len(self)
+        if not 0 <= i < len(self): raise IndexError(i)
+        return HalfEdge(self.diagram, 2 * i), HalfEdge(self.diagram, 2 * i + 1)
+    def __iter__(self):
+        for i in range(len(self)): yield self[i]
+
+
+class _VertexList:
+    """diagram.vertices : séquence des sommets de Voronoï (Point)."""
+    __slots__ = ['diagram']
+    def __init__(self, diagram): self.diagram = diagram
+    def __len__(self): return self.diagram.vertex_count
+    def __getitem__(self, i):
+        if i < 0: i += len(self)
+        if not 0 <= i < len(self): raise IndexError(i)
+        return Point(*self.diagram.vertex_xy[i])
+    def __iter__(self):
+        for x, y in self.diagram.vertex_xy[:self.diagram.vertex_count].tolist(): yield Point(x, y)
+
+
+class _FaceList:
+    """diagram.faces : une Face par site, toujours la même vue pour un indice donné."""
+    __slots__ = ['diagram']
+    def __init__(self, diagram): self.diagram = diagram
+    def __len__(self): return len(self.diagram.sites)
+    def __getitem__(self, i):
+        if i < 0: i += len(self)
+        if not 0 <= i < len(self): raise IndexError(i)
+        views = self.diagram._face_views
+        if i not in views: views[i] = Face(self.diagram, i)
+        return views[i]
+    def __iter__(self):
+        for i in range(len(self)): yield self[i]
 
 
 class Arc:
-    __slots__ = ['site','prev','next','event','s0','s1']
+    __slots__ = ['site','prev','next','event','s0','s1','left','right','parent','prio']
     def __init__(self, s):
         self.site = s
         self.prev = self.next = self.event = self.s0 = self.s1 = None
+        self.left = self.right = self.parent = None   # nœud du treap (BeachLine)
+        self.prio = 0.0
+
+
+_CANCELLED = object()
+
+
+class EventQueue:
+    """
+    File de priorité des événements de Fortune : tas heapq d'entrées
+    [x, y, n°, point, arc] (arc None pour un site), comparées comme des listes
+    par le code C de heapq — plus d'appel à une méthode Python __lt__ par
+    comparaison. À x égal, l'ordre est celui de y ; le numéro d'ordre départage
+    les doublons sans jamais comparer les objets.
+
+    La clé x d'un site est arrondie : les sites triés par x sont regroupés en
+    suites d'abscisses distantes de moins de EPS, et chaque suite prend le x de
+    son premier site. Des sites presque alignés verticalement sortent donc par
+    y croissant, ce que suppose _site pour la première colonne.
+
+    Un événement de cercle annulé est réellement retiré : marqué, il quitte le
+    tas dès qu'il en atteint le sommet, et tous les marqués sont éliminés d'un
+    coup (heapify) dès qu'ils forment la moitié du tas. Le tas garde ainsi au
+    plus deux fois plus d'entrées que d'événements en attente, soit O(n).
+
+    Compteurs : pushes, pops (événements rendus), cancellations, compactions,
+    max_size (taille maximale du tas).
+    """
+    __slots__ = ['heap', 'dead', 'seq', 'pushes', 'pops', 'cancellations', 'compactions', 'max_size']
+
+    def __init__(self, sites=()):
+        sites = list(sites)
+        keys = [0.0] * len(sites)
+        key = last = -math.inf
+        for i in sorted(range(len(sites)), key=lambda i: sites[i].x):
+            x = sites[i].x
+            if x - last >= EPS: key = x
+            keys[i], last = key, x
+        self.heap = [[keys[i], s.y, i, s, None] for i, s in enumerate(sites)]
+        heapq.heapify(self.heap)
+        self.dead = 0
+        self.seq = self.pushes = self.max_size = len(self.heap)
+        self.pops = self.cancellations = self.compactions = 0
+
+    def __len__(self):
+        return len(self.heap) - self.dead
+
+    def push(self, x, y, point, arc=None):
+        """Ajoute un événement ; l'entrée retournée sert à l'annuler."""
+        entry = [x, y, self.seq, point, arc]
+        self.seq += 1
+        heapq.heappush(self.heap, entry)
+        self.pushes += 1
+        if len(self.heap) > self.max_size: self.max_size = len(self.heap)
+        return entry
+
+    def cancel(self, entry):
+        entry[4] = _CANCELLED
+        self.cancellations += 1
+        self.dead += 1
+        if 2 * self.dead > len(self.heap):
+            self.heap = [e for e in self.heap if e[4] is not _CANCELLED]
+            heapq.heapify(self.heap)
+            self.dead = 0
+            self.compactions += 1
+
+    def pop(self):
+        """Entrée [x, y, n°, point, arc] suivante, ou None si la file est vide."""
+        heap = self.heap
+        while heap:
+            entry = heapq.heappop(heap)
+            if entry[4] is _CANCELLED:
+                self.dead -= 1
+                continue
+            self.pops += 1
+            return entry
+        return None
 
-
-class Event:
-    __slots__ = ['x','point','arc','valid']
-    def __init__(self, x, pt, arc=None):
-        self.x = x; self.point = pt; self.arc = arc; self.valid = True
-    def __lt__(self, o):
-        return self.x < o.x if abs(self.x - o.x) > EPS else self.point.y < o.point.y
+    def stats(self):
+        return {"pushes": self.pushes, "pops": self.pops, "cancellations": self.cancellations,
+                "compactions": self.compactions, "max_size": self.max_size}
 
 
 def _par_inter(p1, p2, sx):
@@ -78,8 +414,81 @@ def _par_inter(p1, p2, sx):
     c = (p1.y**2 + p1.x**2 - sx**2)/d1 - (p2.y**2 + p2.x**2 - sx**2)/d2
     disc = max(0.0, b*b - 4*a*c)
     sq = math.sqrt(disc)
-    y1, y2 = (-b+sq)/(2*a), (-b-sq)/(2*a)
-    return y1 if p1.x < p2.x else y2
+    # Point de rupture entre l'arc de p1 (dessous) et celui de p2 (dessus) :
+    # c'est toujours la racine (-b-sq)/(2a), quel que soit le signe de a.
+    # (Choisir l'autre racine rend les points de rupture non monotones.)
+    return (-b-sq)/(2*a)
+
+
+class BeachLine:
+    """
+    Beach line équilibrée : treap dont l'ordre infixe suit l'ordre des arcs en y.
+    Aucune clé n'est stockée : la descente compare le site aux points de rupture
+    (_par_inter) calculés pour la position courante de la sweep line, ce qui
+    donne localisation, insertion et suppression en O(log n) (espérance).
+    Les pointeurs prev/next des arcs restent gérés par FortuneAlgorithm.
+    """
+    def __init__(self, seed=0):
+        self.root = None
+        self._rng = random.Random(seed)
+
+    def locate(self, y, sx):
+        """Premier arc dont le point de rupture droit est au-dessus de y
+        (même résultat que le parcours linéaire de la liste chaînée)."""
+        node = self.root; found = None
+        while node:
+            if node.next and y >= _par_inter(node.site, node.next.site, sx) - EPS:
+                node = node.right
+            else:
+                found = node; node = node.left
+        return found
+
+    def insert_after(self, arc, new):
+        """Insère new juste après arc dans l'ordre infixe (en tête si arc est None)."""
+        new.prio = self._rng.random()
+        new.left = new.right = new.parent = None
+        if self.root is None:
+            self.root = new; return
+        if arc is None:
+            node = self.root
+            while node.left: node = node.left
+            node.left = new
+        elif arc.right is None:
+            arc.right = new; node = arc
+        else:
+            node = arc.right
+            while node.left: node = node.left
+            node.left = new
+        new.parent = node
+        while new.parent and new.parent.prio < new.prio:
+            self._rotate_up(new)
+
+    def remove(self, arc):
+        while arc.left or arc.right:
+            if   arc.left  is None: c = arc.right
+            elif arc.right is None: c = arc.left
+            else: c = arc.left if arc.left.prio > arc.right.prio else arc.right
+            self._rotate_up(c)
+        p = arc.parent
+        if p is None:        self.root = None
+        elif p.left is arc:  p.left = None
+        else:                p.right = None
+        arc.parent = None
+
+    def _rotate_up(self, x):
+        p = x.parent; g = p.parent
+        if p.left is x:
+            p.left = x.right
+            if x.right: x.right.parent = p
+            x.right = p
+        else:
+            p.right = x.left
+            if x.left: x.left.parent = p
+            x.left = p
+        p.parent = x; x.parent = g
+        if g is None:       self.root = x
+        elif g.left is p:   g.left = x
+        else:               g.right = x
 
 
 def circumcenter(a, b, c):
@@ -93,143 +502,178 @@ def circumcenter(a, b, c):
 
 
 class FortuneAlgorithm:
-    def __init__(self, points):
-        self.sites   = [Point(p.x, p.y) for p in points]
-        self.diagram = VoronoiDiagram()
-        self.queue   = []
+    """
+    beachline : "tree" (défaut) → beach line équilibrée (BeachLine), O(n log n) ;
+                "list"          → parcours linéaire de la liste chaînée d'arcs,
+                                  conservé comme référence pour vérifier le résultat.
+    points     : liste de Point, ou tableau numpy (n, 2) — par exemple la vue
+                 memmap d'un fichier binaire (voronoi_core.points_bin).
+    """
+    def __init__(self, points, beachline="tree"):
+        if beachline not in ("tree", "list"):
+            raise ValueError(f"beachline inconnue : {beachline!r}")
+        coords = points.tolist() if isinstance(points, np.ndarray) else [(p.x, p.y) for p in points]
+        self.sites   = [Site(x, y, i) for i, (x, y) in enumerate(coords)]
+        self.diagram = VoronoiDiagram(self.sites)
+        self.queue   = EventQueue()
         self.arcs    = None
-
-    def _face_of(self, site):
-        for f in self.diagram.faces:
-            if f.site is site: return f
-        f = Face(site); self.diagram.faces.append(f); return f
+        self.beach   = BeachLine() if beachline == "tree" else None
+        self.left_open = []     # arêtes des premiers sites de même abscisse (infinies vers -x)
 
     def _new_edge(self, sl, sr):
-        he, het = HalfEdge(), HalfEdge()
-        he.twin = het; het.twin = he
-        he.face = self._face_of(sl); het.face = self._face_of(sr)
-        self.diagram.edges.append((he, het))
-        return he, het
+        """Demi-arêtes (indices) bordant les cellules de sl et de sr."""
+        h = self.diagram.add_edge(sl.index, sr.index)
+        return h, h + 1
 
     def compute(self):
-        for s in self.sites:
-            heapq.heappush(self.queue, Event(s.x, s))
-        while self.queue:
-            ev = heapq.heappop(self.queue)
-            if not ev.valid: continue
-            if ev.arc is None: self._site(ev)
-            else:              self._circle(ev)
+        self.queue = queue = EventQueue(self.sites)
+        entry = queue.pop()
+        while entry is not None:
+            if entry[4] is None: self._site(entry[3])
+            else:                self._circle(entry[4], entry[3])
+            entry = queue.pop()
         self._finish()
+        self.diagram.link_faces()
+        self.diagram.compact()
 
-    def _site(self, ev):
-        site = ev.point; sx = site.x
+    def _site(self, site):
+        sx = site.x
         if self.arcs is None:
-            self.arcs = Arc(site); return
-        arc = self.arcs
-        while arc.next:
-            if site.y < _par_inter(arc.site, arc.next.site, sx) - EPS: break
-            arc = arc.next
-        if arc.event: arc.event.valid = False; arc.event = None
+            self.arcs = Arc(site)
+            if self.beach: self.beach.insert_after(None, self.arcs)
+            return
+        if self.beach:
+            arc = self.beach.locate(site.y, sx)
+        else:
+            arc = self.arcs
+            while arc.next:
+                if site.y < _par_inter(arc.site, arc.next.site, sx) - EPS: break
+                arc = arc.next
+        if arc.event: self.queue.cancel(arc.event); arc.event = None
+        if abs(arc.site.x - sx) < EPS and arc.next is None:
+            # Premiers sites de même abscisse (triés par y) : l'arc du
+            # précédent est une demi-droite horizontale, le nouvel arc se
+            # place au-dessus sans le couper (arête : médiatrice horizontale)
+            na = Arc(site)
+            na.prev = arc; arc.next = na
+            if self.beach: self.beach.insert_after(arc, na)
+            he, het = self._new_edge(arc.site, site)
+            arc.s1 = he; na.s0 = het
+            self.left_open.append(he)
+            return
         dup = Arc(arc.site); na = Arc(site)
         dup.next = arc.next; dup.prev = na
         na.next = dup; na.prev = arc
         if arc.next: arc.next.prev = dup
         arc.next = na
+        if self.beach:
+            self.beach.insert_after(arc, na); self.beach.insert_after(na, dup)
+        # Une seule arête : les deux points de rupture du nouvel arc la
+        # parcourent dans des sens opposés, chacun en fixera une extrémité
+        dup.s1 = arc.s1                           # l'arête vers arc.next passe à dup
         he, het = self._new_edge(arc.site, site)
         arc.s1 = he; na.s0 = het
-        he2, het2 = self._new_edge(site, arc.site)
-        na.s1 = he2; dup.s0 = het2
+        na.s1 = het; dup.s0 = he
         self._check(arc); self._check(dup)
 
-    def _circle(self, ev):
-        arc = ev.arc; v = ev.point
-        self.diagram.vertices.append(v)
-        if arc.prev and arc.prev.event: arc.prev.event.valid = False; arc.prev.event = None
-        if arc.next and arc.next.event: arc.next.event.valid = False; arc.next.event = None
-        if arc.s0: arc.s0.origin = v
-        if arc.s1: arc.s1.origin = v
-        if arc.prev and arc.prev.s1: arc.prev.s1.origin = v
-        if arc.next and arc.next.s0: arc.next.s0.origin = v
+    def _circle(self, arc, v):
+        vi = self.diagram.add_vertex(v.x, v.y)
+        if arc.prev and arc.prev.event: self.queue.cancel(arc.prev.event); arc.prev.event = None
+        if arc.next and arc.next.event: self.queue.cancel(arc.next.event); arc.next.event = None
+        # Les arêtes des deux points de rupture qui disparaissent se terminent en v
+        if arc.s0 is not None: self._end_edge(arc.s0, vi)
+        if arc.s1 is not None: self._end_edge(arc.s1, vi)
         if arc.prev and arc.next:
             he, het = self._new_edge(arc.prev.site, arc.next.site)
-            he.origin = het.origin = v
+            self.diagram.origin[he] = vi
             arc.prev.s1 = he; arc.next.s0 = het
         if arc.prev: arc.prev.next = arc.next
         if arc.next: arc.next.prev = arc.prev
+        if self.beach: self.beach.remove(arc)
         if arc.prev: self._check(arc.prev)
         if arc.next: self._check(arc.next)
 
+    def _end_edge(self, h, vi):
+        """Fixe en vi l'extrémité encore libre de l'arête de h (origine de h ou de sa jumelle)."""
+        origin = self.diagram.origin
+        if origin[h] < 0: origin[h] = vi
+        else:             origin[self.diagram.twin[h]] = vi
+
     def _check(self, arc):
         if not arc.prev or not arc.next: return
         a, b, c = arc.prev.site, arc.site, arc.next.site
-        if (b.x-a.x)*(c.y-a.y) - (b.y-a.y)*(c.x-a.x) >= 0: return
+        # Signe exact : des sites alignés (grilles) ne donnent jamais d'événement
+        if orient2d(a.x, a.y, b.x, b.y, c.x, c.y) >= 0: return
         cc = circumcenter(a, b, c)
         if cc is None: return
         r  = math.hypot(cc.x - b.x, cc.y - b.y)
-        ev = Event(cc.x + r, cc, arc)
-        arc.event = ev
-        heapq.heappush(self.queue, ev)
+        arc.event = self.queue.push(cc.x + r, cc.y, cc, arc)
 
     def _finish(self):
+        # Points de rupture restants : arêtes infinies. Entre un arc et le
+        # suivant (au-dessus), le point de rupture part vers l'infini dans la
+        # direction diagram.ray_direction de la demi-arête du suivant (next.s0) ;
+        # celle-ci devient une demi-droite partant de l'extrémité finie de
+        # l'arête. Une arête sans extrémité finie est une droite entière : ses
+        # deux moitiés partent du milieu des deux sites, en sens opposés.
+        diagram = self.diagram
         arc = self.arcs
         while arc and arc.next:
-            if arc.s1 and arc.s1.origin is None:
-                mx = (arc.site.x + arc.next.site.x) / 2
-                my = (arc.site.y + arc.next.site.y) / 2
-                arc.s1.direction = Point(-(arc.next.site.y - arc.site.y),
-                                          (arc.next.site.x - arc.site.x))
-                arc.s1.origin    = Point(mx, my)
+            ray = arc.next.s0
+            if ray is not None and diagram.origin[ray] < diagram.vertex_count:
+                other = int(diagram.twin[ray])
+                end = [i for i in (diagram.origin[ray], diagram.origin[other]) if i >= 0]
+                if end:
+                    x, y = diagram.vertex_xy[end[0]]
+                    diagram.origin[other] = end[0]
+                    diagram.origin[ray] = diagram.add_ray_origin(x, y)
+                else:
+                    x = (arc.site.x + arc.next.site.x) / 2
+                    y = (arc.site.y + arc.next.site.y) / 2
+                    diagram.origin[ray] = diagram.origin[other] = diagram.add_ray_origin(x, y)
             arc = arc.next
+        # Côté -x des arêtes de la première colonne (jamais balayé) : la
+        # moitié du site du dessous part vers -x depuis l'extrémité finie
+        for h in self.left_open:
+            other = int(diagram.twin[h])
+            end = max(diagram.origin[h], diagram.origin[other])
+            if end < 0 or end >= diagram.vertex_count: continue
+            x, y = diagram.vertex_xy[end]
+            diagram.origin[other] = end
+            diagram.origin[h] = diagram.add_ray_origin(x, y)
 
 
 def clip_seg(p1, p2, xmn, xmx, ymn, ymx):
-    def code(p):
-        c = 0
-        if p[0] < xmn: c |= 1
-        if p[0] > xmx: c |= 2
-        if p[1] < ymn: c |= 4
-        if p[1] > ymx: c |= 8
-        return c
-    x1,y1,x2,y2 = p1[0],p1[1],p2[0],p2[1]
-    for _ in range(20):
-        c1,c2 = code((x1,y1)), code((x2,y2))
-        if not (c1|c2): return (x1,y1),(x2,y2)
-        if c1&c2:       return None
-        c = c1 or c2
-        if   c&8: x=x1+(x2-x1)*(ymx-y1)/(y2-y1+EPS); y=ymx
-        elif c&4: x=x1+(x2-x1)*(ymn-y1)/(y2-y1+EPS); y=ymn
-        elif c&2: y=y1+(y2-y1)*(xmx-x1)/(x2-x1+EPS); x=xmx
-        else:     y=y1+(y2-y1)*(xmn-x1)/(x2-x1+EPS); x=xmn
-        if c==c1: x1,y1=x,y
-        else:     x2,y2=x,y
-    return None
-
-
-def collect_segments(diagram, xmn, xmx, ymn, ymx, far=1e5):
-    segs = []
-    for he, het in diagram.edges:
-        p1, p2 = he.origin, het.origin
-        if p1 is None and p2 is None: continue
-        # Ignorer les arêtes dégénérées (même sommet aux deux bouts)
-        if p1 is not None and p2 is not None:
-            if abs(p1.x - p2.x) < 1e-12 and abs(p1.y - p2.y) < 1e-12:
-                continue
-        if p1 is None or p2 is None:
-            edge   = he if p2 is None else het
-            origin = edge.twin.origin if edge.origin is None else edge.origin
-            if origin is None: continue
-            d = edge.direction or edge.twin.direction
-            if d is None: continue
-            n = math.hypot(d.x, d.y)
-            if n < EPS: continue
-            p1 = origin
-            p2 = Point(origin.x + d.x/n*far, origin.y + d.y/n*far)
-        r = clip_seg((p1.x,p1.y),(p2.x,p2.y), xmn,xmx,ymn,ymx)
-        if r:
-            (rx1,ry1),(rx2,ry2) = r
-            if math.hypot(rx2-rx1, ry2-ry1) > 1e-9:
-                segs.append(r)
-    return segs
+    """
+    Segment p1-p2 découpé à la boîte (Liang–Barsky, en une passe sur les
+    quatre bords, sans itération ni EPS) : ((x1, y1), (x2, y2)), ou None
+    s'il est hors de la boîte.
+    """
+    x1, y1 = p1[0], p1[1]
+    dx, dy = p2[0] - x1, p2[1] - y1
+    t0, t1 = 0.0, 1.0
+    for p, q in ((-dx, x1 - xmn), (dx, xmx - x1), (-dy, y1 - ymn), (dy, ymx - y1)):
+        if p == 0:
+            if q < 0: return None                 # parallèle au bord, dehors
+        elif p < 0: t0 = max(t0, q / p)           # entrée dans la boîte
+        else:       t1 = min(t1, q / p)           # sortie
+    if t0 > t1: return None
+    return (x1 + t0*dx, y1 + t0*dy), (x1 + t1*dx, y1 + t1*dy)
+
+
+def collect_segments(diagram, xmn, xmx, ymn, ymx, far=1e5, as_array=False):
+    """
+    Arêtes du diagramme découpées à la boîte : liste de ((x1, y1), (x2, y2)),
+    ou tableau (k, 4) avec as_array=True (pas de tuples à créer pour les gros
+    diagrammes).
+    """
+    clipped, keep = clip_segments(diagram.segments(far), xmn, xmx, ymn, ymx)
+    clipped = clipped[keep]
+    clipped = clipped[np.hypot(clipped[:, 2] - clipped[:, 0], clipped[:, 3] - clipped[:, 1]) > 1e-9]
+    if as_array:
+        return clipped
+    x1, y1, x2, y2 = clipped.T.tolist()
+    return list(zip(zip(x1, y1), zip(x2, y2)))
 
 
 def compute_voronoi(points):
@@ -238,6 +682,201 @@ def compute_voronoi(points):
     return fa.diagram
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+#   LECTURE DES FICHIERS DE POINTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def read_points_file(path):
+    """
+    Points d'un fichier texte (x,y / x;y / x y, lignes # ignorées), lus par
+    gros blocs avec voronoi_core.points_io ; les lignes invalides sont sautées.
+    Les fichiers binaires (voronoi_core.points_bin) sont reconnus à leur en-tête.
+    """
+    return [Point(x, y) for x, y in load_points(path, strict=False).tolist()]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#   RASTER DES CELLULES (site le plus proche de chaque pixel)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+RASTER_MAX_BYTES = 64 * 2**20   # plafond mémoire des tableaux de distances
+RASTER_TILE      = 32           # côté d'une tuile, en pixels
+RASTER_CACHE_MIN_POINTS = 10_000   # en dessous, recalculer coûte moins que relire
+INCREMENTAL_MAX_POINTS  = 20_000   # au-delà, construire la triangulation coûte plus qu'un _draw
+
+
+def nearest_labels(px, py, xi, yi, max_bytes=RASTER_MAX_BYTES, tile=RASTER_TILE, index=None):
+    """
+    ids[r, c] = indice du site le plus proche de (xi[c], yi[r]) ; identique à
+    argmin((gx-px)**2 + (gy-py)**2) sur la grille complète (premier indice en
+    cas d'égalité) sans jamais allouer le tenseur res×res×n.
+
+    Une seule requête groupée sur le kd-tree des sites (index, construit si
+    absent) : chaque tuile de pixels n'est comparée qu'aux sites qui peuvent
+    y gagner (voir KDTree.nearest_grid). Les blocs de distances restent sous
+    max_bytes. xi et yi doivent être monotones.
+    """
+    if index is None:
+        index = KDTree(np.column_stack([np.asarray(px, dtype=float), np.asarray(py, dtype=float)]))
+    return index.nearest_grid(xi, yi, tile=tile, max_bytes=max_bytes)
+
+
+def cached_nearest_labels(px, py, xi, yi, cache, max_bytes=RASTER_MAX_BYTES, index_factory=None):
+    """
+    nearest_labels, gardé dans le cache disque (voronoi_core.diagram_cache) à
+    partir de RASTER_CACHE_MIN_POINTS sites : recharger un fichier inchangé
+    relit le raster au lieu de le recalculer. index_factory() fournit le
+    kd-tree, appelée seulement si le raster doit être calculé.
+    """
+    def compute():
+        index = index_factory() if index_factory else None
+        return {"ids": nearest_labels(px, py, xi, yi, max_bytes=max_bytes, index=index)}
+
+    if cache is None or len(px) < RASTER_CACHE_MIN_POINTS:
+        return compute()["ids"]
+    key = cache_key(np.column_stack([px, py]), "nearest_labels",
+                    xi=(float(xi[0]), float(xi[-1]), len(xi)), yi=(float(yi[0]), float(yi[-1]), len(yi)))
+    return cache.get_or_compute(key, compute)["ids"]
+
+
+def cached_segments(px, py, xmn, xmx, ymn, ymx, cache):
+    """
+    Arêtes de Fortune découpées à la boîte (tableau (k, 4)), gardées dans le
+    cache disque à partir de RASTER_CACHE_MIN_POINTS sites, comme le raster :
+    recharger un fichier inchangé ne relance pas le balayage.
+    """
+    xy = np.column_stack([np.asarray(px, dtype=float), np.asarray(py, dtype=float)])
+
+    def compute():
+        return {"segments": collect_segments(compute_voronoi(xy), xmn, xmx, ymn, ymx, as_array=True)}
+
+    if cache is None or len(xy) < RASTER_CACHE_MIN_POINTS:
+        return compute()["segments"]
+    key = cache_key(xy, "fortune_segments", bounds=(float(xmn), float(xmx), float(ymn), float(ymx)))
+    return cache.get_or_compute(key, compute)["segments"]
+
+
+def copilot_delaunay():
+    """
+    Module delaunay de la variante copilot (triangulation incrémentale, avec
+    suppression), chargé au premier raster incrémental seulement, sous un nom
+    propre : le paquet voronoi_app de gemini porte le même nom.
+    """
+    load_module(COPILOT_PACKAGE, "phase2/voronoi_copilot/voronoi/voronoi_app")
+    return importlib.import_module(COPILOT_PACKAGE + ".delaunay")
+
+
+class NearestSiteRaster:
+    """
+    Raster ids (résultat de nearest_labels sur la grille xi × yi) tenu à jour
+    point par point. Une triangulation de Delaunay incrémentale donne la
+    cellule du point ajouté ou supprimé (cercles circonscrits des triangles
+    qui l'entourent) : seuls les pixels de sa boîte englobante sont revus.
+      - ajout    : un pixel passe au nouveau site s'il en est strictement plus
+                   proche que de son site actuel ;
+      - retrait  : les pixels du site retiré sont répartis entre ses anciens
+                   voisins de Delaunay, seuls candidats possibles.
+    Une cellule non bornée (sommet relié au super-triangle) touche le bord :
+    toute la grille est alors revue, avec le kd-tree pour le retrait.
+    insert et remove modifient ids sur place et retournent la zone modifiée
+    (tranches de lignes et de colonnes de ids).
+    """
+    def __init__(self, px, py, xi, yi, ids):
+        self.xi, self.yi = np.asarray(xi, dtype=float), np.asarray(yi, dtype=float)
+        self.ids = ids
+        self.xy  = np.column_stack([np.asarray(px, dtype=float), np.asarray(py, dtype=float)])
+        delaunay = copilot_delaunay()
+        self.dt  = delaunay.DelaunayTriangulation(delaunay.super_triangle(
+            [(self.xi[0], self.yi[0]), (self.xi[-1], self.yi[-1])] + [tuple(p) for p in self.xy.tolist()]))
+        self.vertex_ids = [self.dt.insert(tuple(p)) for p in self.xy.tolist()]
+        if -1 in self.vertex_ids:
+            raise ValueError("points confondus")
+
+    def _cell_region(self, v):
+        """Tranches (lignes, colonnes) couvrant la cellule du sommet v, None si non bornée."""
+        star = self.dt.star(v)
+        if any(min(self.dt.tri_vertices[t]) < 3 for t in star):
+            return None
+        cx, cy = zip(*(self.dt.tri_circles[t].center for t in star))
+        c0 = max(int(np.searchsorted(self.xi, min(cx))) - 1, 0)
+        c1 = int(np.searchsorted(self.xi, max(cx), side="right")) + 1
+        r0 = max(int(np.searchsorted(self.yi, min(cy))) - 1, 0)
+        r1 = int(np.searchsorted(self.yi, max(cy), side="right")) + 1
+        return slice(r0, r1), slice(c0, c1)
+
+    def _grid(self, region):
+        rows, cols = region
+        return np.meshgrid(self.xi[cols], self.yi[rows])
+
+    def insert(self, x, y):
+        v = self.dt.insert((x, y))
+        if v == -1:
+            raise ValueError(f"point ({x}, {y}) confondu avec un site")
+        self.vertex_ids.append(v)
+        self.xy = np.vstack([self.xy, (x, y)])
+        new = len(self.xy) - 1
+        region = self._cell_region(v) or (slice(None), slice(None))
+        gx, gy = self._grid(region)
+        block = self.ids[region]
+        current = self.xy[block]
+        closer = (gx - x)**2 + (gy - y)**2 < (gx - current[..., 0])**2 + (gy - current[..., 1])**2
+        block[closer] = new
+        return region
+
+    def remove(self, i):
+        v = self.vertex_ids.pop(i)
+        region = self._cell_region(v)
+        neighbors = self.dt.remove(v)
+        self.xy = np.delete(self.xy, i, axis=0)
+        if region is None:
+            region = (slice(None), slice(None))
+            candidates = None
+        else:
+            index_of = {vid: k for k, vid in enumerate(self.vertex_ids)}
+            candidates = np.array(sorted(index_of[n] for n in neighbors), dtype=np.intp)
+
+        block = self.ids[region]
+        lost = block == i
+        self.ids[self.ids > i] -= 1               # indices des sites suivants décalés
+        gx, gy = self._grid(region)
+        gx, gy = gx[lost], gy[lost]
+        if candidates is None:
+            _, nearest = KDTree(self.xy).query(np.column_stack([gx, gy]))
+            block[lost] = np.asarray(nearest).reshape(-1)
+        else:
+            # Premier indice en cas d'égalité, comme nearest_labels
+            cand = self.xy[candidates]
+            d2 = (gx[:, None] - cand[:, 0])**2 + (gy[:, None] - cand[:, 1])**2
+            block[lost] = candidates[np.argmin(d2, axis=1)]
+        return region
+
+    def voronoi_segments(self, far=1e5):
+        """
+        Arêtes de Voronoï (m, 4), duales de la triangulation : un côté commun
+        à deux triangles réels donne le segment joignant leurs centres ; un
+        côté de l'enveloppe (triangle voisin relié au super-triangle), la
+        demi-droite partant du centre vers l'extérieur, prolongée de far.
+        """
+        dt = self.dt
+        tv, tn = np.array(dt.tri_vertices), np.array(dt.tri_neighbors)
+        centers = np.array([c.center for c in dt.tri_circles])
+        real = np.array(dt.alive) & (tv.min(axis=1) >= 3)
+        t, k = np.nonzero(np.repeat(real[:, None], 3, axis=1))
+        u = tn[t, k]                              # voisin opposé au sommet k
+        inner = (u >= 0) & real[np.maximum(u, 0)]
+        once = inner & (t < u)
+        finite = np.hstack([centers[t[once]], centers[u[once]]])
+        # Enveloppe : perpendiculaire au côté (a, b), du côté opposé au sommet c
+        t, k = t[~inner], k[~inner]
+        xy = np.array(dt.vertices)
+        a, b, c = xy[tv[t, (k + 1) % 3]], xy[tv[t, (k + 2) % 3]], xy[tv[t, k]]
+        d = np.column_stack([b[:, 1] - a[:, 1], a[:, 0] - b[:, 0]])
+        d[((c - a) * d).sum(axis=1) > 0] *= -1
+        d /= np.hypot(d[:, 0], d[:, 1])[:, None]
+        rays = np.hstack([centers[t], centers[t] + d * far])
+        return np.vstack([finite, rays])
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #   INTERFACE GRAPHIQUE
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -250,18 +889,30 @@ BTN_HOVER = "#e94560"
 
 PALETTE_SEED = 42
 
+EDGE_COLOR      = "#e0e0ff"
+EDGE_MIN_PIXELS = 0.5          # arêtes plus courtes non tracées (invisibles)
+EDGES_MAX_POINTS = 50_000      # au-delà, Fortune coûte plus que le raster : cellules seules
+
 
 class VoronoiApp:
-    def __init__(self, root):
+    def __init__(self, root, raster_max_bytes=RASTER_MAX_BYTES, cache=None):
         self.root   = root
         self.root.title("Diagramme de Voronoï — Fortune's Algorithm")
         self.root.configure(bg=DARK_BG)
         self.root.geometry("1100x750")
 
         self.points  = []
+        self._index  = None        # kd-tree des sites, construit à la demande (_site_index)
+        self.cache   = cache        # DiagramCache des gros jeux de points, None : pas de cache disque
+        self._raster = None        # NearestSiteRaster, construit au premier clic après _draw
+        self._grid   = None        # (xi, yi, ids, bornes des points) du dernier _draw
+        self._edges  = None        # LineCollection des arêtes de Fortune
+        self._image  = None        # image des cellules (alpha réglé par le slider)
+        self._segments = None      # (points et boîte, arêtes) du dernier balayage
         self.opacity = tk.DoubleVar(value=0.55)
         self._colors = {}          # cache couleurs par index
         self._rng    = random.Random(PALETTE_SEED)
+        self.raster_max_bytes = raster_max_bytes
 
         self._build_ui()
         self._draw()
@@ -303,7 +954,7 @@ class VoronoiApp:
         tk.Label(panel, text="Opacité des cellules", bg=DARK_PANEL,
                  fg=BTN_FG, font=("Helvetica", 10)).pack(pady=(12,2))
         sl = ttk.Scale(panel, from_=0, to=1, variable=self.opacity,
-                       orient=tk.HORIZONTAL, command=lambda _: self._draw())
+                       orient=tk.HORIZONTAL, command=lambda _: self._set_opacity())
         sl.pack(fill=tk.X, padx=20, pady=4)
 
         # Boutons
@@ -362,7 +1013,9 @@ class VoronoiApp:
         n   = len(pts)
         self.lbl_count.config(text=f"Points : {n}")
 
+        self._raster = self._grid = self._edges = self._image = None
         if n == 0:
+            self._index = None
             ax.text(0.5, 0.5, "Cliquez pour ajouter des points",
                     ha='center', va='center', color='#4455aa',
                     fontsize=14, transform=ax.transAxes)
@@ -372,6 +1025,7 @@ class VoronoiApp:
             return
 
         xs = [p.x for p in pts]; ys = [p.y for p in pts]
+        self._index = None
         span = max(max(xs)-min(xs), max(ys)-min(ys), 50)
         mg   = span * 0.18 + 20
         xmn, xmx = min(xs)-mg, max(xs)+mg
@@ -388,30 +1042,126 @@ class VoronoiApp:
         res = 500
         xi = np.linspace(xmn, xmx, res)
         yi = np.linspace(ymn, ymx, res)
-        gx, gy = np.meshgrid(xi, yi)
-        px = np.array(xs); py = np.array(ys)
-        dist = (gx[:,:,None]-px)**2 + (gy[:,:,None]-py)**2
-        ids  = np.argmin(dist, axis=2)
-
-        palette = np.array([self._color_for(i) for i in range(n)])
-        img = palette[ids]
-        ax.imshow(img, extent=[xmn, xmx, ymn, ymx], origin='lower',
-                  interpolation='nearest', alpha=self.opacity.get(),
-                  aspect='auto', zorder=1)
+        ids = cached_nearest_labels(xs, ys, xi, yi, self.cache, max_bytes=self.raster_max_bytes,
+                                    index_factory=self._site_index)
+
+        self._palette = np.array([self._color_for(i) for i in range(n)])
+        self._rgb   = self._palette[ids]
+        self._image = ax.imshow(self._rgb, extent=[xmn, xmx, ymn, ymx], origin='lower',
+                                interpolation='nearest', alpha=self.opacity.get(),
+                                aspect='auto', zorder=1)
+        self._grid  = (xi, yi, ids, (min(xs), max(xs), min(ys), max(ys)))
+
+        # Arêtes de Fortune, toutes dans une seule LineCollection
+        if n <= EDGES_MAX_POINTS:
+            segs = self._fortune_segments(xs, ys, xmn, xmx, ymn, ymx)
+            self._edges = LineCollection(visible_segments(segs, ax, EDGE_MIN_PIXELS).reshape(-1, 2, 2),
+                                         colors=EDGE_COLOR, linewidths=0.8, alpha=0.7, zorder=3)
+            ax.add_collection(self._edges, autolim=False)
 
         # Points
-        ax.scatter(xs, ys, c='white', s=70, zorder=5,
-                   edgecolors=DARK_BG, linewidths=1.5)
+        self._scatter = ax.scatter(xs, ys, c='white', s=70, zorder=5,
+                                   edgecolors=DARK_BG, linewidths=1.5)
 
         # Labels
-        for i, p in enumerate(pts):
-            ax.annotate(f" {i+1}", (p.x, p.y), color='#ddddff',
-                        fontsize=8, zorder=6,
-                        xytext=(4, 4), textcoords='offset points')
+        self._labels = []
+        for i in range(n):
+            self._annotate(i)
 
         self._style_ax()
         self.canvas.draw()
 
+    def _fortune_segments(self, xs, ys, xmn, xmx, ymn, ymx):
+        """Arêtes de Fortune des points affichés ; un seul balayage tant que points et boîte ne changent pas."""
+        memo_key = (tuple(xs), tuple(ys), xmn, xmx, ymn, ymx)
+        if self._segments is None or self._segments[0] != memo_key:
+            self._segments = (memo_key, cached_segments(xs, ys, xmn, xmx, ymn, ymx, self.cache))
+        return self._segments[1]
+
+    def _set_opacity(self):
+        """Slider : seule la transparence de l'image change, rien n'est recalculé."""
+        if self._image is not None:
+            self._image.set_alpha(self.opacity.get())
+            self.canvas.draw_idle()
+
+    def _annotate(self, i):
+        p = self.points[i]
+        self._labels.append(self.ax.annotate(f" {i+1}", (p.x, p.y), color='#ddddff',
+                                             fontsize=8, zorder=6,
+                                             xytext=(4, 4), textcoords='offset points'))
+
+    # ── Mise à jour locale (clics) ────────────────────────────────────────────
+
+    def _incremental_raster(self):
+        """NearestSiteRaster du dernier _draw, ou None si la mise à jour locale est impossible."""
+        if self._raster is None and self._grid is not None and len(self.points) <= INCREMENTAL_MAX_POINTS:
+            xi, yi, ids, _ = self._grid
+            try:
+                self._raster = NearestSiteRaster([p.x for p in self.points], [p.y for p in self.points],
+                                                 xi, yi, ids)
+            except ValueError:       # points confondus : on garde le calcul complet
+                self._grid = None
+        return self._raster
+
+    def _same_extent(self, x, y, removing):
+        """Vrai si ajouter / retirer (x, y) laisse inchangées les bornes des points, donc le cadrage."""
+        xmin, xmax, ymin, ymax = self._grid[3]
+        if removing:
+            return xmin < x < xmax and ymin < y < ymax
+        return xmin <= x <= xmax and ymin <= y <= ymax
+
+    def _add_point(self, p):
+        raster = None
+        if self._grid is not None and self._same_extent(p.x, p.y, removing=False):
+            raster = self._incremental_raster()
+        self.points.append(p)
+        if raster is None:
+            self._draw(); return
+        try:
+            region = raster.insert(p.x, p.y)
+        except ValueError:
+            self._draw(); return
+        self._palette = np.vstack([self._palette, self._color_for(len(self.points) - 1)])
+        self._annotate(len(self.points) - 1)
+        self._refresh(region)
+
+    def _remove_point(self, i):
+        p = self.points[i]
+        raster = None
+        if self._grid is not None and len(self.points) > 2 and self._same_extent(p.x, p.y, removing=True):
+            raster = self._incremental_raster()
+        self.points.pop(i)
+        # Les couleurs suivent les points : celles des points après i reculent d'un rang
+        self._colors = {k - (k > i): c for k, c in self._colors.items() if k != i}
+        if raster is None:
+            self._draw(); return
+        region = raster.remove(i)
+        self._palette = np.delete(self._palette, i, axis=0)
+        self._labels.pop(i).remove()
+        for k in range(i, len(self._labels)):
+            self._labels[k].set_text(f" {k+1}")
+        self._refresh(region)
+
+    def _refresh(self, region):
+        """Recolore les pixels de region et redessine sans recalculer le reste."""
+        self._index = None
+        self._rgb[region] = self._palette[self._raster.ids[region]]
+        self._image.set_data(self._rgb)
+        self._scatter.set_offsets(self._raster.xy)
+        if self._edges is not None:
+            # Arêtes duales de la triangulation du raster : pas de nouveau balayage
+            xi, yi = self._raster.xi, self._raster.yi
+            clipped, keep = clip_segments(self._raster.voronoi_segments(), xi[0], xi[-1], yi[0], yi[-1])
+            self._edges.set_segments(visible_segments(clipped[keep], self.ax, EDGE_MIN_PIXELS).reshape(-1, 2, 2))
+        self.lbl_count.config(text=f"Points : {len(self.points)}")
+        self.canvas.draw_idle()
+
+    def _site_index(self):
+        """kd-tree des points affichés, construit au premier besoin après chaque _draw."""
+        if self._index is None and self.points:
+            self._index = KDTree(np.array([(p.x, p.y) for p in self.points]))
+        return self._index
+
     def _style_ax(self):
         ax = self.ax
         ax.set_title("Diagramme de Voronoï", color='#aabbff',
@@ -425,19 +1175,15 @@ class VoronoiApp:
     def _on_click(self, event):
         if event.inaxes != self.ax: return
         if event.button == 1:          # Gauche → ajouter
-            self.points.append(Point(event.xdata, event.ydata))
-            self._draw()
+            self._add_point(Point(event.xdata, event.ydata))
         elif event.button == 3:        # Droit → supprimer le plus proche
             if not self.points: return
-            dists = [(math.hypot(p.x - event.xdata, p.y - event.ydata), i)
-                     for i, p in enumerate(self.points)]
-            _, idx = min(dists)
+            dist, idx = self._site_index().query((event.xdata, event.ydata))
             # seuil de sélection en coords données
             xmn, xmx = self.ax.get_xlim()
             threshold = (xmx - xmn) * 0.04
-            if dists[idx][0] < threshold:
-                self.points.pop(idx)
-                self._draw()
+            if dist < threshold:
+                self._remove_point(idx)
 
     # ── Actions boutons ───────────────────────────────────────────────────────
 
@@ -447,24 +1193,7 @@ class VoronoiApp:
             filetypes=[("Fichiers texte", "*.txt *.csv"), ("Tous", "*.*")]
         )
         if not path: return
-        pts = []
-        try:
-            with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'): continue
-                    parts = line.replace(';', ',').split(',')
-                    if len(parts) >= 2:
-                        pts.append(Point(float(parts[0]), float(parts[1])))
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Lecture impossible :\n{e}")
-            return
-        if pts:
-            self.points = pts
-            self._colors.clear()
-            self._draw()
-        else:
-            messagebox.showwarning("Attention", "Aucun point valide trouvé.")
+        self._load_file_path(path, warn_if_empty=True)
 
     def _random_points(self):
         n = random.randint(8, 20)
@@ -487,17 +1216,10 @@ class VoronoiApp:
             self.fig.savefig(path, dpi=150, bbox_inches='tight')
             messagebox.showinfo("Exporté", f"Image sauvegardée :\n{path}")
 
-    def _load_file_path(self, path):
+    def _load_file_path(self, path, warn_if_empty=False):
         """Charge directement depuis un chemin (utilisé en argument CLI)."""
-        pts = []
         try:
-            with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'): continue
-                    parts = line.replace(';', ',').split(',')
-                    if len(parts) >= 2:
-                        pts.append(Point(float(parts[0]), float(parts[1])))
+            pts = read_points_file(path)
         except Exception as e:
             messagebox.showerror("Erreur", f"Lecture impossible :\n{e}")
             return
@@ -505,6 +1227,8 @@ class VoronoiApp:
             self.points = pts
             self._colors.clear()
             self._draw()
+        elif warn_if_empty:
+            messagebox.showwarning("Attention", "Aucun point valide trouvé.")
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -512,11 +1236,18 @@ class VoronoiApp:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
+    # Backend choisi ici et non à l'import : le module sert aussi de moteur de calcul
+    # (voronoi_core.engines) sans toucher au backend de l'appelant
+    matplotlib.use("TkAgg")
+    args = sys.argv[1:]
+    # Cache disque sur demande seulement : option --cache ou $VORONOI_CACHE_DIR
+    use_cache = "--cache" in args or bool(os.environ.get("VORONOI_CACHE_DIR"))
+    files = [a for a in args if a != "--cache"]
     root = tk.Tk()
-    app  = VoronoiApp(root)
+    app  = VoronoiApp(root, cache=DiagramCache() if use_cache else None)
 
     # Charger un fichier passé en argument si présent
-    if len(sys.argv) > 1 and os.path.isfile(sys.argv[1]):
-        app._load_file_path(sys.argv[1])
+    if files and os.path.isfile(files[0]):
+        app._load_file_path(files[0])
 
     root.mainloop()
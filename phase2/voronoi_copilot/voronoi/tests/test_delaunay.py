@@ -1,4 +1,5 @@
-from voronoi_app.delaunay import bowyer_watson
+from voronoi_app.delaunay import DelaunayTriangulation, bowyer_watson, brio_order, super_triangle
+from voronoi_app.geometry import point_in_circumcircle
 from voronoi_app.voronoi import build_voronoi
 
 def test_delaunay_simple_triangle():
@@ -31,3 +32,108 @@ def test_voronoi_edges_square():
     c = edges[0][0]
     assert abs(c[0] - 2) < 1e-9
     assert abs(c[1] - 2) < 1e-9
+
+
+def test_delaunay_empty_circumcircles():
+    import random
+    rng = random.Random(1)
+    pts = [(rng.random() * 100, rng.random() * 100) for _ in range(200)]
+    triangles = bowyer_watson(pts)
+    for tri in triangles:
+        assert not any(point_in_circumcircle(p, tri) for p in pts if p not in tri)
+
+
+def test_delaunay_grid_and_collinear_points_exact():
+    # Mailles de grille : 4 sommets cocirculaires ; 0.1 n'est pas représentable exactement
+    k = 20
+    triangles = bowyer_watson([(x * 0.1, y * 0.1) for x in range(k) for y in range(k)])
+    assert len(triangles) == 2 * (k - 1) ** 2
+    assert all(tri.orientation != 0 for tri in triangles)
+    # Points alignés : aucun triangle (dégénéré) à trianguler
+    assert bowyer_watson([(t, 0.5 * t + 100.0) for t in (i * 0.37 for i in range(3000))]) == []
+
+
+def test_delaunay_duplicate_points_ignored():
+    pts = [(0, 0), (4, 0), (2, 3), (4, 0), (2, 3)]
+    triangles = bowyer_watson(pts)
+    assert len(triangles) == 1
+
+
+def test_brio_order_is_permutation():
+    import random
+    rng = random.Random(2)
+    pts = [(rng.random(), rng.random()) for _ in range(1000)]
+    assert sorted(brio_order(pts)) == list(range(1000))
+
+
+def test_triangulation_adjacency_consistent():
+    import random
+    rng = random.Random(3)
+    pts = [(rng.random(), rng.random()) for _ in range(300)]
+    dt = DelaunayTriangulation(super_triangle(pts))
+    for p in pts:
+        dt.insert(p)
+    for t, alive in enumerate(dt.alive):
+        if not alive:
+            continue
+        verts = dt.tri_vertices[t]
+        for k, n in enumerate(dt.tri_neighbors[t]):
+            if n == -1:
+                continue
+            assert dt.alive[n]
+            assert t in dt.tri_neighbors[n]
+            edge = {verts[(k + 1) % 3], verts[(k + 2) % 3]}
+            assert edge <= set(dt.tri_vertices[n])
+
+
+def _check_delaunay(dt):
+    """Adjacence cohérente et cercles circonscrits vides."""
+    live = [t for t, alive in enumerate(dt.alive) if alive]
+    used = {i for t in live for i in dt.tri_vertices[t]}
+    for t in live:
+        verts = dt.tri_vertices[t]
+        for k, n in enumerate(dt.tri_neighbors[t]):
+            if n == -1:
+                continue
+            assert dt.alive[n] and dt.tri_neighbors[n].count(t) == 1
+            assert {verts[(k + 1) % 3], verts[(k + 2) % 3]} <= set(dt.tri_vertices[n])
+        circle = dt.tri_circles[t]
+        assert not any(circle.contains(dt.vertices[i]) for i in used if i not in verts)
+    for i in used:
+        assert i in dt.tri_vertices[dt.vertex_triangle[i]]
+
+
+def test_remove_keeps_delaunay():
+    import random
+    rng = random.Random(4)
+    pts = [(rng.random(), rng.random()) for _ in range(120)]
+    dt = DelaunayTriangulation(super_triangle(pts))
+    ids = [dt.insert(p) for p in pts]
+    for v in rng.sample(ids, 60):
+        neighbors = dt.neighbors(v)
+        assert dt.remove(v) == neighbors
+        _check_delaunay(dt)
+    remaining = {dt.vertices[v] for v in ids if dt.vertex_triangle[v] != -1}
+    assert {p for tri in dt.triangles() for p in tri} == remaining
+
+
+def test_remove_on_grid_then_reinsert():
+    pts = [(float(x), float(y)) for x in range(6) for y in range(6)]
+    dt = DelaunayTriangulation(super_triangle(pts))
+    ids = [dt.insert(p) for p in pts]
+    dt.remove(ids[14])
+    _check_delaunay(dt)
+    assert dt.insert(pts[14]) != -1
+    _check_delaunay(dt)
+    assert len(dt.triangles()) == 2 * 5 * 5
+
+
+def test_star_is_counterclockwise_cell():
+    pts = [(0, 0), (4, 0), (4, 4), (0, 4), (2, 2)]
+    dt = DelaunayTriangulation(super_triangle(pts))
+    ids = [dt.insert(p) for p in pts]
+    assert sorted(dt.neighbors(ids[4])) == sorted(ids[:4])
+    centers = [dt.tri_circles[t].center for t in dt.star(ids[4])]
+    assert len(centers) == 4
+    area = sum(a[0] * b[1] - b[0] * a[1] for a, b in zip(centers, centers[1:] + centers[:1]))
+    assert area > 0
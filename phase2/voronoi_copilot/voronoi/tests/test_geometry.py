@@ -1,5 +1,5 @@
 import math
-from voronoi_app.geometry import circumcircle, point_in_circumcircle
+from voronoi_app.geometry import CircumTriangle, circumcircle, point_in_circumcircle
 
 def test_circumcircle_equilateral():
     tri = [(0, 0), (2, 0), (1, math.sqrt(3))]
@@ -29,3 +29,27 @@ def test_circumcircle_collinear_points():
     tri = [(0, 0), (1, 1), (2, 2)]  # colinéaires
     center, radius = circumcircle(tri)
     assert radius > 1e6  # cercle "infini"
+
+
+def test_circum_triangle_caches_circle():
+    tri = CircumTriangle((0, 0), (2, 0), (1, math.sqrt(3)))
+    center, radius = circumcircle(tri)
+    assert abs(tri.center[0] - center[0]) < 1e-12
+    assert abs(tri.center[1] - center[1]) < 1e-12
+    assert abs(tri.r2 - radius ** 2) < 1e-9
+
+
+def test_circum_triangle_is_a_triangle():
+    pts = ((0, 0), (4, 0), (2, 4))
+    tri = CircumTriangle(*pts)
+    assert tri == pts
+    assert set(tri) == set(pts)
+    assert tri.contains((2, 1)) and point_in_circumcircle((2, 1), tri)
+    assert not tri.contains((10, 10))
+
+
+def test_circum_triangle_pickle():
+    import pickle
+    tri = CircumTriangle((0, 0), (4, 0), (2, 4))
+    copy = pickle.loads(pickle.dumps(tri))
+    assert copy == tri and copy.center == tri.center and copy.r2 == tri.r2
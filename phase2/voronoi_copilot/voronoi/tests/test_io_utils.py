@@ -1,5 +1,7 @@
 import tempfile
-from voronoi_app.io_utils import load_points_from_file
+import numpy as np
+
+from voronoi_app.io_utils import iter_points_blocks, load_points_array, load_points_from_file
 
 def test_load_points_basic():
     content = "1,2\n3,4\n5,6\n"
@@ -30,3 +32,38 @@ def test_load_points_invalid():
         assert False, "Should raise ValueError"
     except ValueError:
         pass
+
+def test_load_points_comments_and_semicolons():
+    content = "# en-tête\n1;2\n\n3 , 4  # fin de ligne\n"
+    with tempfile.NamedTemporaryFile("w+", delete=False) as f:
+        f.write(content)
+        fname = f.name
+
+    pts = load_points_from_file(fname)
+    assert pts == [(1, 2), (3, 4)]
+
+def test_load_points_array_and_blocks():
+    content = "".join(f"{i},{i / 2}\n" for i in range(10))
+    with tempfile.NamedTemporaryFile("w+", delete=False) as f:
+        f.write(content)
+        fname = f.name
+
+    arr = load_points_array(fname)
+    assert arr.shape == (10, 2) and arr.dtype == np.float64
+    blocks = list(iter_points_blocks(fname, block_size=4))
+    assert [len(b) for b in blocks] == [4, 4, 2]
+    assert np.array_equal(np.concatenate(blocks), arr)
+
+def test_load_points_binary_memmap():
+    from voronoi_core.points_bin import write_points_binary
+    from voronoi_app.delaunay import bowyer_watson
+
+    with tempfile.NamedTemporaryFile(suffix=".vpts", delete=False) as f:
+        fname = f.name
+    pts = [(0.0, 0.0), (4.0, 0.0), (2.0, 3.0), (2.0, 1.0)]
+    write_points_binary(fname, pts)
+
+    arr = load_points_array(fname)
+    assert isinstance(arr, np.memmap)
+    assert load_points_from_file(fname) == pts
+    assert len(bowyer_watson(arr)) == len(bowyer_watson(pts)) == 3
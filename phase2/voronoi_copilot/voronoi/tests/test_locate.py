@@ -0,0 +1,38 @@
+import numpy as np
+
+from voronoi_app.delaunay import _hilbert_index
+from voronoi_app.locate import CellLocator, hilbert_keys, locate
+
+
+def _nearest_distances(points, queries):
+    return np.sqrt(((queries[:, None, :] - points[None, :, :]) ** 2).sum(axis=-1)).min(axis=1)
+
+
+def test_locate_matches_brute_force():
+    rng = np.random.default_rng(7)
+    pts = rng.uniform(0, 100, (1500, 2))
+    queries = rng.uniform(-30, 130, (4000, 2))          # dedans et hors de l'enveloppe
+    found = locate(pts, queries)
+    assert found.shape == (4000,) and found.dtype == np.intp
+    assert np.array_equal(found, np.argmin(((queries[:, None] - pts[None]) ** 2).sum(axis=-1), axis=1))
+
+
+def test_locate_grid_ties_and_presorted_stream():
+    pts = np.array([(x, y) for x in range(30) for y in range(30)], dtype=float)
+    locator = CellLocator(pts)
+    # Requêtes sur les médiatrices et les sommets de Voronoï : toute réponse équidistante convient
+    queries = np.array([(x * 0.5, y * 0.5) for x in range(-4, 62) for y in range(-4, 62)])
+    found = locator.locate(queries, presorted=True)
+    assert np.allclose(np.hypot(*(queries - pts[found]).T), _nearest_distances(pts, queries))
+
+
+def test_locate_few_or_duplicated_sites():
+    assert locate([(1.0, 2.0)], [(5, 5), (-3, 0)]).tolist() == [0, 0]
+    found = locate([(0, 0), (10, 0), (0, 0)], [(1, 1), (9, 0), (-1, -1)])
+    assert found[1] == 1 and set(found[[0, 2]].tolist()) <= {0, 2}
+    assert locate([(0, 0), (10, 0), (0, 0)], np.zeros((0, 2))).shape == (0,)
+
+
+def test_hilbert_keys_match_scalar_version():
+    xy = np.random.default_rng(0).integers(0, 1 << 16, (500, 2))
+    assert hilbert_keys(xy[:, 0], xy[:, 1]).tolist() == [_hilbert_index(x, y) for x, y in xy.tolist()]
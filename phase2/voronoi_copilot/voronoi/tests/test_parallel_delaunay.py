@@ -0,0 +1,38 @@
+import numpy as np
+
+from voronoi_app.delaunay import bowyer_watson
+from voronoi_app.parallel_delaunay import parallel_delaunay, parallel_delaunay_indices
+
+
+def _triangle_set(points, triangles):
+    return {frozenset(map(tuple, points[list(tri)].tolist())) for tri in triangles}
+
+
+def test_parallel_same_triangles_as_bowyer_watson():
+    rng = np.random.default_rng(4)
+    pts = rng.uniform(0, 1000, (3000, 2))
+    expected = {frozenset(tri) for tri in bowyer_watson(pts)}
+    for strips in (2, 5, 9):
+        triangles = parallel_delaunay_indices(pts, max_workers=1, strip_count=strips)
+        assert _triangle_set(pts, triangles) == expected
+
+
+def test_parallel_grid_covers_hull_once():
+    # Mailles cocirculaires : diagonales libres, mais ni trou ni recouvrement
+    k = 40
+    pts = np.array([(x * 0.1, y * 0.1) for x in range(k) for y in range(k)])
+    triangles = parallel_delaunay_indices(pts, max_workers=1, strip_count=6)
+    assert len(triangles) == 2 * (k - 1) ** 2
+    assert len({frozenset(tri) for tri in triangles.tolist()}) == len(triangles)
+    a, b, c = (pts[triangles[:, i]] for i in range(3))
+    area = ((b - a)[:, 0] * (c - a)[:, 1] - (b - a)[:, 1] * (c - a)[:, 0]) / 2
+    assert np.all(area > 0)
+    assert np.isclose(area.sum(), ((k - 1) * 0.1) ** 2)
+
+
+def test_parallel_process_pool():
+    rng = np.random.default_rng(5)
+    pts = rng.normal(0, 50, (5000, 2))
+    triangles = parallel_delaunay(pts, max_workers=2)
+    assert {frozenset(tri) for tri in triangles} == {frozenset(tri) for tri in bowyer_watson(pts)}
+    assert parallel_delaunay(pts[:100], max_workers=2) == bowyer_watson(pts[:100])
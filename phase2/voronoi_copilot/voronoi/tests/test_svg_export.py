@@ -0,0 +1,77 @@
+import gzip
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from voronoi_app import svg_export
+from voronoi_app.svg_export import export_voronoi_cells_svg, export_voronoi_graph_svg
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def _paths(root):
+    return root.findall(f"{SVG}path")
+
+
+def test_graph_one_path_per_layer(tmp_path):
+    points = [(0, 0), (4, 0), (2, 3)]
+    centers = [(2, 0.8333333333)]
+    edges = [((2, 0.8333333333), (2, -10)), ((2, 0.8333333333), (10.123456, 5))]
+    out = tmp_path / "graph.svg"
+    export_voronoi_graph_svg(points, centers, edges, str(out), precision=2)
+
+    root = ET.parse(out).getroot()
+    assert root.get("viewBox") == "-1 -1 6 5"
+    edge_path, point_path = _paths(root)
+    assert edge_path.get("d") == "M2 0.83L2 -10M2 0.83L10.12 5"
+    assert edge_path.get("stroke") == "green" and edge_path.get("fill") == "none"
+    assert point_path.get("fill") == "blue" and point_path.get("d").count("M") == 3
+
+
+def test_arrays_and_lists_give_same_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(svg_export, "CHUNK", 7)          # plusieurs blocs par couche
+    rng = np.random.default_rng(0)
+    points = rng.random((30, 2)) * 10
+    segments = rng.random((50, 4)) * 10
+    edges = [((a, b), (c, d)) for a, b, c, d in segments.tolist()]
+    export_voronoi_graph_svg(points, points[:5], segments, str(tmp_path / "a.svg"))
+    export_voronoi_graph_svg(points.tolist(), points[:5].tolist(), edges, str(tmp_path / "l.svg"))
+    assert (tmp_path / "a.svg").read_text() == (tmp_path / "l.svg").read_text()
+    assert _paths(ET.parse(tmp_path / "a.svg").getroot())[0].get("d").count("M") == 50
+
+
+def test_cells_svgz(tmp_path):
+    cells = [[(0, 0), (1, 0), (1, 1)], [(2, 2), (3, 2)], [(5, 5), (6, 5.5), (6, 6), (5, 6)]]
+    out = tmp_path / "cells.svgz"
+    export_voronoi_cells_svg([(0.5, 0.5), (5.5, 5.7)], cells, str(out))
+
+    with gzip.open(out, "rt", encoding="utf-8") as f:
+        root = ET.fromstring(f.read())
+    cell_path, _ = _paths(root)
+    assert cell_path.get("d") == "M0 0L1 0L1 1ZM5 5L6 5.5L6 6L5 6Z"     # cellule à 2 sommets ignorée
+
+
+class _OneShot:
+    """Itérable qui compte ses parcours."""
+
+    def __init__(self, cells):
+        self.cells = cells
+        self.passes = 0
+
+    def __iter__(self):
+        self.passes += 1
+        return iter(self.cells)
+
+
+def test_cells_iterable_read_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(svg_export, "CHUNK", 3)
+    rng = np.random.default_rng(1)
+    cells = [rng.random((int(rng.integers(2, 7)), 2)).tolist() for _ in range(20)]
+    points = rng.random((5, 2))
+    export_voronoi_cells_svg(points, cells, str(tmp_path / "list.svg"))
+    once = _OneShot(cells)
+    export_voronoi_cells_svg(points, once, str(tmp_path / "iter.svg"))
+    export_voronoi_cells_svg(points, (cell for cell in cells), str(tmp_path / "gen.svg"))
+    assert once.passes == 1
+    assert (tmp_path / "iter.svg").read_text() == (tmp_path / "list.svg").read_text()
+    assert (tmp_path / "gen.svg").read_text() == (tmp_path / "list.svg").read_text()
@@ -25,3 +25,56 @@ def test_voronoi_edges_connect_centers():
     for a, b in edges:
         assert a in centers
         assert b in centers
+
+
+def test_voronoi_edges_match_shared_sides():
+    import random
+    rng = random.Random(4)
+    pts = [(rng.random() * 10, rng.random() * 10) for _ in range(60)]
+    triangles = bowyer_watson(pts)
+    centers, edges, pairs = build_voronoi(triangles, return_indices=True)
+
+    expected = {
+        (i, j)
+        for i in range(len(triangles))
+        for j in range(i + 1, len(triangles))
+        if len(set(triangles[i]) & set(triangles[j])) == 2
+    }
+    assert {tuple(sorted(p)) for p in pairs.tolist()} == expected
+    assert pairs.shape == (len(edges), 2)
+    for (a, b), (i, j) in zip(edges, pairs.tolist()):
+        assert a == centers[i] and b == centers[j]
+
+
+def test_compute_diagram_cache(tmp_path, monkeypatch):
+    import numpy as np
+    from voronoi_core.diagram_cache import DiagramCache
+    from voronoi_app import cli
+
+    pts = np.array([(0, 0), (4, 0), (4, 4), (0, 4), (2, 1), (3, 3)], dtype=float)
+    cache = DiagramCache(tmp_path)
+    first = cli.compute_diagram(pts, cache)
+    assert first["triangles"].shape[1] == 3 and len(first["centers"]) == len(first["triangles"])
+
+    # Second appel : relu depuis le disque, sans retrianguler
+    monkeypatch.setattr(cli, "bowyer_watson", None)
+    second = cli.compute_diagram(pts, cache)
+    for name in ("triangles", "centers", "pairs"):
+        assert np.array_equal(first[name], second[name])
+
+
+def test_plot_diagram_single_collection():
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from voronoi_app import cli
+
+    rng = np.random.default_rng(0)
+    pts = rng.random((200, 2)) * 10
+    diagram = cli.compute_diagram(pts)
+    fig, ax = plt.subplots()
+    cli.plot_diagram(ax, pts, diagram)
+    assert len(ax.collections) == 1 and len(ax.lines) == 1     # arêtes + points
+    assert len(ax.collections[0].get_segments()) == len(diagram["pairs"])
+    plt.close(fig)
@@ -1 +1,6 @@
-# voronoi_app package
\ No newline at end of file
+# voronoi_app package
+import os
+import sys
+
+# Code partagé entre les versions du projet (dossier commun/ à la racine du dépôt)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "commun"))
@@ -1,49 +1,94 @@
 import sys
 import matplotlib.pyplot as plt
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from voronoi_app.io_utils import load_points_from_file
-from voronoi_app.delaunay import bowyer_watson
-from voronoi_app.voronoi import build_voronoi
+import numpy as np
+from voronoi_core.diagram_cache import DiagramCache, cache_key
+from voronoi_core.render import segment_collection
+
+from .io_utils import load_points_array
+from .delaunay import bowyer_watson
+from .voronoi import build_voronoi
 
 Point = Tuple[float, float]
 
+USAGE = "Usage : python -m voronoi_app.cli <points.txt> [--no-cache] [--decimate]"
 
-def main() -> None:
+# Avec --decimate, les arêtes de moins d'un demi-pixel ne sont pas tracées
+DECIMATE_PIXELS = 0.5
+
+
+def compute_diagram(points: np.ndarray, cache: Optional[DiagramCache] = None) -> Dict[str, np.ndarray]:
     """
-    Lit un fichier de points, calcule Delaunay + Voronoï, et affiche le résultat.
+    Delaunay + Voronoï des points (n, 2), sous forme de tableaux :
+      - triangles : (m, 3) int32, indices des sommets dans points,
+      - centers   : (m, 2) float64, centre du cercle circonscrit de chaque triangle,
+      - pairs     : (k, 2) int32, arête de Voronoï k = centers[pairs[k, 0]] → centers[pairs[k, 1]].
+    Avec un cache, un résultat déjà calculé pour les mêmes points est relu
+    au lieu d'être recalculé.
+    """
+    def compute() -> Dict[str, np.ndarray]:
+        point_list: List[Point] = [(x, y) for x, y in np.asarray(points).tolist()]
+        triangles = bowyer_watson(point_list)
+        centers, _, pairs = build_voronoi(triangles, return_indices=True)
+        index_of = {p: i for i, p in enumerate(point_list)}
+        return {
+            "triangles": np.array([[index_of[p] for p in tri] for tri in triangles], dtype=np.int32).reshape(-1, 3),
+            "centers": np.array(centers, dtype=np.float64).reshape(-1, 2),
+            "pairs": pairs.astype(np.int32),
+        }
+
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(cache_key(points, "bowyer_watson"), compute)
+
+
+def plot_diagram(ax, points: np.ndarray, diagram: Dict[str, np.ndarray], min_pixels: float = 0.0) -> None:
+    """
+    Trace les arêtes du Voronoï (une seule LineCollection) et les points dans ax.
+    Avec min_pixels > 0, les arêtes plus courtes que min_pixels à l'écran sont omises.
     """
+    centers, pairs = diagram["centers"], diagram["pairs"]
+    xs, ys = points[:, 0], points[:, 1]
 
-    if len(sys.argv) != 2:
-        print("Usage : python -m voronoi_app.cli <points.txt>")
-        sys.exit(1)
+    ax.set_aspect("equal")
+    ax.set_xlim(xs.min() - 1, xs.max() + 1)
+    ax.set_ylim(ys.min() - 1, ys.max() + 1)
 
-    filename = sys.argv[1]
+    # Arêtes du Voronoï
+    segments = np.hstack([centers[pairs[:, 0]], centers[pairs[:, 1]]]) if len(pairs) else np.zeros((0, 4))
+    segment_collection(segments, ax, min_pixels, colors="black", linewidths=1.0)
 
-    # Charger les points depuis le fichier
-    points: List[Point] = load_points_from_file(filename)
+    # Points
+    ax.plot(xs, ys, "o", color="tab:blue", markersize=5)
 
-    # Triangulation de Delaunay
-    triangles = bowyer_watson(points)
 
-    # Diagramme de Voronoï
-    centers, edges = build_voronoi(triangles)
+def main() -> None:
+    """
+    Lit un fichier de points, calcule Delaunay + Voronoï, et affiche le résultat.
+    Le résultat est gardé dans le cache disque (voronoi_core.diagram_cache) :
+    relancer sur le même fichier ne recalcule rien, sauf avec --no-cache.
+    --decimate omet les arêtes de moins d'un demi-pixel (gros diagrammes).
+    """
 
-    fig, ax = plt.subplots()
+    args = sys.argv[1:]
+    use_cache = "--no-cache" not in args
+    min_pixels = DECIMATE_PIXELS if "--decimate" in args else 0.0
+    args = [a for a in args if a not in ("--no-cache", "--decimate")]
+    if len(args) != 1:
+        print(USAGE)
+        sys.exit(1)
 
-    # Arêtes du Voronoï
-    for a, b in edges:
-        ax.plot([a[0], b[0]], [a[1], b[1]],
-                color="black", linewidth=1.0)
+    filename = args[0]
 
-    # Points
-    xs, ys = zip(*points)
-    ax.plot(xs, ys, "o", color="tab:blue", markersize=5)
+    # Charger les points depuis le fichier
+    points = load_points_array(filename)
 
-    ax.set_aspect("equal")
-    ax.set_xlim(min(xs) - 1, max(xs) + 1)
-    ax.set_ylim(min(ys) - 1, max(ys) + 1)
+    # Triangulation de Delaunay + diagramme de Voronoï
+    diagram = compute_diagram(points, DiagramCache() if use_cache else None)
 
+    fig, ax = plt.subplots()
+    plot_diagram(ax, points, diagram, min_pixels)
     plt.show()
 
 
@@ -1,63 +1,407 @@
-from typing import List, Tuple
+import random
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
-from voronoi_app.geometry import point_in_circumcircle
+import numpy as np
+
+from .geometry import CircumTriangle
+from voronoi_core.predicates import orient2d
 
 Point = Tuple[float, float]
 Triangle = Tuple[Point, Point, Point]
 
+HILBERT_ORDER = 16
+BRIO_MIN_ROUND = 32
+
 
-def bowyer_watson(points: List[Point]) -> List[Triangle]:
+def _orient(a: Point, b: Point, c: Point) -> float:
     """
-    Algorithme de Bowyer-Watson pour construire la triangulation de Delaunay
-    à partir d'une liste de points.
-    Retourne une liste de triangles (triplets de points).
+    > 0 si c est à gauche de a→b (sens trigonométrique), < 0 à droite, 0 si aligné.
+    Signe exact (voronoi_core.predicates.orient2d).
     """
-    if len(points) < 3:
+    return orient2d(a[0], a[1], b[0], b[1], c[0], c[1])
+
+
+def _hilbert_index(x: int, y: int, order: int = HILBERT_ORDER) -> int:
+    """
+    Position de la cellule entière (x, y) sur la courbe de Hilbert
+    d'une grille 2^order × 2^order.
+    """
+    n = 1 << order
+    d = 0
+    s = n >> 1
+    while s > 0:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        d += s * s * ((3 * rx) ^ ry)
+        if ry == 0:
+            if rx == 1:
+                x = n - 1 - x
+                y = n - 1 - y
+            x, y = y, x
+        s >>= 1
+    return d
+
+
+def brio_order(points: Sequence[Point], seed: int = 0) -> List[int]:
+    """
+    Ordre d'insertion BRIO (Biased Randomized Insertion Order) :
+    les points sont mélangés puis répartis en rondes de tailles doublées
+    (1/2 des points dans la dernière, 1/4 dans l'avant-dernière, ...),
+    chaque ronde étant triée le long d'une courbe de Hilbert.
+    Deux points insérés à la suite sont donc proches dans le plan.
+    """
+    n = len(points)
+    if n == 0:
         return []
 
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    xmin, ymin = min(xs), min(ys)
+    span = max(max(xs) - xmin, max(ys) - ymin) or 1.0
+    scale = ((1 << HILBERT_ORDER) - 1) / span
+    keys = [
+        _hilbert_index(int((x - xmin) * scale), int((y - ymin) * scale))
+        for x, y in zip(xs, ys)
+    ]
+
+    idx = list(range(n))
+    random.Random(seed).shuffle(idx)
+
+    rounds: List[List[int]] = []
+    end = n
+    while end > 0:
+        start = end // 2 if end > BRIO_MIN_ROUND else 0
+        rounds.append(idx[start:end])
+        end = start
+
+    order: List[int] = []
+    for r in reversed(rounds):
+        order.extend(sorted(r, key=keys.__getitem__))
+    return order
+
+
+class DelaunayTriangulation:
+    """
+    Triangulation de Delaunay incrémentale (Bowyer-Watson) avec adjacence.
+
+    Chaque triangle t est stocké dans des tableaux parallèles :
+      - tri_vertices[t] = [a, b, c]  indices des sommets, sens trigonométrique,
+      - tri_neighbors[t] = [na, nb, nc]  triangle opposé au sommet a, b, c
+        (-1 au bord du super-triangle),
+      - tri_circles[t] : CircumTriangle (points + cercle circonscrit calculé
+        une seule fois, à la création du triangle).
+    Les emplacements des triangles détruits sont recyclés.
+
+    L'insertion localise le triangle contenant le point par une marche
+    depuis le dernier triangle créé, puis trouve la cavité (triangles dont
+    le cercle circonscrit contient le point) par propagation aux voisins.
+    La suppression retriangule le trou laissé par l'étoile du sommet
+    (triangles qui le contiennent) sans toucher au reste.
+    vertex_triangle[v] est un triangle vivant contenant v (-1 si v a été
+    supprimé) : point de départ pour tourner autour de v.
+    """
+
+    def __init__(self, super_triangle: Triangle) -> None:
+        a, b, c = super_triangle
+        if _orient(a, b, c) < 0:
+            b, c = c, b
+        self.vertices: List[Point] = [a, b, c]
+        self.tri_vertices: List[List[int]] = [[0, 1, 2]]
+        self.tri_neighbors: List[List[int]] = [[-1, -1, -1]]
+        self.tri_circles: List[CircumTriangle] = [CircumTriangle(a, b, c)]
+        self.alive: List[bool] = [True]
+        self.vertex_triangle: List[int] = [0, 0, 0]
+        self._free: List[int] = []
+        self.last = 0
+
+    # ── Requêtes ─────────────────────────────────────────────────────────────
+
+    def locate(self, p: Point, start: Optional[int] = None) -> int:
+        """
+        Retourne un triangle vivant contenant p (bord inclus), par marche
+        orientée depuis start (par défaut le dernier triangle créé).
+        """
+        t = self.last if start is None else start
+        if not self.alive[t]:
+            t = self.alive.index(True)
+        v = self.vertices
+        tv = self.tri_vertices
+        tn = self.tri_neighbors
+        came_from = -1
+        for _ in range(len(tv) + 1):
+            verts = tv[t]
+            nxt = -1
+            for k in range(3):
+                n = tn[t][k]
+                if n == came_from and n != -1:
+                    continue
+                a = v[verts[(k + 1) % 3]]
+                b = v[verts[(k + 2) % 3]]
+                if _orient(a, b, p) < 0:
+                    nxt = n
+                    break
+            else:
+                return t
+            if nxt == -1:
+                raise ValueError(f"Point {p} hors du super-triangle")
+            came_from, t = t, nxt
+
+        # Marche bloquée (cas numériquement dégénéré) : recherche exhaustive
+        for t, verts in enumerate(tv):
+            if self.alive[t] and all(
+                _orient(v[verts[(k + 1) % 3]], v[verts[(k + 2) % 3]], p) >= 0
+                for k in range(3)
+            ):
+                return t
+        raise ValueError(f"Point {p} hors du super-triangle")
+
+    # ── Insertion ────────────────────────────────────────────────────────────
+
+    def _new_triangle(self, verts: List[int], neighbors: List[int]) -> int:
+        v = self.vertices
+        circle = CircumTriangle(v[verts[0]], v[verts[1]], v[verts[2]])
+        if self._free:
+            t = self._free.pop()
+            self.tri_vertices[t] = verts
+            self.tri_neighbors[t] = neighbors
+            self.tri_circles[t] = circle
+            self.alive[t] = True
+        else:
+            t = len(self.tri_vertices)
+            self.tri_vertices.append(verts)
+            self.tri_neighbors.append(neighbors)
+            self.tri_circles.append(circle)
+            self.alive.append(True)
+        for i in verts:
+            self.vertex_triangle[i] = t
+        return t
+
+    def insert(self, p: Point) -> int:
+        """
+        Insère p et retourne son indice de sommet, ou -1 si p est confondu
+        avec un sommet existant (aucun cercle ne le contient strictement).
+        """
+        t0 = self.locate(p)
+        circles = self.tri_circles
+        if not circles[t0].contains(p):
+            return -1
+
+        tn = self.tri_neighbors
+        tv = self.tri_vertices
+
+        # Cavité : propagation aux voisins dont le cercle contient p
+        bad = {t0}
+        stack = [t0]
+        # (a, b, triangle extérieur, position du pointeur retour dans celui-ci)
+        boundary: List[Tuple[int, int, int, int]] = []
+        while stack:
+            t = stack.pop()
+            verts = tv[t]
+            for k in range(3):
+                n = tn[t][k]
+                if n in bad:
+                    continue
+                if n != -1 and circles[n].contains(p):
+                    bad.add(n)
+                    stack.append(n)
+                else:
+                    back = tn[n].index(t) if n != -1 else -1
+                    boundary.append((verts[(k + 1) % 3], verts[(k + 2) % 3], n, back))
+
+        for t in bad:
+            self.alive[t] = False
+            self._free.append(t)
+
+        # Éventail de triangles (a, b, p) autour du nouveau sommet
+        ip = len(self.vertices)
+        self.vertices.append(p)
+        self.vertex_triangle.append(-1)
+        by_first: Dict[int, int] = {}
+        created: List[int] = []
+        for a, b, n, back in boundary:
+            t = self._new_triangle([a, b, ip], [-1, -1, n])
+            by_first[a] = t
+            created.append(t)
+            if n != -1:
+                tn[n][back] = t
+
+        for t in created:
+            a, b, _ = tv[t]
+            after = by_first[b]           # triangle (b, c, p) : partage l'arête b-p
+            tn[t][0] = after
+            tn[after][1] = t              # côté (p, b) de ce triangle
+
+        self.last = created[-1]
+        return ip
+
+    # ── Voisinage et suppression ─────────────────────────────────────────────
+
+    def star(self, v: int) -> List[int]:
+        """
+        Triangles contenant le sommet v, dans le sens trigonométrique autour
+        de v. Les cercles circonscrits de ces triangles sont les sommets de la
+        cellule de Voronoï de v.
+        """
+        t0 = self.vertex_triangle[v]
+        if t0 == -1:
+            raise ValueError(f"Sommet {v} supprimé")
+        tv = self.tri_vertices
+        tn = self.tri_neighbors
+        triangles: List[int] = []
+        t = t0
+        while True:
+            triangles.append(t)
+            k = tv[t].index(v)
+            # Triangle suivant : celui qui partage le côté (v, sommet k+2)
+            t = tn[t][(k + 1) % 3]
+            if t == t0:
+                return triangles
+            if t == -1:
+                raise ValueError(f"Sommet {v} sur le bord du super-triangle")
+
+    def neighbors(self, v: int) -> List[int]:
+        """Sommets reliés à v, dans le sens trigonométrique."""
+        tv = self.tri_vertices
+        return [tv[t][(tv[t].index(v) + 1) % 3] for t in self.star(v)]
+
+    def remove(self, v: int) -> List[int]:
+        """
+        Supprime le sommet v (hors super-triangle) et retourne ses anciens
+        voisins, dans le sens trigonométrique.
+
+        Le trou laissé par l'étoile de v est un polygone étoilé ; on y coupe
+        une à une des oreilles (a, b, c) convexes dont le cercle circonscrit
+        ne contient aucun autre sommet du polygone : chaque triangle créé
+        est de Delaunay et seuls les triangles du trou changent.
+        """
+        if v < 3:
+            raise ValueError("Les sommets du super-triangle ne peuvent pas être supprimés")
+        tv = self.tri_vertices
+        tn = self.tri_neighbors
+        star = self.star(v)
+
+        # Polygone du trou, et pour chacun de ses côtés le triangle extérieur
+        # (avec la position du pointeur à remettre à jour dans celui-ci)
+        polygon: List[int] = []
+        outside: List[Tuple[int, int]] = []
+        for t in star:
+            k = tv[t].index(v)
+            polygon.append(tv[t][(k + 1) % 3])
+            n = tn[t][k]
+            outside.append((n, tn[n].index(t) if n != -1 else -1))
+        neighbors = list(polygon)
+
+        for t in star:
+            self.alive[t] = False
+            self._free.append(t)
+        self.vertex_triangle[v] = -1
+
+        while True:
+            m = len(polygon)
+            if m == 3:
+                ear = 1
+            else:
+                ear = self._delaunay_ear(polygon)
+            a, b, c = polygon[ear - 1], polygon[ear], polygon[(ear + 1) % m]
+            (na, a_back), (nc, c_back) = outside[ear], outside[ear - 1]
+            if m == 3:
+                nb, b_back = outside[(ear + 1) % m]
+            else:
+                nb, b_back = -1, -1
+            # Voisin opposé à a : côté (b, c) ; opposé à b : (c, a) ; opposé à c : (a, b)
+            t = self._new_triangle([a, b, c], [na, nb, nc])
+            for n, back in ((na, a_back), (nb, b_back), (nc, c_back)):
+                if n != -1:
+                    tn[n][back] = t
+            if m == 3:
+                break
+            # Le côté (a, c) du polygone restant a pour extérieur le nouveau triangle
+            del polygon[ear]
+            outside[ear - 1] = (t, 1)
+            del outside[ear]
+
+        self.last = t
+        return neighbors
+
+    def _delaunay_ear(self, polygon: List[int]) -> int:
+        """
+        Position b d'une oreille (a, b, c) du polygone (sens trigonométrique)
+        convexe et dont le cercle circonscrit ne contient aucun autre sommet.
+        À défaut (arrondis), l'oreille convexe dont le cercle contient le
+        moins de sommets.
+        """
+        v = self.vertices
+        m = len(polygon)
+        best, best_count = -1, m + 1
+        for i in range(m):
+            a, b, c = v[polygon[i - 1]], v[polygon[i]], v[polygon[(i + 1) % m]]
+            if _orient(a, b, c) <= 0:
+                continue
+            circle = CircumTriangle(a, b, c)
+            count = sum(1 for j in range(m)
+                        if j not in (i - 1 if i else m - 1, i, (i + 1) % m) and circle.contains(v[polygon[j]]))
+            if count == 0:
+                return i
+            if count < best_count:
+                best, best_count = i, count
+        return best if best != -1 else 1
+
+    # ── Résultat ─────────────────────────────────────────────────────────────
+
+    def triangles(self, skip_vertices: int = 3) -> List[CircumTriangle]:
+        """
+        Triangles vivants dont aucun sommet n'est parmi les skip_vertices
+        premiers (le super-triangle), avec leur cercle circonscrit.
+        """
+        out: List[CircumTriangle] = []
+        for t, verts in enumerate(self.tri_vertices):
+            if not self.alive[t]:
+                continue
+            a, b, c = verts
+            if a < skip_vertices or b < skip_vertices or c < skip_vertices:
+                continue
+            out.append(self.tri_circles[t])
+        return out
+
+
+def super_triangle(points: Sequence[Point]) -> Triangle:
+    """
+    Super-triangle englobant tous les points.
+    """
     xs = [p[0] for p in points]
     ys = [p[1] for p in points]
     xmin, xmax = min(xs), max(xs)
     ymin, ymax = min(ys), max(ys)
     dx = xmax - xmin
     dy = ymax - ymin
-    dmax = max(dx, dy) * 10
+    dmax = max(dx, dy) * 10 or 1.0
 
     p1: Point = (xmin - dmax, ymin - dmax)
     p2: Point = (xmin + 2 * dmax, ymin - dmax)
     p3: Point = (xmin - dmax, ymin + 2 * dmax)
+    return p1, p2, p3
 
-    triangles: List[Triangle] = [(p1, p2, p3)]
-
-    for p in points:
-        bad: List[Triangle] = []
-        for tri in triangles:
-            if point_in_circumcircle(p, tri):
-                bad.append(tri)
-
-        # Arêtes du "trou"
-        edges: List[Tuple[Point, Point]] = []
-        for (a, b, c) in bad:
-            tri_edges = [(a, b), (b, c), (c, a)]
-            for e in tri_edges:
-                e_sorted = tuple(sorted(e))
-                if e_sorted in edges:
-                    edges.remove(e_sorted)
-                else:
-                    edges.append(e_sorted)
 
-        for t in bad:
-            triangles.remove(t)
+def bowyer_watson(points: Union[List[Point], np.ndarray]) -> List[Triangle]:
+    """
+    Algorithme de Bowyer-Watson pour construire la triangulation de Delaunay
+    à partir d'une liste de points.
+    Retourne une liste de triangles (triplets de points, sous forme de
+    CircumTriangle : leur cercle circonscrit est déjà calculé).
 
-        for (a, b) in edges:
-            triangles.append((a, b, p))
+    Les points sont insérés dans l'ordre BRIO (voir brio_order) ; chaque
+    insertion ne touche que la cavité du point, d'où un coût quasi linéaire.
+
+    points peut aussi être un tableau numpy (n, 2), par exemple la vue
+    numpy.memmap d'un fichier binaire (voir io_utils.load_points_array).
+    """
+    if isinstance(points, np.ndarray):
+        points = [(x, y) for x, y in points.tolist()]
+    if len(points) < 3:
+        return []
 
-    # Retirer les triangles qui utilisent le super-triangle
-    final: List[Triangle] = []
-    super_pts = {p1, p2, p3}
-    for tri in triangles:
-        if any(v in super_pts for v in tri):
-            continue
-        final.append(tri)
+    dt = DelaunayTriangulation(super_triangle(points))
+    for i in brio_order(points):
+        dt.insert(points[i])
 
-    return final
+    return dt.triangles()
@@ -1,44 +1,84 @@
 import math
 from typing import Tuple
 
+from voronoi_core.predicates import incircle, orient2d
+
 Point = Tuple[float, float]
 Triangle = Tuple[Point, Point, Point]
 
 
-def circumcircle(tri: Triangle) -> Tuple[Point, float]:
+def circumcircle_squared(tri: Triangle) -> Tuple[Point, float]:
     """
     Calcule le cercle circonscrit d'un triangle.
-    Retourne (centre, rayon).
+    Retourne (centre, rayon au carré).
+    Les calculs sont faits relativement au premier sommet (moins d'opérations
+    et meilleure précision loin de l'origine).
     """
     (x1, y1), (x2, y2), (x3, y3) = tri
+    bx, by = x2 - x1, y2 - y1
+    cx, cy = x3 - x1, y3 - y1
 
-    d = 2 * (
-            x1 * (y2 - y3)
-            + x2 * (y3 - y1)
-            + x3 * (y1 - y2)
-    )
+    d = 2 * (bx * cy - by * cx)
 
     if abs(d) < 1e-12:
-        cx = (x1 + x2 + x3) / 3
-        cy = (y1 + y2 + y3) / 3
-        r = 1e12
-        return (cx, cy), r
+        return ((x1 + x2 + x3) / 3, (y1 + y2 + y3) / 3), 1e24
+
+    b2 = bx * bx + by * by
+    c2 = cx * cx + cy * cy
+    ux = (cy * b2 - by * c2) / d
+    uy = (bx * c2 - cx * b2) / d
+
+    return (x1 + ux, y1 + uy), ux * ux + uy * uy
+
+
+def circumcircle(tri: Triangle) -> Tuple[Point, float]:
+    """
+    Calcule le cercle circonscrit d'un triangle.
+    Retourne (centre, rayon).
+    """
+    center, r2 = circumcircle_squared(tri)
+    return center, math.sqrt(r2)
+
+
+class CircumTriangle(tuple):
+    """
+    Triangle (a, b, c) dont le cercle circonscrit est calculé une seule fois,
+    à la création : center (centre) et r2 (rayon au carré), ainsi que son
+    orientation (signe exact de orient2d).
+    S'utilise partout où un Triangle (triplet de points) est attendu.
+    """
+
+    def __new__(cls, a: Point, b: Point, c: Point) -> "CircumTriangle":
+        self = tuple.__new__(cls, (a, b, c))
+        self.center, self.r2 = circumcircle_squared((a, b, c))
+        self.orientation = orient2d(a[0], a[1], b[0], b[1], c[0], c[1])
+        return self
+
+    def __getnewargs__(self) -> Triangle:
+        return tuple(self)
 
-    ux = (
-                 (x1**2 + y1**2) * (y2 - y3)
-                 + (x2**2 + y2**2) * (y3 - y1)
-                 + (x3**2 + y3**2) * (y1 - y2)
-         ) / d
+    def contains(self, p: Point) -> bool:
+        """
+        Indique si p est strictement à l'intérieur du cercle circonscrit.
+        Test exact (voronoi_core.predicates.incircle) : un point sur le cercle,
+        par exemple le quatrième coin d'une maille de grille, n'est pas dedans.
+        Un triangle plat n'a pas de cercle (rayon infini) : il contient tout.
+        """
+        orientation = self.orientation
+        if orientation == 0:
+            return True
+        a, b, c = self
+        det = incircle(a[0], a[1], b[0], b[1], c[0], c[1], p[0], p[1])
+        return det > 0 if orientation > 0 else det < 0
 
-    uy = (
-                 (x1**2 + y1**2) * (x3 - x2)
-                 + (x2**2 + y2**2) * (x1 - x3)
-                 + (x3**2 + y3**2) * (x2 - x1)
-         ) / d
 
-    cx, cy = ux, uy
-    r = math.hypot(cx - x1, cy - y1)
-    return (cx, cy), r
+def as_circum_triangle(tri: Triangle) -> CircumTriangle:
+    """
+    Retourne tri lui-même s'il porte déjà son cercle, sinon un CircumTriangle.
+    """
+    if isinstance(tri, CircumTriangle):
+        return tri
+    return CircumTriangle(*tri)
 
 
 def point_in_circumcircle(p: Point, tri: Triangle) -> bool:
@@ -46,6 +86,4 @@ def point_in_circumcircle(p: Point, tri: Triangle) -> bool:
     Indique si un point p est strictement à l'intérieur du cercle circonscrit
     au triangle tri.
     """
-    (cx, cy), r = circumcircle(tri)
-    x, y = p
-    return (x - cx) ** 2 + (y - cy) ** 2 < r**2 - 1e-12
+    return as_circum_triangle(tri).contains(p)
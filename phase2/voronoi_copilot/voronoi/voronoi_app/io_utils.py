@@ -1,29 +1,35 @@
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
+
+import numpy as np
+from voronoi_core.points_io import iter_point_blocks, load_points
 
 Point = Tuple[float, float]
 
-def load_points_from_file(filename: str) -> List[Point]:
+def load_points_array(filename: str) -> np.ndarray:
     """
-    Charge une liste de points depuis un fichier texte.
-    Format accepté : x,y ou x y
-    Une ligne = un point.
+    Charge les points d'un fichier texte dans un tableau (n, 2) float64.
+    Format accepté : x,y ou x y (ou x;y), une ligne = un point,
+    tout ce qui suit un # est un commentaire.
+    Le fichier est lu par gros blocs (voir voronoi_core.points_io).
+    Lève ValueError sur une ligne invalide.
+    Un fichier au format binaire (voir voronoi_core.points_bin) est ouvert
+    avec numpy.memmap, sans copie : le tableau rendu est une vue sur le disque.
     """
-    points: List[Point] = []
-
-    with open(filename, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+    return load_points(filename, strict=True)
 
-            # Autoriser x,y ou x y
-            line = line.replace(",", " ")
-            parts = line.split()
 
-            if len(parts) != 2:
-                raise ValueError(f"Ligne invalide : '{line}' (format attendu : x,y ou x y)")
+def iter_points_blocks(filename: str, block_size: int = 1_000_000) -> Iterator[np.ndarray]:
+    """
+    Même lecture que load_points_array, par blocs (block_size, 2) :
+    pour les fichiers plus gros que la mémoire.
+    """
+    return iter_point_blocks(filename, block_size=block_size, strict=True)
 
-            x, y = map(float, parts)
-            points.append((x, y))
 
-    return points
+def load_points_from_file(filename: str) -> List[Point]:
+    """
+    Charge une liste de points depuis un fichier texte.
+    Format accepté : x,y ou x y
+    Une ligne = un point.
+    """
+    return [(x, y) for x, y in load_points_array(filename).tolist()]
@@ -0,0 +1,164 @@
+"""
+Localisation par lots : quel site possède la cellule de Voronoï contenant
+chaque point requête (c'est-à-dire quel est son site le plus proche).
+
+Les sites sont triangulés une fois (DelaunayTriangulation, insertion BRIO).
+Pour une requête q, on part d'un site v et on avance vers un voisin de
+Delaunay strictement plus proche de q tant qu'il y en a un : dans une
+triangulation de Delaunay, un site sans voisin plus proche est le plus proche
+de tous (si q n'est pas dans la cellule de v, le segment v→q en sort par une
+arête partagée avec un voisin plus proche de q). Les comparaisons de
+distances sont exactes (voronoi_core.predicates.closer).
+
+Point de départ (jump-and-walk) : le site trouvé pour la requête précédente,
+ou, s'il est plus loin, le plus proche d'un échantillon d'un site sur
+JUMP_STRIDE (kd-tree, une requête groupée pour tout le lot). Les requêtes
+sont traitées dans l'ordre d'une courbe de Hilbert : deux requêtes
+successives sont voisines et la marche ne fait en général qu'un pas ou deux.
+
+Près de l'enveloppe convexe, le super-triangle peut masquer quelques arêtes
+de Delaunay entre sites du bord : une marche qui s'arrête sur un site du bord
+est vérifiée par le kd-tree de tous les sites.
+"""
+
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from voronoi_core.kdtree import KDTree
+from voronoi_core.predicates import closer
+
+from .delaunay import HILBERT_ORDER, DelaunayTriangulation, brio_order, super_triangle
+
+Point = Tuple[float, float]
+
+JUMP_STRIDE = 16
+_TIE = 1e-15                       # au-dessus de l'erreur d'arrondi relative de |q - v|² - |q - w|²
+
+
+class CellLocator:
+    """
+    Sites fixes, requêtes par lots : locate(queries) retourne, pour chaque
+    requête, l'indice (dans points) du site le plus proche. Entre deux sites
+    confondus, l'un des deux est retourné.
+    """
+
+    def __init__(self, points: Union[Sequence[Point], np.ndarray]) -> None:
+        sites = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+        if len(sites) == 0:
+            raise ValueError("Aucun site à localiser")
+        self.points = sites
+        point_list = [(x, y) for x, y in sites.tolist()]
+
+        dt = DelaunayTriangulation(super_triangle(point_list))
+        site_of: List[int] = [-1, -1, -1]          # sommet de dt → indice du site
+        for i in brio_order(point_list):
+            if dt.insert(point_list[i]) != -1:
+                site_of.append(i)
+
+        # Graphe de Delaunay des sites (sans le super-triangle), figé en listes
+        count = len(site_of) - 3
+        self._xs = [x for x, _ in dt.vertices[3:]]
+        self._ys = [y for _, y in dt.vertices[3:]]
+        self._neighbors: List[List[int]] = [[] for _ in range(count)]
+        self._on_hull = [count < 3] * count
+        for v in range(3, len(site_of)):
+            for w in dt.neighbors(v):
+                if w < 3:
+                    self._on_hull[v - 3] = True
+                else:
+                    self._neighbors[v - 3].append(w - 3)
+        self._site_of = np.array(site_of[3:], dtype=np.intp)
+
+        sample = np.arange(0, count, JUMP_STRIDE)
+        self._sample = sample
+        self._sample_tree = KDTree(np.column_stack([np.take(self._xs, sample), np.take(self._ys, sample)]))
+        self._tree: Optional[KDTree] = None
+
+    def locate(self, queries: Union[Sequence[Point], np.ndarray], presorted: bool = False) -> np.ndarray:
+        """
+        Indices (np.intp) des sites les plus proches des requêtes (m, 2).
+        presorted : requêtes déjà dans un ordre cohérent (voisines d'une
+        requête à la suivante), traitées telles quelles sans tri de Hilbert.
+        """
+        queries = np.ascontiguousarray(queries, dtype=np.float64).reshape(-1, 2)
+        if len(queries) == 0:
+            return np.zeros(0, dtype=np.intp)
+        order = np.arange(len(queries)) if presorted else hilbert_order(queries)
+        ordered = queries[order]
+        _, jumps = self._sample_tree.query(ordered, k=1)
+        jumps = self._sample[np.asarray(jumps).reshape(-1)].tolist()
+
+        xs, ys, neighbors, on_hull = self._xs, self._ys, self._neighbors, self._on_hull
+        found = np.empty(len(queries), dtype=np.intp)
+        hull_queries: List[int] = []
+        v = jumps[0]
+        for position, ((qx, qy), jump) in enumerate(zip(ordered.tolist(), jumps)):
+            dv = (qx - xs[v]) ** 2 + (qy - ys[v]) ** 2
+            dj = (qx - xs[jump]) ** 2 + (qy - ys[jump]) ** 2
+            if dj < dv:
+                v, dv = jump, dj
+            moved = True
+            while moved:
+                moved = False
+                for w in neighbors[v]:
+                    dw = (qx - xs[w]) ** 2 + (qy - ys[w]) ** 2
+                    # Écart sous l'erreur d'arrondi : le prédicat exact tranche
+                    if dw < dv and (dv - dw > _TIE * (dv + dw) or closer(qx, qy, xs[w], ys[w], xs[v], ys[v]) > 0):
+                        v, dv = w, dw
+                        moved = True
+                        break
+            found[position] = v
+            if on_hull[v]:
+                hull_queries.append(position)
+
+        if hull_queries:
+            self._check_hull(ordered, found, hull_queries)
+        result = np.empty(len(queries), dtype=np.intp)
+        result[order] = self._site_of[found]
+        return result
+
+    def _check_hull(self, queries: np.ndarray, found: np.ndarray, positions: List[int]) -> None:
+        """Requêtes arrêtées sur un site du bord : gardées si le kd-tree ne trouve pas plus proche."""
+        if self._tree is None:
+            self._tree = KDTree(np.column_stack([self._xs, self._ys]))
+        _, nearest = self._tree.query(queries[positions], k=1)
+        xs, ys = self._xs, self._ys
+        for position, w in zip(positions, np.asarray(nearest).reshape(-1).tolist()):
+            qx, qy = queries[position]
+            v = found[position]
+            if closer(qx, qy, xs[w], ys[w], xs[v], ys[v]) > 0:
+                found[position] = w
+
+
+def locate(points: Union[Sequence[Point], np.ndarray], queries: Union[Sequence[Point], np.ndarray]) -> np.ndarray:
+    """Indices des sites (points) les plus proches de chaque requête (voir CellLocator)."""
+    return CellLocator(points).locate(queries)
+
+
+def hilbert_order(points: np.ndarray, order: int = HILBERT_ORDER) -> np.ndarray:
+    """Permutation triant les points (n, 2) le long d'une courbe de Hilbert."""
+    low = points.min(axis=0)
+    span = float((points.max(axis=0) - low).max()) or 1.0
+    cells = ((points - low) * (((1 << order) - 1) / span)).astype(np.int64)
+    return np.argsort(hilbert_keys(cells[:, 0], cells[:, 1], order), kind="stable")
+
+
+def hilbert_keys(x: np.ndarray, y: np.ndarray, order: int = HILBERT_ORDER) -> np.ndarray:
+    """
+    Version numpy de delaunay._hilbert_index : positions des cellules
+    entières (x, y) sur la courbe de Hilbert d'une grille 2^order × 2^order.
+    """
+    n = 1 << order
+    x, y = np.array(x, dtype=np.int64), np.array(y, dtype=np.int64)
+    d = np.zeros(len(x), dtype=np.int64)
+    s = n >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+        flip = rx & ~ry
+        x = np.where(flip, n - 1 - x, x)
+        y = np.where(flip, n - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s >>= 1
+    return d
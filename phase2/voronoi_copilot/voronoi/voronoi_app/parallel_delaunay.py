@@ -0,0 +1,215 @@
+"""
+Triangulation de Delaunay parallèle par bandes verticales.
+
+Les points, triés par x, sont découpés en bandes de tailles égales, chacune
+triangulée (Bowyer-Watson) dans un processus séparé. Dans chaque bande, un
+triangle est définitif si son cercle circonscrit tient strictement dans la
+bande : aucun point d'une autre bande ne peut y tomber, il appartient donc à
+la triangulation de Delaunay de l'ensemble des points. Des triangles
+cocirculaires (mailles d'une grille) partagent le même cercle : tous les
+points de ce cercle sont dans la bande, qui en donne une triangulation
+complète, gardée telle quelle.
+
+Les sommets des autres triangles (le long des coutures entre bandes et sur
+l'enveloppe) forment l'ensemble de couture, triangulé à son tour. Parmi ses
+triangles, seuls ceux dont le cercle ne contient strictement aucun point
+hors couture, et qui ne recouvrent pas un groupe cocirculaire définitif, sont
+gardés : ils comblent exactement la place laissée par les triangles
+définitifs.
+
+Le résultat est la même liste de triangles (CircumTriangle) que
+bowyer_watson, à l'ordre près (et au choix des diagonales près pour des
+points cocirculaires) : build_voronoi et build_voronoi_cells s'en servent
+tels quels. Seule la triangulation de couture est séquentielle ; sa taille
+croît comme le nombre de bandes fois la racine du nombre de points.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from voronoi_core.kdtree import KDTree
+from voronoi_core.predicates import incircle
+
+from .delaunay import DelaunayTriangulation, bowyer_watson, brio_order, super_triangle
+from .geometry import CircumTriangle
+
+Point = Tuple[float, float]
+
+MIN_STRIP_POINTS = 2000            # en dessous, une bande coûte plus qu'elle ne rapporte
+_CIRCLE_MARGIN = 1e-9              # marge relative du test « cercle dans la bande »
+
+
+def parallel_delaunay(
+        points: Union[Sequence[Point], np.ndarray],
+        max_workers: Optional[int] = None,
+        strip_count: Optional[int] = None,
+) -> List[CircumTriangle]:
+    """
+    Triangulation de Delaunay des points, calculée par bandes sur
+    max_workers processus (par défaut, un par cœur). strip_count : nombre de
+    bandes (par défaut, une par processus). Avec une seule bande, c'est
+    bowyer_watson.
+    """
+    array = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    workers = max_workers or os.cpu_count() or 1
+    strips = max(1, min(strip_count or workers, len(array) // MIN_STRIP_POINTS))
+    if strips == 1:
+        return bowyer_watson(array)
+    ordered = array[np.lexsort((array[:, 1], array[:, 0]))]
+    triangles = parallel_delaunay_indices(ordered, workers, strips, presorted=True)
+    vertices = [(x, y) for x, y in ordered.tolist()]
+    return [CircumTriangle(vertices[a], vertices[b], vertices[c]) for a, b, c in triangles.tolist()]
+
+
+def parallel_delaunay_indices(
+        points: np.ndarray,
+        max_workers: Optional[int] = None,
+        strip_count: Optional[int] = None,
+        presorted: bool = False,
+) -> np.ndarray:
+    """
+    Comme parallel_delaunay, sous forme d'un tableau (m, 3) d'indices dans
+    points (sens trigonométrique). Les points en double n'apparaissent que
+    par l'un d'eux.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    n = len(points)
+    if n < 3:
+        return np.zeros((0, 3), dtype=np.int64)
+    order = np.arange(n) if presorted else np.lexsort((points[:, 1], points[:, 0]))
+    ordered = points[order]
+    workers = max_workers or os.cpu_count() or 1
+    strips = max(1, min(strip_count or workers, n))
+    limits = np.linspace(0, n, strips + 1).astype(int)
+    tasks = []
+    for start, end in zip(limits[:-1], limits[1:]):
+        low = ordered[start - 1, 0] if start > 0 else -math.inf
+        high = ordered[end, 0] if end < n else math.inf
+        tasks.append((ordered[start:end], low, high))
+
+    if workers == 1:
+        results = list(map(_triangulate_strip, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, strips)) as executor:
+            results = list(executor.map(_triangulate_strip, tasks))
+
+    final = np.concatenate([local + start for (local, _, _), start in zip(results, limits[:-1])])
+    seam = np.concatenate([mask for _, mask, _ in results])
+    groups_of = {}                             # point de couture → groupes cocirculaires définitifs
+    for (_, _, groups), start in zip(results, limits[:-1]):
+        for group in groups:
+            members = frozenset((group + start).tolist())
+            for v in members:
+                if seam[v]:
+                    groups_of.setdefault(v, []).append(members)
+    # Un triangle définitif dont les trois sommets sont de couture peut aussi
+    # sortir de la triangulation de couture, tel quel ou, s'il est cocirculaire,
+    # avec une autre diagonale : ces triangles-là ne sont pas repris
+    known = {tuple(sorted(tri)) for tri in final[seam[final].all(axis=1)].tolist()}
+    stitched = [tri for tri in _seam_triangles(ordered, seam).tolist()
+                if tuple(sorted(tri)) not in known
+                and not any(tri[1] in g and tri[2] in g for g in groups_of.get(tri[0], ()))]
+    triangles = np.concatenate([final, np.array(stitched, dtype=np.int64).reshape(-1, 3)])
+    return order[triangles]
+
+
+def _triangulate_strip(task) -> Tuple[np.ndarray, np.ndarray, List[np.ndarray]]:
+    """
+    Triangule une bande ; retourne (triangles définitifs (f, 3) en indices
+    locaux, masque des points de couture, groupes cocirculaires définitifs :
+    indices des points de chaque cercle partagé par plusieurs triangles
+    définitifs).
+    """
+    strip, low, high = task
+    point_list = [(x, y) for x, y in strip.tolist()]
+    seam = np.zeros(len(point_list), dtype=bool)
+    if len(point_list) < 3:
+        seam[:] = True
+        return np.zeros((0, 3), dtype=np.int64), seam, []
+
+    dt = DelaunayTriangulation(super_triangle(point_list))
+    local = [-1, -1, -1]                       # sommet de dt → indice dans la bande
+    for i in brio_order(point_list):
+        if dt.insert(point_list[i]) != -1:
+            local.append(i)
+
+    vertices, tv, tn = dt.vertices, dt.tri_vertices, dt.tri_neighbors
+    final = []
+    group_of = {}                              # triangle cocirculaire → représentant de son groupe
+    for t, verts in enumerate(tv):
+        if not dt.alive[t]:
+            continue
+        if _circle_inside(dt.tri_circles[t], low, high) and min(verts) >= 3:
+            final.append(t)
+            # Voisins cocirculaires : même cercle, donc eux aussi dans la bande ;
+            # le polygone de tous les points du cercle est triangulé ici
+            for n in _cocircular_neighbors(t, verts, vertices, tv, tn):
+                _union(group_of, t, n)
+        else:
+            for v in verts:
+                if v >= 3:
+                    seam[local[v]] = True
+
+    groups = {}
+    for t in group_of:
+        groups.setdefault(_find(group_of, t), set()).update(local[v] for v in tv[t])
+    triangles = np.array([[local[v] for v in tv[t]] for t in final], dtype=np.int64).reshape(-1, 3)
+    return triangles, seam, [np.array(sorted(group), dtype=np.int64) for group in groups.values()]
+
+
+def _circle_inside(circle, low, high) -> bool:
+    """Cercle strictement entre les abscisses low et high (avec une marge d'arrondi)."""
+    cx = circle.center[0]
+    r = math.sqrt(circle.r2)
+    margin = _CIRCLE_MARGIN * (abs(cx) + r)
+    return cx - r - margin > low and cx + r + margin < high
+
+
+def _cocircular_neighbors(t, verts, vertices, tv, tn):
+    (ax, ay), (bx, by), (cx, cy) = (vertices[v] for v in verts)
+    for n in tn[t]:
+        if n == -1:
+            continue
+        opposite = vertices[next(v for v in tv[n] if v not in verts)]
+        if incircle(ax, ay, bx, by, cx, cy, opposite[0], opposite[1]) == 0:
+            yield n
+
+
+def _find(parent, t):
+    while parent.setdefault(t, t) != t:
+        parent[t] = parent[parent[t]]
+        t = parent[t]
+    return t
+
+
+def _union(parent, a, b):
+    parent[_find(parent, a)] = _find(parent, b)
+
+
+def _seam_triangles(points: np.ndarray, seam: np.ndarray) -> np.ndarray:
+    """
+    Triangles de la triangulation des points de couture dont le cercle ne
+    contient strictement aucun autre point (indices dans points).
+    """
+    seam_index = np.flatnonzero(seam)
+    seam_points = [(x, y) for x, y in points[seam_index].tolist()]
+    triangles = bowyer_watson(seam_points)
+    if not triangles:
+        return np.zeros((0, 3), dtype=np.int64)
+    others = np.flatnonzero(~seam)
+    index_of = {p: i for i, p in zip(seam_index.tolist(), seam_points)}
+    kept = []
+    if len(others):
+        tree = KDTree(points[others])
+        centers = np.array([tri.center for tri in triangles])
+        radii = np.sqrt([tri.r2 for tri in triangles]) * (1 + _CIRCLE_MARGIN)
+        candidates = tree.query_radius(centers, radii)
+    else:
+        candidates = [()] * len(triangles)
+    for tri, near in zip(triangles, candidates):
+        if not any(tri.contains(tuple(points[others[j]])) for j in near):
+            kept.append([index_of[p] for p in tri])
+    return np.array(kept, dtype=np.int64).reshape(-1, 3)
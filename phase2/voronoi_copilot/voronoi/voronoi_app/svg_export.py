@@ -1,88 +1,208 @@
-from typing import List, Tuple
+"""
+Export SVG en flux.
 
-import drawsvg as draw
+Le fichier est écrit au fil de l'eau, sans construire d'arbre d'éléments :
+un seul <path> par couche (arêtes, cellules, points), dont les données sont
+produites par blocs de CHUNK éléments et écrites aussitôt dans un fichier
+tamponné. La mémoire utilisée ne dépend pas de la taille du diagramme.
+Les cellules données par un itérable à usage unique (générateur...) sont
+parcourues une seule fois : leurs données passent par un fichier temporaire
+le temps de calculer le cadrage, écrit en tête du SVG.
+
+Les coordonnées sont arrondies à precision décimales. Un nom de fichier en
+.svgz (ou compress=True) donne un fichier compressé gzip.
+"""
+
+import gzip
+import itertools
+import tempfile
+from typing import Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+import numpy as np
 
 Point = Tuple[float, float]
 Polygon = List[Point]
 
+DEFAULT_PRECISION = 3
+CHUNK = 1 << 13
+POINT_RADIUS = 0.07
+STROKE_WIDTH = 0.03
+_BUFFER_BYTES = 1 << 20
+
 
 def export_voronoi_graph_svg(
-        points: List[Point],
-        centers: List[Point],
-        edges: List[Tuple[Point, Point]],
+        points: Sequence[Point],
+        centers: Sequence[Point],
+        edges: Sequence[Tuple[Point, Point]],
         filename: str = "voronoi_graph.svg",
+        precision: int = DEFAULT_PRECISION,
+        compress: Optional[bool] = None,
+) -> None:
+    """
+    Exporte le graphe de Voronoï (arêtes + points) en SVG.
+    points, centers : listes de points ou tableaux (n, 2) ;
+    edges : liste de paires de points ou tableau (m, 4) / (m, 2, 2).
+    Le cadrage englobe les points et les centres.
+    """
+    bounds = _bounds([_blocks(points, 2), _blocks(centers, 2)])
+    with _open(filename, compress) as f:
+        _write_header(f, bounds, precision)
+        _write_path(f, (_segment_data(block, precision) for block in _blocks(edges, 4)),
+                    fill="none", stroke="green", stroke_width=STROKE_WIDTH)
+        _write_points(f, points, precision)
+        f.write("</svg>\n")
+
+
+def export_voronoi_cells_svg(
+        points: Sequence[Point],
+        cells: Iterable[Polygon],
+        filename: str = "voronoi_cells.svg",
+        precision: int = DEFAULT_PRECISION,
+        compress: Optional[bool] = None,
 ) -> None:
     """
-    Exporte le graphe de Voronoï (centres + arêtes) en SVG.
+    Exporte les cellules de Voronoï (polygones fermés) et les points en SVG.
+    Les cellules de moins de 3 sommets sont ignorées. Le cadrage englobe les
+    points et les sommets des cellules.
+    cells : séquence (lue deux fois) ou tout itérable (lu une fois).
     """
-    xs = [p[0] for p in points] + [c[0] for c in centers]
-    ys = [p[1] for p in points] + [c[1] for c in centers]
+    if isinstance(cells, Sequence):
+        bounds = _bounds([_blocks(points, 2), (vertices for _, vertices in _cell_blocks(cells))])
+        data = (_polygon_data(group, vertices, precision) for group, vertices in _cell_blocks(cells))
+        _write_cells(filename, compress, precision, bounds, points, data)
+        return
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
+        bounds = _bounds([_blocks(points, 2), _spool_cells(cells, precision, spool)])
+        spool.seek(0)
+        _write_cells(filename, compress, precision, bounds, points, iter(lambda: spool.read(_BUFFER_BYTES), ""))
+
+
+def _write_cells(filename: str, compress: Optional[bool], precision: int, bounds: Tuple[float, float, float, float],
+                 points: Sequence[Point], data: Iterable[str]) -> None:
+    with _open(filename, compress) as f:
+        _write_header(f, bounds, precision)
+        _write_path(f, data, fill="none", stroke="green", stroke_width=STROKE_WIDTH)
+        _write_points(f, points, precision)
+        f.write("</svg>\n")
+
+
+# ── Écriture ────────────────────────────────────────────────────────────────
+
+def _open(filename: str, compress: Optional[bool]) -> TextIO:
+    if compress is None:
+        compress = filename.endswith(".svgz")
+    if compress:
+        return gzip.open(filename, "wt", encoding="utf-8")
+    return open(filename, "w", encoding="utf-8", buffering=_BUFFER_BYTES)
+
+
+def _write_header(f: TextIO, bounds: Tuple[float, float, float, float], precision: int) -> None:
+    xmin, ymin, xmax, ymax = bounds
+    xmin, ymin = xmin - 1, ymin - 1
+    width, height = (xmax + 1) - xmin, (ymax + 1) - ymin
+    box = " ".join(_format(v, precision) for v in (xmin, ymin, width, height))
+    f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{_format(width, precision)}" '
+            f'height="{_format(height, precision)}" viewBox="{box}">\n')
+
+
+def _write_path(f: TextIO, data: Iterable[str], fill: str, stroke: str = "none", stroke_width: float = 0) -> None:
+    """Un <path> dont l'attribut d est écrit bloc par bloc ; rien si data est vide."""
+    started = False
+    for chunk in data:
+        if not chunk:
+            continue
+        if not started:
+            f.write('<path d="')
+            started = True
+        f.write(chunk)
+    if started:
+        style = f'fill="{fill}"'
+        if stroke != "none":
+            style += f' stroke="{stroke}" stroke-width="{stroke_width}"'
+        f.write(f'" {style}/>\n')
 
-    xmin, xmax = min(xs) - 1, max(xs) + 1
-    ymin, ymax = min(ys) - 1, max(ys) + 1
-    width = xmax - xmin
-    height = ymax - ymin
 
-    d = draw.Drawing(width, height, origin=(xmin, ymin), display_inline=False)
+def _write_points(f: TextIO, points: Sequence[Point], precision: int) -> None:
+    _write_path(f, (_circle_data(block, POINT_RADIUS, precision) for block in _blocks(points, 2)), fill="blue")
 
-    # Arêtes du Voronoï
-    for a, b in edges:
-        d.append(
-            draw.Line(
-                a[0],
-                a[1],
-                b[0],
-                b[1],
-                stroke="green",
-                stroke_width=0.03,
-            )
-        )
 
-    # Points
-    for x, y in points:
-        d.append(draw.Circle(x, y, 0.07, fill="blue"))
+# ── Données de chemin ───────────────────────────────────────────────────────
 
-    d.save_svg(filename)
+def _blocks(items, width: int) -> Iterator[np.ndarray]:
+    """Blocs (k, width) float64 de CHUNK lignes au plus, sans copier un tableau numpy."""
+    if isinstance(items, np.ndarray):
+        flat = items.reshape(-1, width)
+        for i in range(0, len(flat), CHUNK):
+            yield np.asarray(flat[i:i + CHUNK], dtype=np.float64)
+        return
+    for i in range(0, len(items), CHUNK):
+        yield np.asarray(items[i:i + CHUNK], dtype=np.float64).reshape(-1, width)
 
 
-def export_voronoi_cells_svg(
-        points: List[Point],
-        cells: List[Polygon],
-        filename: str = "voronoi_cells.svg",
-) -> None:
+def _cell_blocks(cells: Iterable[Polygon]) -> Iterator[Tuple[List[Polygon], np.ndarray]]:
     """
-    Exporte les cellules de Voronoï (polygones) en SVG.
+    (cellules, leurs sommets mis bout à bout (k, 2)) par groupes de CHUNK
+    cellules d'au moins 3 sommets, en une passe sur cells.
     """
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    for poly in cells:
-        for (x, y) in poly:
-            xs.append(x)
-            ys.append(y)
-
-    xmin, xmax = min(xs) - 1, max(xs) + 1
-    ymin, ymax = min(ys) - 1, max(ys) + 1
-    width = xmax - xmin
-    height = ymax - ymin
-
-    d = draw.Drawing(width, height, origin=(xmin, ymin), display_inline=False)
-
-    # Cellules
-    for poly in cells:
-        if len(poly) < 3:
-            continue
-        d.append(
-            draw.Lines(
-                *[coord for xy in poly for coord in xy],
-                close=True,
-                fill="none",
-                stroke="green",
-                stroke_width=0.03,
-            )
-        )
-
-    # Points
-    for x, y in points:
-        d.append(draw.Circle(x, y, 0.07, fill="blue"))
-
-    d.save_svg(filename)
+    kept = (cell for cell in cells if len(cell) >= 3)
+    while True:
+        group = list(itertools.islice(kept, CHUNK))
+        if not group:
+            return
+        yield group, np.concatenate([np.asarray(cell, dtype=np.float64).reshape(-1, 2) for cell in group])
+
+
+def _spool_cells(cells: Iterable[Polygon], precision: int, spool: TextIO) -> Iterator[np.ndarray]:
+    """Écrit les données de chemin des cellules dans spool ; rend leurs sommets pour le cadrage."""
+    for group, vertices in _cell_blocks(cells):
+        spool.write(_polygon_data(group, vertices, precision))
+        yield vertices
+
+
+def _bounds(block_iterators: Iterable[Iterator[np.ndarray]]) -> Tuple[float, float, float, float]:
+    """(xmin, ymin, xmax, ymax) de tous les blocs (k, 2), en une passe."""
+    low, high = np.full(2, np.inf), np.full(2, -np.inf)
+    for blocks in block_iterators:
+        for block in blocks:
+            if len(block):
+                low = np.minimum(low, block.min(axis=0))
+                high = np.maximum(high, block.max(axis=0))
+    if not np.isfinite(low).all():
+        return 0.0, 0.0, 0.0, 0.0
+    return float(low[0]), float(low[1]), float(high[0]), float(high[1])
+
+
+def _format(value: float, precision: int) -> str:
+    text = repr(round(float(value), precision))
+    return text[:-2] if text.endswith(".0") else text
+
+
+def _quantized(block: np.ndarray, precision: int) -> List[str]:
+    """Coordonnées arrondies, en texte (forme la plus courte, sans « .0 » final)."""
+    return [t[:-2] if t.endswith(".0") else t for t in map(repr, np.round(block, precision).ravel().tolist())]
+
+
+def _segment_data(block: np.ndarray, precision: int) -> str:
+    c = iter(_quantized(block, precision))
+    return "".join(f"M{x1} {y1}L{x2} {y2}" for x1, y1, x2, y2 in zip(c, c, c, c))
+
+
+def _polygon_data(cells: List[Polygon], vertices: np.ndarray, precision: int) -> str:
+    c = iter(_quantized(vertices, precision))
+    parts = []
+    for size in map(len, cells):
+        first = f"{next(c)} {next(c)}"
+        rest = "L".join(f"{next(c)} {next(c)}" for _ in range(size - 1))
+        parts.append(f"M{first}L{rest}Z")
+    return "".join(parts)
+
+
+def _circle_data(block: np.ndarray, radius: float, precision: int) -> str:
+    # Deux demi-cercles par point, depuis son extrémité gauche
+    r = _format(radius, precision)
+    d = _format(2 * radius, precision)
+    left = block.copy()
+    left[:, 0] -= radius
+    c = iter(_quantized(left, precision))
+    return "".join(f"M{x} {y}a{r} {r} 0 1 0 {d} 0a{r} {r} 0 1 0 -{d} 0" for x, y in zip(c, c))
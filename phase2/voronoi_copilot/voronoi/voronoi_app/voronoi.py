@@ -1,30 +1,46 @@
 import math
 from typing import Dict, List, Tuple
 
-from voronoi_app.geometry import circumcircle
+import numpy as np
+
+from .geometry import as_circum_triangle
 
 Point = Tuple[float, float]
 Triangle = Tuple[Point, Point, Point]
 Polygon = List[Point]
 
 
-def build_voronoi(triangles: List[Triangle]) -> Tuple[List[Point], List[Tuple[Point, Point]]]:
+def build_voronoi(triangles: List[Triangle], return_indices: bool = False):
     """
     Construit les centres des cercles circonscrits et les arêtes du diagramme
     de Voronoï (graphe dual de Delaunay).
 
     triangles : liste de triangles, chaque triangle = ((x1,y1),(x2,y2),(x3,y3))
-    Retourne : (centers, edges)
-    """
-    centers: List[Point] = [circumcircle(tri)[0] for tri in triangles]
-
-    edges: List[Tuple[Point, Point]] = []
-    n = len(triangles)
-    for i in range(n):
-        for j in range(i + 1, n):
-            if len(set(triangles[i]) & set(triangles[j])) == 2:
-                edges.append((centers[i], centers[j]))
+    return_indices : si True, retourne aussi pairs, tableau numpy (m, 2) d'entiers
+        tel que edges[k] relie centers[pairs[k, 0]] et centers[pairs[k, 1]].
+    Retourne : (centers, edges) ou (centers, edges, pairs)
 
+    Les côtés partagés sont trouvés avec une table côté → triangle remplie en
+    une seule passe : O(T) au lieu de comparer toutes les paires de triangles.
+    """
+    centers: List[Point] = [as_circum_triangle(tri).center for tri in triangles]
+
+    owner: Dict[Tuple[Point, Point], int] = {}
+    pairs: List[Tuple[int, int]] = []
+    for j, (a, b, c) in enumerate(triangles):
+        for e in ((a, b), (b, c), (c, a)):
+            key = e if e[0] <= e[1] else (e[1], e[0])
+            # Un côté est partagé par au plus deux triangles
+            i = owner.pop(key, -1)
+            if i == -1:
+                owner[key] = j
+            else:
+                pairs.append((i, j))
+
+    edges: List[Tuple[Point, Point]] = [(centers[i], centers[j]) for i, j in pairs]
+
+    if return_indices:
+        return centers, edges, np.array(pairs, dtype=np.int64).reshape(-1, 2)
     return centers, edges
 
 
@@ -33,10 +49,7 @@ def build_voronoi_cells(points: List[Point], triangles: List[Triangle]) -> List[
     Construit les cellules de Voronoï pour chaque point.
     Retourne une liste de polygones (liste de points).
     """
-    centers: List[Point] = []
-    for tri in triangles:
-        center, _ = circumcircle(tri)
-        centers.append(center)
+    centers: List[Point] = [as_circum_triangle(tri).center for tri in triangles]
 
     point_to_centers: Dict[Point, List[Point]] = {p: [] for p in points}
 
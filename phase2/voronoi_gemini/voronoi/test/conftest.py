@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Code partagé entre les versions du projet (dossier commun/ à la racine du dépôt)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "commun"))
@@ -1,5 +1,9 @@
+import random
+
 import pytest
+from voronoi.voronoi_app.data_io import DataProvider
 from voronoi.voronoi_app.geometry import GeometryUtils, VoronoiClipper
+from voronoi.voronoi_app.parallel_clipper import ParallelVoronoiClipper
 
 def test_squared_distance_calculation():
     point_origin = (0, 0)
@@ -18,4 +22,102 @@ def test_clipping_of_boundary_cell():
     
     # On vérifie que tous les points résultants sont bien dans la zone du left_point (x <= 5)
     for vertex_x, vertex_y in clipped_cell:
-        assert vertex_x <= 5.000001
\ No newline at end of file
+        assert vertex_x <= 5.000001
+
+def _normalized_cell(polygon):
+    return sorted(set((round(vertex_x, 6), round(vertex_y, 6)) for vertex_x, vertex_y in polygon))
+
+
+def test_pruned_cells_match_full_clipping():
+    random_generator = random.Random(3)
+    list_of_points = [(random_generator.uniform(0, 30), random_generator.uniform(0, 30)) for _ in range(150)]
+    list_of_points += [(float(x), float(y)) for x in range(0, 30, 6) for y in range(0, 30, 6)]
+    clipper = VoronoiClipper(bounding_box=(-200, -200, 200, 200))
+
+    full_cells = clipper.compute_cells(list_of_points, use_spatial_index=False)
+    pruned_cells = clipper.compute_cells(list_of_points)
+
+    for full_cell, pruned_cell in zip(full_cells, pruned_cells):
+        assert _normalized_cell(full_cell) == _normalized_cell(pruned_cell)
+
+
+def test_cells_from_binary_memmap_match_list(tmp_path):
+    from voronoi_core.points_bin import write_points_binary
+
+    random_generator = random.Random(4)
+    list_of_points = [(random_generator.uniform(0, 30), random_generator.uniform(0, 30)) for _ in range(60)]
+    binary_file = tmp_path / "points.vpts"
+    write_points_binary(binary_file, list_of_points)
+    points_array = DataProvider.load_points_array(binary_file)
+    clipper = VoronoiClipper(bounding_box=(-200, -200, 200, 200))
+
+    assert points_array.tolist() == [list(point) for point in list_of_points]
+    assert clipper.compute_cells(points_array) == clipper.compute_cells(list_of_points)
+
+
+def test_clipping_keeps_vertex_after_edge_on_bisector():
+    # Le segment (0, 0) -> (-1e-12, 10) longe la médiatrice de (-1, 5) et (1, 5) :
+    # pas d'intersection calculable, mais son extrémité intérieure doit rester
+    clipper = VoronoiClipper()
+    cell_polygon = [(0, 0), (-1e-12, 10), (-5, 10), (-5, 0)]
+
+    clipped_cell = clipper.clip_cell_by_neighbor(cell_polygon, (-1, 5), (1, 5))
+
+    assert (-1e-12, 10) in clipped_cell
+
+
+def test_grid_cells_have_no_duplicated_vertices():
+    # Sommets de cellule exactement sur les médiatrices : ni dédoublés, ni perdus
+    list_of_points = [(x * 2.0, y * 2.0) for x in range(8) for y in range(8)]
+    cells = VoronoiClipper(bounding_box=(-1, -1, 15, 15)).compute_cells(list_of_points)
+
+    for cell in cells:
+        assert len(cell) == 4
+        assert len(_normalized_cell(cell)) == 4
+
+
+def test_parallel_cells_match_sequential_in_input_order():
+    random_generator = random.Random(5)
+    list_of_points = [(random_generator.uniform(0, 30), random_generator.uniform(0, 30)) for _ in range(120)]
+    bounding_box = (-200, -200, 200, 200)
+
+    parallel_clipper = ParallelVoronoiClipper(bounding_box=bounding_box, max_workers=2)
+    parallel_cells = parallel_clipper.compute_cells(list_of_points)
+
+    assert parallel_cells == VoronoiClipper(bounding_box=bounding_box).compute_cells(list_of_points)
+    assert len(parallel_clipper.split_into_shards(len(list_of_points))) == 8
+
+
+def test_cell_cache_round_trip_without_recomputing(tmp_path):
+    from voronoi.voronoi_app.data_io import CellCache
+    from voronoi_core.diagram_cache import DiagramCache
+
+    random_generator = random.Random(6)
+    list_of_points = [(random_generator.uniform(0, 30), random_generator.uniform(0, 30)) for _ in range(40)]
+    bounding_box = (-200, -200, 200, 200)
+    diagram_cache = DiagramCache(tmp_path)
+    computed_cells = VoronoiClipper(bounding_box=bounding_box).compute_cells(list_of_points)
+
+    first_cells = CellCache.load_or_compute(list_of_points, bounding_box, lambda: computed_cells, diagram_cache)
+    cached_cells = CellCache.load_or_compute(list_of_points, bounding_box, lambda: pytest.fail("recalcul"),
+                                             diagram_cache)
+
+    assert first_cells == cached_cells == [[tuple(vertex) for vertex in cell] for cell in computed_cells]
+
+def test_visualizer_draws_all_cells_as_one_collection(monkeypatch):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from voronoi.voronoi_app.visualizer import VoronoiVisualizer
+
+    monkeypatch.setattr(plt, "savefig", lambda *args, **kwargs: None)
+    monkeypatch.setattr(plt, "show", lambda: None)
+    random_generator = random.Random(7)
+    list_of_points = [(random_generator.uniform(0, 30), random_generator.uniform(0, 30)) for _ in range(50)]
+    cells = VoronoiClipper(bounding_box=(-200, -200, 200, 200)).compute_cells(list_of_points)
+
+    VoronoiVisualizer.plot(list_of_points, cells)
+    axes = plt.gca()
+    assert len(axes.collections) == 2 and len(axes.lines) == 0    # côtés + points
+    assert len(axes.collections[0].get_segments()) == sum(len(cell) for cell in cells)
+    plt.close("all")
@@ -1,13 +1,59 @@
+import numpy as np
+
+from voronoi_core.diagram_cache import DiagramCache, cache_key
+from voronoi_core.points_io import load_points as load_points_array
+
 class DataProvider:
     @staticmethod
     def load_points(filename):
-        pts = []
+        """Lit les points par gros blocs (x,y / x y / x;y, # commentaires), lignes invalides ignorées."""
         try:
-            with open(filename, 'r') as f:
-                for line in f:
-                    parts = line.replace(',', ' ').split()
-                    if len(parts) >= 2:
-                        pts.append((float(parts[0]), float(parts[1])))
-        except (FileNotFoundError, ValueError) as e:
+            return [tuple(point) for point in load_points_array(filename, strict=False).tolist()]
+        except FileNotFoundError as e:
             print(f"Erreur lors de la lecture : {e}")
-        return pts
\ No newline at end of file
+            return []
+
+    @staticmethod
+    def load_points_array(filename):
+        """
+        Points du fichier en tableau numpy (n, 2), sans passer par des tuples.
+        Un fichier binaire (voronoi_core.points_bin) est ouvert avec
+        numpy.memmap, sans copie ; un fichier texte est lu comme load_points.
+        """
+        try:
+            return load_points_array(filename, strict=False)
+        except FileNotFoundError as e:
+            print(f"Erreur lors de la lecture : {e}")
+            return np.zeros((0, 2))
+
+
+class CellCache:
+    """
+    Cellules de Voronoï gardées dans le cache disque partagé
+    (voronoi_core.diagram_cache), la clé étant l'empreinte des points et de la
+    boîte de calcul : relancer sur un fichier inchangé relit les cellules.
+    Les polygones, de tailles variables, sont stockés à plat : tous les sommets
+    à la suite, plus le rang du premier sommet de chaque cellule.
+    """
+    @staticmethod
+    def pack_cells(voronoi_cells_collection):
+        cell_sizes = [len(cell_polygon) for cell_polygon in voronoi_cells_collection]
+        cell_offsets = np.zeros(len(cell_sizes) + 1, dtype=np.int64)
+        np.cumsum(cell_sizes, out=cell_offsets[1:])
+        cell_vertices = np.array([vertex for cell_polygon in voronoi_cells_collection for vertex in cell_polygon],
+                                 dtype=np.float64).reshape(-1, 2)
+        return {"cell_vertices": cell_vertices, "cell_offsets": cell_offsets}
+
+    @staticmethod
+    def unpack_cells(cell_arrays):
+        all_vertices = [tuple(vertex) for vertex in cell_arrays["cell_vertices"].tolist()]
+        cell_offsets = cell_arrays["cell_offsets"].tolist()
+        return [all_vertices[start:end] for start, end in zip(cell_offsets[:-1], cell_offsets[1:])]
+
+    @staticmethod
+    def load_or_compute(list_of_points, bounding_box, compute_cells, diagram_cache=None):
+        """Cellules en cache pour ces points, sinon compute_cells() puis mise en cache."""
+        diagram_cache = diagram_cache or DiagramCache()
+        cell_key = cache_key(list_of_points, "voronoi_clipper", bounding_box=tuple(bounding_box))
+        cell_arrays = diagram_cache.get_or_compute(cell_key, lambda: CellCache.pack_cells(compute_cells()))
+        return CellCache.unpack_cells(cell_arrays)
@@ -1,3 +1,9 @@
+import math
+
+from voronoi_core.kdtree import KDTree
+from voronoi_core.predicates import closer
+
+
 class GeometryUtils:
     @staticmethod
     def calculate_squared_distance(point_a, point_b):
@@ -24,12 +30,14 @@ class GeometryUtils:
         
         denominator = normal_x * segment_vector_x + normal_y * segment_vector_y
         
-        if abs(denominator) < 1e-10: 
+        if denominator == 0:
             return None
         
-        # Calcul du paramètre t pour trouver le point d'intersection précis
+        # Calcul du paramètre t pour trouver le point d'intersection précis,
+        # ramené dans le segment (les arrondis peuvent l'en faire sortir)
         t_parameter = (normal_x * (midpoint_x - segment_start[0]) + 
                        normal_y * (midpoint_y - segment_start[1])) / denominator
+        t_parameter = min(max(t_parameter, 0.0), 1.0)
         
         intersection_x = segment_start[0] + t_parameter * segment_vector_x
         intersection_y = segment_start[1] + t_parameter * segment_vector_y
@@ -45,29 +53,168 @@ class VoronoiClipper:
         return [(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y)]
 
     def clip_cell_by_neighbor(self, current_polygon, target_point, neighbor_point):
-        """Applique le clipping de Sutherland-Hodgman sur un polygone."""
+        """
+        Applique le clipping de Sutherland-Hodgman sur un polygone.
+
+        Le côté de chaque sommet est donné par le prédicat exact
+        voronoi_core.predicates.closer : > 0 plus proche du point cible, < 0
+        plus proche du voisin, 0 exactement sur la médiatrice. Un sommet sur
+        la médiatrice est gardé tel quel et un côté n'est coupé que s'il la
+        traverse strictement : pas de sommet dédoublé sur les grilles dont
+        les milieux sont exacts en flottants (pas entier par exemple), où les
+        sommets tombent exactement sur les médiatrices.
+        """
+        target_x, target_y = target_point
+        neighbor_x, neighbor_y = neighbor_point
+        sides = [closer(vertex[0], vertex[1], target_x, target_y, neighbor_x, neighbor_y)
+                 for vertex in current_polygon]
+
+        # Médiatrice hors de la cellule : rien à découper, pas de nouvelle liste
+        if all(side >= 0 for side in sides):
+            return current_polygon
+        if not any(side > 0 for side in sides):
+            return []
+
         new_clipped_polygon = []
         
         for i in range(len(current_polygon)):
             vertex_start = current_polygon[i]
             vertex_end = current_polygon[(i + 1) % len(current_polygon)]
-            
-            # Un point est "dedans" s'il est plus proche du point cible que du voisin
-            is_start_inside = (GeometryUtils.calculate_squared_distance(vertex_start, target_point) < 
-                               GeometryUtils.calculate_squared_distance(vertex_start, neighbor_point))
-            is_end_inside = (GeometryUtils.calculate_squared_distance(vertex_end, target_point) < 
-                             GeometryUtils.calculate_squared_distance(vertex_end, neighbor_point))
-
-            if is_start_inside and is_end_inside:
-                new_clipped_polygon.append(vertex_end)
-            elif is_start_inside and not is_end_inside:
-                intersection = GeometryUtils.find_bisector_intersection(vertex_start, vertex_end, target_point, neighbor_point)
-                if intersection: 
-                    new_clipped_polygon.append(intersection)
-            elif not is_start_inside and is_end_inside:
+            side_start = sides[i]
+            side_end = sides[(i + 1) % len(current_polygon)]
+
+            if (side_start > 0 and side_end < 0) or (side_start < 0 and side_end > 0):
                 intersection = GeometryUtils.find_bisector_intersection(vertex_start, vertex_end, target_point, neighbor_point)
                 if intersection: 
                     new_clipped_polygon.append(intersection)
-                    new_clipped_polygon.append(vertex_end)
+            if side_end >= 0:
+                new_clipped_polygon.append(vertex_end)
                     
-        return new_clipped_polygon
\ No newline at end of file
+        return new_clipped_polygon
+
+    @staticmethod
+    def max_vertex_radius(polygon, center_point):
+        """Distance entre le point et le sommet le plus éloigné de sa cellule."""
+        if not polygon:
+            return 0.0
+        return math.sqrt(max(GeometryUtils.calculate_squared_distance(vertex, center_point)
+                             for vertex in polygon))
+
+    def compute_cells(self, list_of_points, use_spatial_index=True, initial_neighbors=16,
+                      site_indices=None, spatial_index=None):
+        """
+        Calcule la cellule de chaque point (ou des seuls points site_indices,
+        dans cet ordre).
+
+        Sans index, chaque cellule est découpée par tous les autres points (O(n²)).
+        Avec l'index (kd-tree, construit si spatial_index n'est pas fourni), les
+        initial_neighbors plus proches voisins sont visités par distance
+        croissante et on s'arrête dès que le suivant est à plus de deux fois le
+        rayon de la cellule (sommet le plus éloigné) : sa médiatrice passe
+        au-delà de la cellule, comme celles des suivants.
+        Si ces voisins ne suffisent pas (cellules qui touchent la boîte), seuls
+        les points situés dans le disque d'un sommet passant par le point cible
+        peuvent encore couper la cellule : on les cherche dans l'index.
+
+        list_of_points peut être une liste de tuples ou un tableau numpy (n, 2),
+        par exemple la vue numpy.memmap de DataProvider.load_points_array :
+        l'index est alors construit directement sur le tableau.
+        """
+        if hasattr(list_of_points, "tolist"):
+            if use_spatial_index and spatial_index is None and len(list_of_points):
+                spatial_index = KDTree(list_of_points)
+            list_of_points = [tuple(point) for point in list_of_points.tolist()]
+        point_count = len(list_of_points)
+        if site_indices is None:
+            site_indices = range(point_count)
+        site_indices = list(site_indices)
+
+        if not use_spatial_index:
+            voronoi_cells_collection = []
+            for current_index in site_indices:
+                target_point = list_of_points[current_index]
+                cell_polygon = self.generate_initial_bounding_cell()
+                for neighbor_index, neighbor_point in enumerate(list_of_points):
+                    if current_index != neighbor_index:
+                        cell_polygon = self.clip_cell_by_neighbor(cell_polygon, target_point, neighbor_point)
+                voronoi_cells_collection.append(cell_polygon)
+            return voronoi_cells_collection
+
+        if not site_indices:
+            return []
+        if spatial_index is None:
+            spatial_index = KDTree(list_of_points)
+        all_distances, all_neighbors = spatial_index.query([list_of_points[index] for index in site_indices],
+                                                           k=min(initial_neighbors, point_count))
+        all_distances = all_distances.reshape(len(site_indices), -1)
+        all_neighbors = all_neighbors.reshape(len(site_indices), -1)
+
+        voronoi_cells_collection = []
+        visited_by_cell = {}
+        for cell_position, current_index in enumerate(site_indices):
+            target_point = list_of_points[current_index]
+            cell_polygon = self.generate_initial_bounding_cell()
+            cell_radius = self.max_vertex_radius(cell_polygon, target_point)
+            visited_neighbors = {current_index}
+            is_cell_final = len(all_neighbors[cell_position]) == point_count
+
+            for neighbor_distance, neighbor_index in zip(all_distances[cell_position], all_neighbors[cell_position]):
+                if neighbor_distance > 2 * cell_radius:
+                    is_cell_final = True
+                    break
+                if neighbor_index in visited_neighbors:
+                    continue
+                visited_neighbors.add(neighbor_index)
+                clipped_polygon = self.clip_cell_by_neighbor(cell_polygon, target_point, list_of_points[neighbor_index])
+                if clipped_polygon is not cell_polygon:
+                    cell_polygon = clipped_polygon
+                    cell_radius = self.max_vertex_radius(cell_polygon, target_point)
+
+            if not is_cell_final and cell_polygon:
+                visited_by_cell[cell_position] = visited_neighbors
+            voronoi_cells_collection.append(cell_polygon)
+
+        # Cellules pas encore sûres : une requête groupée par tour pour toutes
+        while visited_by_cell:
+            pending_cells = list(visited_by_cell)
+            candidates_by_cell = self.find_sites_near_vertices(
+                spatial_index, [voronoi_cells_collection[position] for position in pending_cells],
+                [list_of_points[site_indices[position]] for position in pending_cells])
+
+            for cell_position, candidates in zip(pending_cells, candidates_by_cell):
+                visited_neighbors = visited_by_cell[cell_position]
+                candidates -= visited_neighbors
+                if not candidates:
+                    del visited_by_cell[cell_position]
+                    continue
+                # Les plus proches d'abord, puis on recalcule les candidats de la cellule réduite
+                target_point = list_of_points[site_indices[cell_position]]
+                nearest_candidates = sorted(candidates, key=lambda index: (GeometryUtils.calculate_squared_distance(list_of_points[index], target_point), index))
+                cell_polygon = voronoi_cells_collection[cell_position]
+                for neighbor_index in nearest_candidates[:initial_neighbors]:
+                    visited_neighbors.add(neighbor_index)
+                    cell_polygon = self.clip_cell_by_neighbor(cell_polygon, target_point, list_of_points[neighbor_index])
+                voronoi_cells_collection[cell_position] = cell_polygon
+                if not cell_polygon:
+                    del visited_by_cell[cell_position]
+
+        return voronoi_cells_collection
+
+    @staticmethod
+    def find_sites_near_vertices(spatial_index, polygons, target_points):
+        """
+        Pour chaque cellule, indices des points situés dans le disque de centre un
+        de ses sommets et passant par son point cible : les seuls qui peuvent
+        encore retirer un sommet de la cellule. Une seule requête pour tout le lot.
+        """
+        all_vertices, vertex_radii, vertex_owners = [], [], []
+        for cell_number, (polygon, target_point) in enumerate(zip(polygons, target_points)):
+            for vertex in polygon:
+                all_vertices.append(vertex)
+                vertex_radii.append(math.sqrt(GeometryUtils.calculate_squared_distance(vertex, target_point)) * (1 + 1e-9))
+                vertex_owners.append(cell_number)
+
+        sites_near_vertices = [set() for _ in polygons]
+        for cell_number, site_indices in zip(vertex_owners, spatial_index.query_radius(all_vertices, vertex_radii)):
+            sites_near_vertices[cell_number].update(site_indices.tolist())
+        return sites_near_vertices
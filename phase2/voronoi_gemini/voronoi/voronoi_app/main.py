@@ -1,28 +1,33 @@
+import os
+import sys
+
+# Code partagé entre les versions du projet (dossier commun/ à la racine du dépôt)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "commun"))
+
 from geometry import VoronoiClipper
-from data_io import DataProvider
+from parallel_clipper import ParallelVoronoiClipper
+from data_io import CellCache, DataProvider
 from visualizer import VoronoiVisualizer
 
+# Au-delà, le démarrage des processus est largement rentabilisé
+PARALLEL_POINT_THRESHOLD = 5000
+
 def main():
-    list_of_points = DataProvider.load_points("../data/voronoi.txt")
-    if not list_of_points:
+    # Tableau numpy (vue memmap sans copie si le fichier est au format binaire)
+    list_of_points = DataProvider.load_points_array("../data/voronoi.txt")
+    if len(list_of_points) == 0:
         return
 
     # On utilise une boîte de calcul large pour simuler l'infini
-    clipper = VoronoiClipper(bounding_box=(-200, -200, 200, 200))
-    voronoi_cells_collection = []
-    
-    for current_index, target_point in enumerate(list_of_points):
-        # On commence avec une cellule géante
-        cell_polygon = clipper.generate_initial_bounding_cell()
-        
-        for neighbor_index, neighbor_point in enumerate(list_of_points):
-            if current_index == neighbor_index:
-                continue
-            
-            # On découpe la cellule actuelle par rapport à chaque voisin
-            cell_polygon = clipper.clip_cell_by_neighbor(cell_polygon, target_point, neighbor_point)
-            
-        voronoi_cells_collection.append(cell_polygon)
+    bounding_box = (-200, -200, 200, 200)
+    # Voisins visités par distance croissante, arrêt dès qu'ils ne coupent plus la cellule
+    if len(list_of_points) >= PARALLEL_POINT_THRESHOLD:
+        clipper = ParallelVoronoiClipper(bounding_box=bounding_box)
+    else:
+        clipper = VoronoiClipper(bounding_box=bounding_box)
+    # Fichier inchangé depuis le dernier lancement : cellules relues sur le disque
+    voronoi_cells_collection = CellCache.load_or_compute(list_of_points, bounding_box,
+                                                         lambda: clipper.compute_cells(list_of_points))
 
     # Rendu final avec le cadrage 30x30 demandé
     VoronoiVisualizer.plot(list_of_points, voronoi_cells_collection, x_max=30, y_max=30)
@@ -0,0 +1,78 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+try:
+    from .geometry import KDTree, VoronoiClipper
+except ImportError:
+    from geometry import KDTree, VoronoiClipper
+
+# État de chaque processus de calcul, rempli une seule fois par _initialize_worker
+_worker_state = {}
+
+
+def _initialize_worker(shared_memory_name, point_count, bounding_box, initial_neighbors):
+    """Lit une fois les points en mémoire partagée et prépare l'index du processus."""
+    points_memory = shared_memory.SharedMemory(name=shared_memory_name)
+    try:
+        points_array = np.ndarray((point_count, 2), dtype=np.float64, buffer=points_memory.buf).copy()
+    finally:
+        points_memory.close()
+    _worker_state["points"] = [tuple(point) for point in points_array.tolist()]
+    _worker_state["spatial_index"] = KDTree(points_array)
+    _worker_state["clipper"] = VoronoiClipper(bounding_box=bounding_box)
+    _worker_state["initial_neighbors"] = initial_neighbors
+
+
+def _compute_shard(shard_bounds):
+    """Cellules des points d'indices shard_bounds[0] à shard_bounds[1] (exclu)."""
+    shard_start, shard_end = shard_bounds
+    return _worker_state["clipper"].compute_cells(
+        _worker_state["points"], initial_neighbors=_worker_state["initial_neighbors"],
+        site_indices=range(shard_start, shard_end), spatial_index=_worker_state["spatial_index"])
+
+
+class ParallelVoronoiClipper:
+    """
+    Calcule les cellules de VoronoiClipper sur plusieurs processus.
+
+    Les points sont copiés une seule fois dans un bloc de mémoire partagée que
+    chaque processus relit à son démarrage : les tâches ne transportent que des
+    bornes d'indices. Les cellules sont renvoyées dans l'ordre des points.
+    """
+
+    def __init__(self, bounding_box=(-100, -100, 100, 100), max_workers=None,
+                 shards_per_worker=4, initial_neighbors=16):
+        self.bounding_box = bounding_box
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shards_per_worker = shards_per_worker
+        self.initial_neighbors = initial_neighbors
+
+    def split_into_shards(self, point_count):
+        """Découpe [0, point_count) en tranches contiguës de tailles voisines."""
+        shard_count = max(1, min(point_count, self.max_workers * self.shards_per_worker))
+        shard_limits = np.linspace(0, point_count, shard_count + 1).astype(int)
+        return [(int(start), int(end)) for start, end in zip(shard_limits[:-1], shard_limits[1:]) if end > start]
+
+    def compute_cells(self, list_of_points):
+        """Cellule de chaque point, dans l'ordre de list_of_points."""
+        point_count = len(list_of_points)
+        if point_count == 0:
+            return []
+
+        points_memory = shared_memory.SharedMemory(create=True, size=point_count * 2 * 8)
+        try:
+            np.ndarray((point_count, 2), dtype=np.float64, buffer=points_memory.buf)[:] = list_of_points
+            with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_initialize_worker,
+                                     initargs=(points_memory.name, point_count, self.bounding_box,
+                                               self.initial_neighbors)) as executor:
+                voronoi_cells_collection = []
+                # map rend les résultats dans l'ordre des tranches, donc des points
+                for shard_cells in executor.map(_compute_shard, self.split_into_shards(point_count)):
+                    voronoi_cells_collection.extend(shard_cells)
+        finally:
+            points_memory.close()
+            points_memory.unlink()
+        return voronoi_cells_collection
@@ -1,18 +1,24 @@
 import matplotlib.pyplot as plt
+import numpy as np
+
+from voronoi_core.render import polygon_edges, segment_collection
 
 class VoronoiVisualizer:
     @staticmethod
-    def plot(points, cells, x_max=30, y_max=30):
+    def plot(points, cells, x_max=30, y_max=30, min_pixels=0.0):
+        """
+        Trace les cellules (tous les côtés dans une seule LineCollection) et les points.
+        Avec min_pixels > 0, les côtés de moins de min_pixels à l'écran ne sont pas tracés.
+        """
         plt.figure(figsize=(8, 8))
-        for cell in cells:
-            if cell:
-                draw_poly = cell + [cell[0]]
-                plt.plot([p[0] for p in draw_poly], [p[1] for p in draw_poly], 'k-', lw=1.5)
-        
-        plt.scatter([p[0] for p in points], [p[1] for p in points], c='blue', zorder=3)
         plt.xlim(0, x_max)
         plt.ylim(0, y_max)
         plt.gca().set_aspect('equal')
+        segment_collection(polygon_edges([cell for cell in cells if cell]), plt.gca(), min_pixels,
+                           colors='k', linewidths=1.5)
+
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        plt.scatter(points[:, 0], points[:, 1], c='blue', zorder=3)
         plt.grid(True, linestyle=':', alpha=0.6)
         plt.savefig("../img/voronoi.png", dpi=300)
 